@@ -0,0 +1,197 @@
+"""Admission control for the LLM-bound endpoints.
+
+Each protected route gets a RouteLimiter: at most max_concurrency requests are
+served at once, up to max_queue more wait (FIFO, for at most max_wait seconds)
+and everything beyond that is rejected straight away with 503 and a
+Retry-After estimated from recent service times. A streaming response keeps
+its slot until the stream ends. TokenBuckets add a per-key (e.g.
+per-interview) rate limit, rejected with 429. Shedding the newest
+arrivals keeps the latency of admitted requests bounded under overload instead
+of letting an unbounded queue slow down everyone.
+"""
+import asyncio
+import functools
+import inspect
+import math
+import time
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Callable, Dict, Optional
+
+from fastapi import HTTPException
+from starlette.background import BackgroundTask
+from starlette.responses import StreamingResponse
+
+from metrics import ADMISSION_QUEUE_DEPTH, ADMISSION_REJECTIONS, ADMISSION_WAIT
+
+class Rejected(Exception):
+    def __init__(self, status_code: int, reason: str, retry_after: float):
+        super().__init__(reason)
+        self.status_code = status_code
+        self.reason = reason
+        self.retry_after = retry_after
+
+class RouteLimiter:
+    def __init__(self, route: str, max_concurrency: int, max_queue: int, max_wait: float, enabled: bool = True):
+        self.route = route
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.max_wait = max_wait
+        self.enabled = enabled
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self.in_flight = 0
+        self.waiting = 0
+        # Exponentially weighted service time, for Retry-After
+        self.service_time = 1.0
+        self.stats = {"admitted": 0, "queued": 0, "queue_full": 0, "queue_timeout": 0}
+
+    def retry_after(self) -> int:
+        """Seconds until the current backlog should have drained"""
+        return max(1, math.ceil(self.service_time * (self.waiting + 1) / self.max_concurrency))
+
+    def _reject(self, reason: str):
+        self.stats[reason] += 1
+        ADMISSION_REJECTIONS.inc(self.route, reason)
+        raise Rejected(503, reason, self.retry_after())
+
+    async def acquire(self) -> Optional[float]:
+        """Take a slot (or raise Rejected); returns the start time to pass to release()"""
+        if not self.enabled:
+            return None
+        queued_at = time.perf_counter()
+        if self._semaphore.locked():
+            if self.waiting >= self.max_queue:
+                self._reject("queue_full")
+            self.waiting += 1
+            self.stats["queued"] += 1
+            ADMISSION_QUEUE_DEPTH.inc(self.route)
+            try:
+                await asyncio.wait_for(self._semaphore.acquire(), self.max_wait)
+            except asyncio.TimeoutError:
+                self._reject("queue_timeout")
+            finally:
+                self.waiting -= 1
+                ADMISSION_QUEUE_DEPTH.dec(self.route)
+        else:
+            await self._semaphore.acquire()
+        started = time.perf_counter()
+        ADMISSION_WAIT.observe(started - queued_at, self.route)
+        self.stats["admitted"] += 1
+        self.in_flight += 1
+        return started
+
+    def release(self, started: Optional[float]):
+        if started is None:
+            return
+        self.in_flight -= 1
+        self._semaphore.release()
+        self.service_time = 0.9 * self.service_time + 0.1 * (time.perf_counter() - started)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "enabled": self.enabled,
+            "in_flight": self.in_flight,
+            "waiting": self.waiting,
+            "max_concurrency": self.max_concurrency,
+            "max_queue": self.max_queue,
+            "service_time_ms": round(self.service_time * 1000, 1),
+        }
+
+class TokenBuckets:
+    """One token bucket per key: `burst` requests at once, refilled at `rate` per second"""
+
+    def __init__(self, route: str, rate: float, burst: int, max_keys: int = 10000, enabled: bool = True):
+        self.route = route
+        self.enabled = enabled
+        self.rate = rate
+        self.burst = burst
+        self.max_keys = max_keys
+        self._buckets: "OrderedDict[str, list]" = OrderedDict()
+        self.rejected = 0
+
+    def take(self, key: str):
+        """Spend one token for key; raises Rejected (429) when the bucket is empty"""
+        if not self.enabled:
+            return
+        now = time.monotonic()
+        bucket = self._buckets.pop(key, None)
+        if bucket is None:
+            bucket = [float(self.burst), now]
+        tokens = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+        # Most recently used last; idle keys are evicted first (a fresh bucket is full anyway)
+        self._buckets[key] = bucket
+        while len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+        bucket[1] = now
+        if tokens < 1:
+            bucket[0] = tokens
+            self.rejected += 1
+            ADMISSION_REJECTIONS.inc(self.route, "rate_limited")
+            raise Rejected(429, "rate_limited", (1 - tokens) / self.rate)
+        bucket[0] = tokens - 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {"enabled": self.enabled, "rate_per_s": self.rate, "burst": self.burst,
+                "keys": len(self._buckets), "rejected": self.rejected}
+
+async def _release_when_done(body: AsyncIterator, release: Callable[[], None]) -> AsyncIterator:
+    try:
+        async for chunk in body:
+            yield chunk
+    finally:
+        release()
+
+def _hold_until_streamed(response: StreamingResponse, release: Callable[[], None]):
+    """Keep the slot until the response body has been sent (or the client went away)"""
+    released = False
+
+    def release_once():
+        nonlocal released
+        if not released:
+            released = True
+            release()
+
+    async def after_response(previous=response.background):
+        release_once()
+        if previous is not None:
+            await previous()
+
+    response.body_iterator = _release_when_done(response.body_iterator, release_once)
+    # Also covers a response whose body is never iterated
+    response.background = BackgroundTask(after_response)
+
+def admit(limiter: Optional[RouteLimiter] = None, buckets: Optional[TokenBuckets] = None,
+          key: Optional[Callable[..., Any]] = None):
+    """Endpoint decorator: rate-limit by key(**kwargs), then run the handler in a limiter slot.
+
+    key may be a coroutine function, e.g. to check that the key names something real before a
+    bucket is created for it. A StreamingResponse holds its slot until the stream ends.
+    """
+    def decorator(handler):
+        @functools.wraps(handler)
+        async def wrapper(*args, **kwargs):
+            try:
+                if buckets is not None:
+                    bucket_key = key(**kwargs)
+                    if inspect.isawaitable(bucket_key):
+                        bucket_key = await bucket_key
+                    buckets.take(bucket_key)
+                if limiter is None:
+                    return await handler(*args, **kwargs)
+                started = await limiter.acquire()
+                try:
+                    response = await handler(*args, **kwargs)
+                except BaseException:
+                    limiter.release(started)
+                    raise
+                if isinstance(response, StreamingResponse):
+                    _hold_until_streamed(response, lambda: limiter.release(started))
+                else:
+                    limiter.release(started)
+                return response
+            except Rejected as e:
+                detail = "Too many requests" if e.status_code == 429 else "Server is busy, please retry"
+                raise HTTPException(status_code=e.status_code, detail=detail,
+                                    headers={"Retry-After": str(max(1, math.ceil(e.retry_after)))})
+        return wrapper
+    return decorator
@@ -0,0 +1,171 @@
+"""Local pre-scoring of interview answers.
+
+Scores answers that are confidently bad without an LLM call: answers that
+echo the question back, repetitive filler and short off-topic text. The
+answer, question and JD are embedded as TF-IDF vectors in one NumPy matrix;
+anything not clearly bad is returned as None and goes to the LLM as before.
+"""
+import re
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#]*")
+
+def _stem(token: str) -> str:
+    for suffix in ("ing", "ed", "es", "s"):
+        if token.endswith(suffix) and len(token) - len(suffix) >= 3:
+            return token[:-len(suffix)]
+    return token
+
+STOPWORDS = frozenset("""
+a about above after again all also am an and any are as at be because been before being below between both
+but by can could did do does doing down during each few for from further had has have having he her here
+hers him his how i if in into is it its itself just let me more most my no nor not now of off on once only
+or other our ours out over own same she should so some such than that the their theirs them then there
+these they this those through to too under until up very was we were what when where which while who whom
+why will with would you your yours
+""".split())
+
+# Vocabulary that marks an answer as technical even when it shares no words with the question or JD
+TECHNICAL_TERMS = """
+algorithm api array async asynchronous atomic authentication authorization backend balancer batch benchmark
+binary bit bucket buffer byte cache callback cap class client cloud cluster collision commit compile
+complexity compute concurrency connection consensus consistency constant container context cookie coroutine
+counter cpu crud cursor data database deadlock debug dependency deploy deployment dictionary disk distributed
+dns docker document encryption endpoint event exception function garbage gateway graph handshake hash heap
+http https immutable index inheritance instance integer interface isolation iterator json kernel key kubernetes
+lambda latency library linked list load lock log logarithmic loop memory message method microservice
+middleware migration module mutex network node object orm packet pagination parallel parse partition
+performance pipeline pointer pool process profiler protocol proxy query queue quota race recursion redis
+refactor reference regex replica replication request resolution response rest retry router runtime scalability
+scale schema script sdk server service session shard socket sort sql stack stateless storage stream string
+sync synchronous table tcp test thread throughput timeout tls token transaction tree tuple type udp unit url
+variable version virtual write
+"""
+TECHNICAL_STEMS = frozenset(_stem(term) for term in TECHNICAL_TERMS.split())
+# Lexicon words that are just as common in everyday questions ("urgent requests", "a test of patience");
+# on their own they do not make a question technical
+EVERYDAY_TERMS = """
+batch buffer context counter data event key load lock log method process request response scale service
+session stack table test token type unit version write
+"""
+TECHNICAL_QUESTION_STEMS = TECHNICAL_STEMS - frozenset(_stem(term) for term in EVERYDAY_TERMS.split())
+# Vocabulary of an answer that engages with the question without technical terms: weighing options or
+# deferring to others ("it depends on the trade-offs", "I would ask my lead"). Such an answer is vague,
+# not off topic, and is left to the LLM
+ENGAGEMENT_TERMS = """
+advice alternative approach ask best choice choose colleague consider decide decision depend factor lead
+manager option pros cons requirement situation solution tradeoff trade
+"""
+ENGAGEMENT_STEMS = frozenset(_stem(term) for term in ENGAGEMENT_TERMS.split())
+
+# An answer is an echo when this share of its terms comes from the question, it is not much longer and
+# this share of its consecutive term pairs appears in the question too: the question's words in the
+# question's order. A short answer that reuses the question's vocabulary to answer it is not an echo
+ECHO_CONTAINMENT = 0.8
+ECHO_LENGTH_RATIO = 1.5
+ECHO_SEQUENCE_CONTAINMENT = 0.5
+# Repetitive filler: few distinct terms across a non-trivial answer
+REPETITION_MIN_TERMS = 8
+REPETITION_UNIQUE_RATIO = 0.3
+# Off topic: no technical terms, no engagement terms and no vocabulary shared with the question or the
+# JD. Only applied to technical questions; open or behavioural questions are answered in everyday words
+OFF_TOPIC_MIN_TERMS = 6
+OFF_TOPIC_MAX_TERMS = 60
+OFF_TOPIC_SIMILARITY = 0.02
+
+VERDICTS = {
+    "echo": {
+        "score": 5.0,
+        "feedback": "The answer repeats the question instead of answering it.",
+        "strengths": "N/A",
+        "weaknesses": "No original answer provided"
+    },
+    "repetitive": {
+        "score": 10.0,
+        "feedback": "The answer mostly repeats the same few words. Explain your reasoning in full sentences.",
+        "strengths": "Attempted an answer",
+        "weaknesses": "Repetitive, little substance"
+    },
+    "off_topic": {
+        "score": 10.0,
+        "feedback": "The answer does not address the question. Focus on what was asked.",
+        "strengths": "Attempted an answer",
+        "weaknesses": "Not relevant to the question"
+    },
+}
+
+def tokenize(text: str) -> List[str]:
+    """Lower-cased, stemmed content terms"""
+    return [_stem(token) for token in TOKEN_RE.findall((text or "").lower()) if token not in STOPWORDS]
+
+def tfidf_matrix(docs: Sequence[List[str]]) -> np.ndarray:
+    """L2-normalised TF-IDF rows, one per document"""
+    vocabulary: Dict[str, int] = {}
+    for doc in docs:
+        for term in doc:
+            vocabulary.setdefault(term, len(vocabulary))
+    counts = np.zeros((len(docs), max(len(vocabulary), 1)))
+    for row, doc in enumerate(docs):
+        if doc:
+            np.add.at(counts[row], [vocabulary[term] for term in doc], 1)
+    document_frequency = (counts > 0).sum(axis=0)
+    idf = np.log((1 + len(docs)) / (1 + document_frequency)) + 1
+    weights = np.log1p(counts) * idf
+    norms = np.linalg.norm(weights, axis=1, keepdims=True)
+    return np.divide(weights, norms, out=np.zeros_like(weights), where=norms > 0)
+
+def prescore_answers(questions: Sequence[str], answers: Sequence[str],
+                     jd_text: Optional[str] = None, off_topic_check: bool = True) -> List[Optional[Dict]]:
+    """Local evaluation for each answer that is confidently bad, None for the rest.
+
+    A local evaluation has the same keys as an LLM evaluation plus "reason". off_topic_check=False
+    leaves off-topic answers to the LLM, for open questions such as the generic fallback question.
+    """
+    count = len(answers)
+    answer_terms = [tokenize(answer) for answer in answers]
+    question_terms = [tokenize(question) for question in questions]
+    jd_terms = tokenize(jd_text or "")
+
+    matrix = tfidf_matrix(answer_terms + question_terms + [jd_terms])
+    answer_vectors, question_vectors, jd_vector = matrix[:count], matrix[count:2 * count], matrix[2 * count]
+    question_similarity = (answer_vectors * question_vectors).sum(axis=1)
+    jd_similarity = answer_vectors @ jd_vector if jd_terms else np.zeros(count)
+
+    lengths = np.array([len(terms) for terms in answer_terms])
+    question_lengths = np.array([len(terms) for terms in question_terms])
+    distinct = np.array([len(set(terms)) for terms in answer_terms])
+    technical = np.array([any(term in TECHNICAL_STEMS for term in terms) for terms in answer_terms], dtype=bool)
+    engaged = np.array([any(term in ENGAGEMENT_STEMS for term in terms) for terms in answer_terms], dtype=bool)
+    technical_question = np.array(
+        [off_topic_check and any(term in TECHNICAL_QUESTION_STEMS for term in terms) for terms in question_terms],
+        dtype=bool
+    )
+    from_question = np.array([
+        sum(term in question_set for term in terms) if terms else 0
+        for terms, question_set in zip(answer_terms, map(set, question_terms))
+    ])
+    pairs_from_question = np.array([
+        sum(pair in question_pairs for pair in zip(terms, terms[1:])) / (len(terms) - 1) if len(terms) > 1 else 0.0
+        for terms, question_pairs in zip(answer_terms, (set(zip(terms, terms[1:])) for terms in question_terms))
+    ])
+    safe_lengths = np.maximum(lengths, 1)
+
+    echo = (lengths > 0) & (from_question / safe_lengths >= ECHO_CONTAINMENT) \
+        & (lengths <= question_lengths * ECHO_LENGTH_RATIO + 2) & (pairs_from_question >= ECHO_SEQUENCE_CONTAINMENT)
+    repetitive = (lengths >= REPETITION_MIN_TERMS) & (distinct / safe_lengths < REPETITION_UNIQUE_RATIO)
+    off_topic = technical_question & (lengths >= OFF_TOPIC_MIN_TERMS) & (lengths <= OFF_TOPIC_MAX_TERMS) & ~technical & ~engaged \
+        & (question_similarity < OFF_TOPIC_SIMILARITY) & (jd_similarity < OFF_TOPIC_SIMILARITY)
+
+    verdicts: List[Optional[Dict]] = []
+    for index in range(count):
+        reason = "echo" if echo[index] else "repetitive" if repetitive[index] else \
+            "off_topic" if off_topic[index] else None
+        verdicts.append({**VERDICTS[reason], "reason": reason} if reason else None)
+    return verdicts
+
+def prescore_answer(question: str, answer: str, jd_text: Optional[str] = None,
+                    off_topic_check: bool = True) -> Optional[Dict]:
+    """Single-answer form of prescore_answers"""
+    return prescore_answers([question], [answer], jd_text, off_topic_check)[0]
@@ -0,0 +1,25 @@
+"""Fail if any route query falls back to a collection scan.
+
+Ensures the indexes declared in server.MONGO_INDEXES, then explains every
+shape in server.ROUTE_QUERY_SHAPES against the configured database.
+
+Usage (from backend/): python check_query_plans.py
+"""
+import asyncio
+import json
+import sys
+
+import server
+
+async def main() -> int:
+    await server.ensure_indexes()
+    offenders = await server.find_collscans()
+    for offender in offenders:
+        print(f"COLLSCAN: {json.dumps(offender, default=str)}")
+    if offenders:
+        return 1
+    print(f"OK: {len(server.ROUTE_QUERY_SHAPES)} query shapes use indexes")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,86 @@
+"""Per-request deadline budgets.
+
+An endpoint wrapped in with_budget(seconds) must answer within that many
+seconds. The deadline lives in a contextvar: the LLM gateway caps each call's
+timeout to what is left of it (minus DB_RESERVE for the writes that follow) and
+MongoDB commands get the remaining time through pymongo's client-side operation
+timeout. Work that has to outlive the request is started with spawn(), which
+runs outside the budget.
+"""
+import asyncio
+import contextvars
+import functools
+import os
+import time
+from contextlib import contextmanager
+from typing import Coroutine, Optional
+
+import pymongo
+
+_current_deadline: contextvars.ContextVar[Optional["Deadline"]] = contextvars.ContextVar("deadline", default=None)
+
+# Seconds an LLM call leaves over for the DB writes after it
+DB_RESERVE = float(os.environ.get('DEADLINE_DB_RESERVE', 0.5))
+
+class DeadlineExceeded(asyncio.TimeoutError):
+    """Raised when a call is cut short (or never started) because the request budget ran out"""
+
+class Deadline:
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+        self.expires_at = time.monotonic() + seconds
+        # Context from before the budget was opened, for tasks that must not inherit it
+        self.outer_context = contextvars.copy_context()
+
+    def remaining(self) -> float:
+        return self.expires_at - time.monotonic()
+
+def current_deadline() -> Optional[Deadline]:
+    return _current_deadline.get()
+
+def remaining(reserve: float = 0.0) -> Optional[float]:
+    """Seconds left in the current budget minus reserve, or None outside a budget"""
+    deadline = _current_deadline.get()
+    if deadline is None:
+        return None
+    return deadline.remaining() - reserve
+
+def bound(timeout: float, reserve: float = 0.0) -> float:
+    """timeout capped to the remaining budget; raises DeadlineExceeded when nothing is left"""
+    left = remaining(reserve)
+    if left is None:
+        return timeout
+    if left <= 0:
+        raise DeadlineExceeded("Request deadline exceeded")
+    return min(timeout, left)
+
+@contextmanager
+def budget(seconds: float):
+    """Run the enclosed block under a deadline of `seconds`; 0 disables it"""
+    if seconds <= 0:
+        yield None
+        return
+    deadline = Deadline(seconds)
+    token = _current_deadline.set(deadline)
+    try:
+        with pymongo.timeout(seconds):
+            yield deadline
+    finally:
+        _current_deadline.reset(token)
+
+def with_budget(seconds: float):
+    """Endpoint decorator: the whole handler runs under budget(seconds)"""
+    def decorator(handler):
+        @functools.wraps(handler)
+        async def wrapper(*args, **kwargs):
+            with budget(seconds):
+                return await handler(*args, **kwargs)
+        return wrapper
+    return decorator
+
+def spawn(coro: Coroutine) -> asyncio.Task:
+    """Start a task outside the current budget (and its MongoDB timeout)"""
+    deadline = _current_deadline.get()
+    if deadline is None:
+        return asyncio.create_task(coro)
+    return deadline.outer_context.copy().run(asyncio.create_task, coro)
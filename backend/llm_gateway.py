@@ -0,0 +1,404 @@
+"""Single entry point for every LLM call made by the backend.
+
+Bounds in-flight calls per model, applies per-call timeouts, trips a circuit
+breaker when the provider keeps failing and keeps latency/queue statistics.
+Calls made with hedge=True can be hedged: when LLM_HEDGE is on and the call
+outlives a percentile of recent latency, an identical backup request is sent
+and the first to finish wins.
+Inside a request deadline (deadlines.py) each call only gets what is left of
+the budget; a call cut short raises DeadlineExceeded without counting against
+the breaker.
+Callers keep their own fallback dicts: any error raised here (including an
+open circuit or an exhausted deadline) lands in their existing except branches.
+"""
+import asyncio
+import logging
+import os
+import time
+from collections import deque
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
+
+import httpx
+import litellm
+from emergentintegrations.llm.chat import LlmChat, UserMessage
+
+import deadlines
+import tracing
+from metrics import LLM_DURATION, LLM_ERRORS, LLM_IN_FLIGHT, LLM_HEDGES, LLM_HEDGE_PROMPT_CHARS
+
+DEFAULT_MODEL = ("openai", "gpt-5.2")
+LLM_PROXY_URL = os.environ.get('LLM_PROXY_URL', 'https://integrations.emergentagent.com/llm')
+LLM_MAX_CONCURRENCY = int(os.environ.get('LLM_MAX_CONCURRENCY', 32))
+LLM_TIMEOUT = float(os.environ.get('LLM_TIMEOUT', 60))
+LLM_BREAKER_THRESHOLD = int(os.environ.get('LLM_BREAKER_THRESHOLD', 5))
+LLM_BREAKER_COOLDOWN = float(os.environ.get('LLM_BREAKER_COOLDOWN', 30))
+
+# Hedging: fire a backup request once a call outlives this percentile of recent latency,
+# for at most LLM_HEDGE_MAX_RATE of recent calls per call site
+LLM_HEDGE_ENABLED = os.environ.get('LLM_HEDGE', 'false').lower() == 'true'
+LLM_HEDGE_PERCENTILE = float(os.environ.get('LLM_HEDGE_PERCENTILE', 0.95))
+LLM_HEDGE_MAX_RATE = float(os.environ.get('LLM_HEDGE_MAX_RATE', 0.1))
+LLM_HEDGE_MIN_SAMPLES = 20
+LLM_HEDGE_WINDOW = 200
+
+# Per call-site timeouts; interactive calls fail fast, the report can take longer
+CALL_SITE_TIMEOUTS = {
+    "parse": 45.0,
+    "question": 30.0,
+    "eval": 30.0,
+    "report": 60.0,
+    "assistant": 20.0,
+}
+
+class CircuitOpenError(Exception):
+    """Raised without calling the provider while the circuit breaker is open"""
+
+class CircuitBreaker:
+    """Opens after `threshold` consecutive failures; lets one probe through after `cooldown` seconds"""
+
+    def __init__(self, threshold: int = LLM_BREAKER_THRESHOLD, cooldown: float = LLM_BREAKER_COOLDOWN):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._probe_started: Optional[float] = None
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.cooldown:
+            return "half_open"
+        return "open"
+
+    def allow(self) -> bool:
+        state = self.state
+        if state == "closed":
+            return True
+        now = time.monotonic()
+        # A probe that never reported back (e.g. cancelled) stops blocking after another cooldown
+        if state == "half_open" and (self._probe_started is None or now - self._probe_started >= self.cooldown):
+            self._probe_started = now
+            return True
+        return False
+
+    def record_success(self):
+        self.failures = 0
+        self.opened_at = None
+        self._probe_started = None
+
+    def record_failure(self):
+        self.failures += 1
+        if self._probe_started is not None or self.failures >= self.threshold:
+            self.opened_at = time.monotonic()
+        self._probe_started = None
+
+class LlmGateway:
+    def __init__(self, max_concurrency: int = LLM_MAX_CONCURRENCY):
+        self._api_key: Optional[str] = None
+        self.max_concurrency = max_concurrency
+        self._semaphores: Dict[Tuple[str, str], asyncio.Semaphore] = {}
+        self._breakers: Dict[Tuple[str, str], CircuitBreaker] = {}
+        self._waiting: Dict[Tuple[str, str], int] = {}
+        self._in_flight: Dict[Tuple[str, str], int] = {}
+        self._latencies: Dict[str, deque] = {}
+        self._counters: Dict[str, Dict[str, int]] = {}
+        self.hedge_enabled = LLM_HEDGE_ENABLED
+        self._hedge_windows: Dict[str, deque] = {}
+        self._hedge_counters: Dict[str, Dict[str, int]] = {}
+        # One pooled HTTP client shared by every litellm call instead of a connection per request
+        self.http_client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=max_concurrency * 2, max_keepalive_connections=max_concurrency),
+            timeout=httpx.Timeout(LLM_TIMEOUT)
+        )
+        litellm.aclient_session = self.http_client
+
+    @property
+    def api_key(self) -> str:
+        # Read once, on first use: server.py loads .env after importing this module
+        if self._api_key is None:
+            self._api_key = os.environ['EMERGENT_LLM_KEY']
+        return self._api_key
+
+    def _semaphore(self, model: Tuple[str, str]) -> asyncio.Semaphore:
+        if model not in self._semaphores:
+            self._semaphores[model] = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphores[model]
+
+    def _breaker(self, model: Tuple[str, str]) -> CircuitBreaker:
+        if model not in self._breakers:
+            self._breakers[model] = CircuitBreaker()
+        return self._breakers[model]
+
+    def _count(self, call_site: str, outcome: str):
+        counters = self._counters.setdefault(
+            call_site, {"calls": 0, "errors": 0, "timeouts": 0, "short_circuited": 0, "deadline_exceeded": 0}
+        )
+        counters[outcome] += 1
+        if outcome != "calls":
+            LLM_ERRORS.inc(call_site, outcome)
+
+    def _observe(self, call_site: str, seconds: float):
+        self._latencies.setdefault(call_site, deque(maxlen=512)).append(seconds)
+        LLM_DURATION.observe(seconds, call_site)
+        tracing.record(f"llm_{call_site}", time.perf_counter() - seconds, seconds)
+
+    def _admit(self, call_site: str, model: Tuple[str, str]) -> CircuitBreaker:
+        breaker = self._breaker(model)
+        if not breaker.allow():
+            self._count(call_site, "short_circuited")
+            raise CircuitOpenError(f"LLM circuit open for {model[0]}/{model[1]}")
+        return breaker
+
+    async def _acquire(self, model: Tuple[str, str]):
+        self._waiting[model] = self._waiting.get(model, 0) + 1
+        try:
+            await self._semaphore(model).acquire()
+        finally:
+            self._waiting[model] -= 1
+        self._in_flight[model] = self._in_flight.get(model, 0) + 1
+        LLM_IN_FLIGHT.inc(model[1])
+
+    def _release(self, model: Tuple[str, str]):
+        self._in_flight[model] -= 1
+        LLM_IN_FLIGHT.dec(model[1])
+        self._semaphore(model).release()
+
+    async def complete(self, call_site: str, session_id: str, system_message: str, prompt: str,
+                       model: Tuple[str, str] = DEFAULT_MODEL, timeout: Optional[float] = None,
+                       hedge: bool = False) -> str:
+        """Send one prompt and return the full completion text"""
+        breaker = self._admit(call_site, model)
+        delay = self._hedge_delay(call_site) if hedge and self.hedge_enabled else None
+        if delay is None:
+            return await self._complete(breaker, call_site, session_id, system_message, prompt, model, timeout)
+        return await self._hedged(delay, breaker, call_site, session_id, system_message, prompt, model, timeout)
+
+    def _hedge_delay(self, call_site: str) -> Optional[float]:
+        """Seconds to wait before hedging, or None until there is enough latency history"""
+        samples = self._latencies.get(call_site)
+        if not samples or len(samples) < LLM_HEDGE_MIN_SAMPLES:
+            return None
+        ordered = sorted(samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * LLM_HEDGE_PERCENTILE))]
+
+    def _hedge_count(self, call_site: str, outcome: str):
+        counters = self._hedge_counters.setdefault(
+            call_site, {"issued": 0, "won": 0, "lost": 0, "capped": 0, "extra_prompt_chars": 0}
+        )
+        counters[outcome] += 1
+        LLM_HEDGES.inc(call_site, outcome)
+
+    async def _hedged(self, delay: float, breaker: CircuitBreaker, call_site: str, session_id: str,
+                      system_message: str, prompt: str, model: Tuple[str, str],
+                      timeout: Optional[float]) -> str:
+        window = self._hedge_windows.setdefault(call_site, deque(maxlen=LLM_HEDGE_WINDOW))
+        primary = asyncio.create_task(
+            self._complete(breaker, call_site, session_id, system_message, prompt, model, timeout)
+        )
+        pending = {primary}
+        try:
+            done, _ = await asyncio.wait(pending, timeout=delay)
+            if done:
+                window.append(0)
+                return primary.result()
+            if window and sum(window) / len(window) >= LLM_HEDGE_MAX_RATE:
+                window.append(0)
+                self._hedge_count(call_site, "capped")
+                return await primary
+            
+            window.append(1)
+            self._hedge_count(call_site, "issued")
+            self._hedge_counters[call_site]["extra_prompt_chars"] += len(system_message) + len(prompt)
+            LLM_HEDGE_PROMPT_CHARS.inc(call_site, amount=len(system_message) + len(prompt))
+            backup = asyncio.create_task(
+                self._complete(breaker, call_site, session_id, system_message, prompt, model, timeout)
+            )
+            pending.add(backup)
+            error: Optional[BaseException] = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        self._hedge_count(call_site, "won" if task is backup else "lost")
+                        return task.result()
+                    error = error or task.exception()
+            raise error
+        finally:
+            # The slower request is cancelled as soon as one of them has an answer
+            for task in pending:
+                task.cancel()
+
+    async def _complete(self, breaker: CircuitBreaker, call_site: str, session_id: str,
+                        system_message: str, prompt: str, model: Tuple[str, str],
+                        timeout: Optional[float] = None) -> str:
+        call_timeout = timeout or CALL_SITE_TIMEOUTS.get(call_site, LLM_TIMEOUT)
+        self._bound(call_site, call_timeout)
+        await self._acquire(model)
+        try:
+            # Queueing for a slot spends budget too, so cap the timeout after acquiring
+            bounded = self._bound(call_site, call_timeout)
+        except deadlines.DeadlineExceeded:
+            self._release(model)
+            raise
+        started = time.perf_counter()
+        self._count(call_site, "calls")
+        # Only calls that ran their course feed the latency window the hedge delay is taken from;
+        # cancelled hedge losers and deadline-cut calls would drag it down
+        observe = True
+        try:
+            chat = LlmChat(
+                api_key=self.api_key,
+                session_id=session_id,
+                system_message=system_message
+            ).with_model(*model)
+            response = await asyncio.wait_for(chat.send_message(UserMessage(text=prompt)), bounded)
+        except asyncio.TimeoutError:
+            if bounded < call_timeout:
+                # Cut short by the request's budget, not a sign the provider is failing
+                observe = False
+                self._count(call_site, "deadline_exceeded")
+                raise deadlines.DeadlineExceeded(f"Request deadline exceeded during {call_site} call")
+            self._count(call_site, "timeouts")
+            breaker.record_failure()
+            raise
+        except asyncio.CancelledError:
+            observe = False
+            raise
+        except Exception:
+            self._count(call_site, "errors")
+            breaker.record_failure()
+            raise
+        finally:
+            if observe:
+                self._observe(call_site, time.perf_counter() - started)
+            self._release(model)
+        breaker.record_success()
+        return response
+
+    def _bound(self, call_site: str, timeout: float) -> float:
+        try:
+            return deadlines.bound(timeout, deadlines.DB_RESERVE)
+        except deadlines.DeadlineExceeded:
+            self._count(call_site, "deadline_exceeded")
+            raise
+
+    async def stream(self, call_site: str, session_id: str, system_message: str, prompt: str,
+                     model: Tuple[str, str] = DEFAULT_MODEL) -> AsyncIterator[str]:
+        """Yield completion text as it arrives.
+
+        LlmChat only returns whole completions, so streams are opened through
+        litellm (which LlmChat wraps). If a stream cannot be opened, the full
+        completion is fetched through LlmChat and yielded as a single chunk.
+        """
+        call_timeout = CALL_SITE_TIMEOUTS.get(call_site, LLM_TIMEOUT)
+        breaker = self._admit(call_site, model)
+        self._bound(call_site, call_timeout)
+        await self._acquire(model)
+        # The slot is held from here until the stream ends, however it ends (including cancellation)
+        held = True
+        started = time.perf_counter()
+        # A stream the client walked away from (cancelled or closed early) is not a latency sample
+        observe = False
+        try:
+            # The timeout covers the whole stream, not each chunk, so a stalled stream cannot hold the slot
+            bounded = self._bound(call_site, call_timeout)
+            expires_at = time.monotonic() + bounded
+            try:
+                stream = await asyncio.wait_for(
+                    litellm.acompletion(
+                        model=f"{model[0]}/{model[1]}",
+                        messages=[
+                            {"role": "system", "content": system_message},
+                            {"role": "user", "content": prompt}
+                        ],
+                        api_key=self.api_key,
+                        api_base=LLM_PROXY_URL if self.api_key.startswith("sk-emergent-") else None,
+                        stream=True
+                    ),
+                    bounded
+                )
+            except Exception as e:
+                logging.error(f"Error opening LLM stream, using full completion: {str(e)}")
+                held = False
+                self._release(model)
+                yield await self._complete(breaker, call_site, session_id, system_message, prompt, model)
+                return
+
+            self._count(call_site, "calls")
+            chunks = stream.__aiter__()
+            try:
+                while True:
+                    try:
+                        chunk = await asyncio.wait_for(chunks.__anext__(), max(0.0, expires_at - time.monotonic()))
+                    except StopAsyncIteration:
+                        break
+                    delta = chunk.choices[0].delta.content if chunk.choices else None
+                    if delta:
+                        yield delta
+            except asyncio.TimeoutError:
+                if bounded < call_timeout:
+                    # Cut short by the request's budget, not a sign the provider is failing
+                    self._count(call_site, "deadline_exceeded")
+                    raise deadlines.DeadlineExceeded(f"Request deadline exceeded during {call_site} stream")
+                observe = True
+                self._count(call_site, "timeouts")
+                breaker.record_failure()
+                raise
+            except Exception:
+                observe = True
+                self._count(call_site, "errors")
+                breaker.record_failure()
+                raise
+            else:
+                observe = True
+                breaker.record_success()
+        finally:
+            if observe:
+                self._observe(call_site, time.perf_counter() - started)
+            if held:
+                self._release(model)
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue depth, in-flight calls, breaker state and latency per call site"""
+        models = {}
+        for model in set(self._semaphores) | set(self._breakers):
+            name = f"{model[0]}/{model[1]}"
+            breaker = self._breaker(model)
+            models[name] = {
+                "queue_depth": self._waiting.get(model, 0),
+                "in_flight": self._in_flight.get(model, 0),
+                "max_concurrency": self.max_concurrency,
+                "circuit": breaker.state,
+                "consecutive_failures": breaker.failures,
+            }
+        call_sites = {}
+        for call_site, counters in self._counters.items():
+            samples = sorted(self._latencies.get(call_site, ()))
+            call_sites[call_site] = {
+                **counters,
+                "latency_ms_p50": round(samples[len(samples) // 2] * 1000, 1) if samples else None,
+                "latency_ms_p95": round(samples[int(len(samples) * 0.95) - 1] * 1000, 1) if samples else None,
+            }
+        return {
+            "models": models,
+            "call_sites": call_sites,
+            "hedging": {
+                "enabled": self.hedge_enabled,
+                "percentile": LLM_HEDGE_PERCENTILE,
+                "max_rate": LLM_HEDGE_MAX_RATE,
+                "call_sites": {
+                    call_site: {
+                        **counters,
+                        "delay_ms": round(delay * 1000, 1) if (delay := self._hedge_delay(call_site)) else None,
+                        "recent_rate": round(sum(window) / len(window), 4) if (window := self._hedge_windows.get(call_site)) else 0.0,
+                    }
+                    for call_site, counters in self._hedge_counters.items()
+                },
+            },
+        }
+
+    async def close(self):
+        await self.http_client.aclose()
+
+llm_gateway = LlmGateway()
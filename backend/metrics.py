@@ -0,0 +1,226 @@
+"""Minimal Prometheus-compatible metrics: counters, gauges and histograms.
+
+Observations are plain dict/list updates keyed by a tuple of label values
+(well under a microsecond each); all formatting cost is paid in render(),
+when /metrics is scraped.
+"""
+import threading
+import time
+from bisect import bisect_left
+from typing import Dict, List, Sequence, Tuple
+
+from pymongo import monitoring
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+DB_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+
+REGISTRY: List["_Metric"] = []
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        REGISTRY.append(self)
+
+    def _header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple, float] = {}
+
+    def inc(self, *labels: str, amount: float = 1.0):
+        self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def render(self) -> List[str]:
+        lines = self._header()
+        for labels, value in list(self._values.items()):
+            lines.append(f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}")
+        return lines
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def dec(self, *labels: str, amount: float = 1.0):
+        self._values[labels] = self._values.get(labels, 0.0) - amount
+
+    def set(self, value: float, *labels: str):
+        self._values[labels] = value
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # labels -> [per-bucket counts (last slot is +Inf), sum, count]
+        self._series: Dict[Tuple, list] = {}
+
+    def observe(self, value: float, *labels: str):
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+        series[0][bisect_left(self.buckets, value)] += 1
+        series[1] += value
+        series[2] += 1
+
+    def render(self) -> List[str]:
+        lines = self._header()
+        for labels, (counts, total, count) in list(self._series.items()):
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += bucket_count
+                le = 'le="' + _format_value(bound) + '"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, labels, le)} {cumulative}")
+            label_str = _format_labels(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{label_str} {_format_value(total)}")
+            lines.append(f"{self.name}_count{label_str} {count}")
+        return lines
+
+def render() -> str:
+    """Text exposition format for every registered metric"""
+    lines: List[str] = []
+    for metric in REGISTRY:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
+
+HTTP_IN_FLIGHT = Gauge("http_requests_in_flight", "HTTP requests currently being served")
+HTTP_DURATION = Histogram(
+    "http_request_duration_seconds", "HTTP request latency by route", ("method", "route", "status")
+)
+LLM_DURATION = Histogram("llm_call_duration_seconds", "LLM call latency by call site", ("call_site",))
+LLM_ERRORS = Counter(
+    "llm_call_errors_total", "Failed LLM calls by call site and kind (errors, timeouts, short_circuited, deadline_exceeded)",
+    ("call_site", "kind")
+)
+LLM_HEDGES = Counter(
+    "llm_hedges_total", "Hedged LLM requests by outcome (issued, won, lost, capped)", ("call_site", "outcome")
+)
+LLM_HEDGE_PROMPT_CHARS = Counter(
+    "llm_hedge_prompt_chars_total", "Prompt characters re-sent by hedge requests (extra cost)", ("call_site",)
+)
+LLM_IN_FLIGHT = Gauge("llm_calls_in_flight", "LLM calls holding a concurrency slot", ("model",))
+MONGO_DURATION = Histogram(
+    "mongo_operation_duration_seconds", "MongoDB command latency by collection",
+    ("collection", "command"), buckets=DB_BUCKETS
+)
+MONGO_FAILURES = Counter("mongo_operation_failures_total", "Failed MongoDB commands", ("collection", "command"))
+ANSWER_PRESCORES = Counter(
+    "answer_prescore_total", "Answer evaluations decided locally (by reason) or sent to the LLM", ("outcome",)
+)
+DEFERRED_EVALUATIONS = Counter(
+    "deferred_evaluations_total",
+    "Answer evaluations that outlived the request deadline, by outcome (deferred, applied, superseded)",
+    ("outcome",)
+)
+ADMISSION_REJECTIONS = Counter(
+    "admission_rejections_total", "Requests shed by admission control (queue_full, queue_timeout, rate_limited)",
+    ("route", "reason")
+)
+ADMISSION_QUEUE_DEPTH = Gauge("admission_queue_depth", "Requests waiting for an admission slot", ("route",))
+ADMISSION_WAIT = Histogram("admission_wait_seconds", "Time admitted requests waited for a slot", ("route",))
+IDEMPOTENT_REQUESTS = Counter(
+    "idempotent_requests_total",
+    "Requests with an idempotency key by outcome (executed, coalesced, replayed, conflict, mismatch)",
+    ("route", "outcome")
+)
+QUESTION_BANK_LOOKUPS = Counter(
+    "question_bank_lookups_total", "Question generations served from the question bank (hit) or the LLM (miss)",
+    ("outcome",)
+)
+SKILL_CROSS_CHECKS = Counter(
+    "resume_skill_cross_checks_total",
+    "LLM resume skills checked against the local skill extractor (confirmed, unverified, added)",
+    ("outcome",)
+)
+FALLBACKS = Counter(
+    "fallback_responses_total", "Responses served from a hard-coded fallback", ("call_site", "reason")
+)
+
+class PrometheusMiddleware:
+    """ASGI middleware recording latency per route template and in-flight requests"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        status = 500
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        HTTP_IN_FLIGHT.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            HTTP_IN_FLIGHT.dec()
+            # FastAPI stores the matched route in the scope; use its template to bound cardinality
+            route = scope.get("route")
+            HTTP_DURATION.observe(
+                time.perf_counter() - started,
+                scope["method"], getattr(route, "path", "unmatched"), str(status)
+            )
+
+class MongoCommandMetrics(monitoring.CommandListener):
+    """pymongo command listener feeding MONGO_DURATION; motor runs commands on worker threads"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._collections: Dict[int, str] = {}
+
+    @staticmethod
+    def _collection(event) -> str:
+        target = event.command.get(event.command_name)
+        if event.command_name == "getMore":
+            target = event.command.get("collection")
+        return target if isinstance(target, str) else ""
+
+    def started(self, event):
+        collection = self._collection(event)
+        if collection:
+            self._collections[event.request_id] = collection
+
+    def succeeded(self, event):
+        collection = self._collections.pop(event.request_id, None)
+        if collection:
+            with self._lock:
+                MONGO_DURATION.observe(event.duration_micros / 1e6, collection, event.command_name)
+
+    def failed(self, event):
+        collection = self._collections.pop(event.request_id, None)
+        if collection:
+            with self._lock:
+                MONGO_DURATION.observe(event.duration_micros / 1e6, collection, event.command_name)
+                MONGO_FAILURES.inc(collection, event.command_name)
+
+mongo_command_metrics = MongoCommandMetrics()
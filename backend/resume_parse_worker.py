@@ -0,0 +1,32 @@
+"""Run resume parse workers outside the API process.
+
+Claims jobs from db.resume_parse_jobs until interrupted. Run the API with
+RESUME_PARSE_IN_PROCESS=false when parsing is handled by this entry point.
+
+Usage (from backend/): python resume_parse_worker.py [--workers 8]
+"""
+import argparse
+import asyncio
+import logging
+
+import server
+
+async def main(workers: int):
+    await server.ensure_indexes()
+    server.resume_parse_queue.workers = workers
+    server.resume_parse_queue.start()
+    logging.info(f"Resume parse worker running with {workers} workers")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.resume_parse_queue.stop()
+        await server.llm_gateway.close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=server.RESUME_PARSE_WORKERS)
+    args = parser.parse_args()
+    try:
+        asyncio.run(main(args.workers))
+    except KeyboardInterrupt:
+        pass
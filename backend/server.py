@@ -1,33 +1,106 @@
-from fastapi import FastAPI, APIRouter, UploadFile, File, HTTPException, Form
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, APIRouter, UploadFile, File, HTTPException, Form, Query, Header
+from fastapi.responses import JSONResponse, StreamingResponse, Response, PlainTextResponse
+from fastapi.encoders import jsonable_encoder
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ReturnDocument, UpdateOne
+from pymongo.errors import DuplicateKeyError
 import os
 import logging
 from pathlib import Path
 from pydantic import BaseModel, Field, ConfigDict
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple, Callable, Awaitable
 import uuid
-from datetime import datetime, timezone
-import PyPDF2
-import docx
-import io
+from datetime import datetime, timezone, timedelta
 import json
-from emergentintegrations.llm.chat import LlmChat, UserMessage
+import asyncio
+import hashlib
+import base64
+import time
+import unicodedata
+import csv
+import io
+import shutil
+import tempfile
+import zipfile
+import random
+import re
+from collections import OrderedDict
+from text_extraction import extraction_service
+from llm_gateway import llm_gateway
+import admission
+import deadlines
+import metrics
+import tracing
+from metrics import FALLBACKS, ANSWER_PRESCORES, DEFERRED_EVALUATIONS, IDEMPOTENT_REQUESTS, QUESTION_BANK_LOOKUPS
+from metrics import SKILL_CROSS_CHECKS
+from answer_prescorer import prescore_answer
+from skill_extractor import skill_extractor
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
 # MongoDB connection
 mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
+client = AsyncIOMotorClient(mongo_url, event_listeners=[metrics.mongo_command_metrics, tracing.mongo_command_spans])
 db = client[os.environ['DB_NAME']]
 
 # Create the main app
 app = FastAPI()
 api_router = APIRouter(prefix="/api")
 
+MAX_QUESTIONS = 8
+DIFFICULTIES = ("easy", "medium", "hard")
+
+FALLBACK_QUESTION = {
+    "question": "Please describe your experience with the technologies mentioned in the job description.",
+    "time_allocated": 180
+}
+
+# Response deadlines per endpoint (seconds, 0 disables). LLM and DB calls inside a handler only get
+# what is left of its budget; past it they fall back, or an answer evaluation finishes after the response
+ENDPOINT_DEADLINES = {
+    "start_interview": float(os.environ.get('DEADLINE_START_INTERVIEW', 40)),
+    "upload_jd": float(os.environ.get('DEADLINE_UPLOAD_JD', 15)),
+    "submit_answer": float(os.environ.get('DEADLINE_SUBMIT_ANSWER', 8)),
+    "submit_answers_batch": float(os.environ.get('DEADLINE_SUBMIT_ANSWERS_BATCH', 20)),
+    "assistant_help": float(os.environ.get('DEADLINE_ASSISTANT_HELP', 10)),
+}
+# Admission control in front of the LLM-bound endpoints: (max concurrency, max queued, max wait seconds)
+ADMISSION_ENABLED = os.environ.get('ADMISSION_CONTROL', 'true').lower() == 'true'
+ADMISSION_MAX_WAIT = float(os.environ.get('ADMISSION_MAX_WAIT', 2))
+ADMISSION_LIMITERS = {
+    route: admission.RouteLimiter(route, concurrency, queue, ADMISSION_MAX_WAIT, ADMISSION_ENABLED)
+    for route, concurrency, queue in (
+        ("start_interview", int(os.environ.get('ADMISSION_START_CONCURRENCY', 16)),
+         int(os.environ.get('ADMISSION_START_QUEUE', 32))),
+        ("submit_answer", int(os.environ.get('ADMISSION_ANSWER_CONCURRENCY', 48)),
+         int(os.environ.get('ADMISSION_ANSWER_QUEUE', 96))),
+        ("assistant_help", int(os.environ.get('ADMISSION_ASSISTANT_CONCURRENCY', 16)),
+         int(os.environ.get('ADMISSION_ASSISTANT_QUEUE', 16))),
+    )
+}
+# Assistant help per interview: a burst of ASSISTANT_BURST, then one request every 1/ASSISTANT_RATE seconds
+assistant_buckets = admission.TokenBuckets(
+    "assistant_help",
+    rate=float(os.environ.get('ASSISTANT_RATE', 0.1)),
+    burst=int(os.environ.get('ASSISTANT_BURST', 5)),
+    enabled=ADMISSION_ENABLED
+)
+
+# Responses to submissions carrying an idempotency key are kept this long for replay
+IDEMPOTENCY_TTL = int(os.environ.get('IDEMPOTENCY_TTL', 24 * 3600))
+# A key still marked in progress after this long belongs to a request that died and can be taken over
+IDEMPOTENCY_LEASE = 120.0
+
+# Budget an answer evaluation leaves for generating the next question
+NEXT_QUESTION_RESERVE = float(os.environ.get('DEADLINE_NEXT_QUESTION_RESERVE', 3))
+
+def fallback_reason(error: Exception) -> str:
+    """FALLBACKS reason for an exception: "deadline" when the request budget ran out"""
+    return "deadline" if isinstance(error, deadlines.DeadlineExceeded) else "error"
+
 # Models
 class InterviewCreate(BaseModel):
     candidate_name: str
@@ -40,9 +113,20 @@ class Interview(BaseModel):
     candidate_email: str
     resume_text: Optional[str] = None
     jd_text: Optional[str] = None
+    jd_requirements: Optional[Dict[str, Any]] = None
     parsed_skills: Optional[List[str]] = None
     parsed_experience: Optional[str] = None
+    resume_parse_status: Optional[str] = None  # pending, parsing, done, failed
+    resume_parse_job_id: Optional[str] = None
+    resume_parse_error: Optional[str] = None
     status: str = "setup"  # setup, in_progress, completed, terminated
+    # Running aggregates, maintained with $inc as answers are recorded
+    answered_count: int = 0
+    score_sum: float = 0.0
+    difficulty_score_sums: Dict[str, float] = Field(default_factory=dict)
+    difficulty_answer_counts: Dict[str, int] = Field(default_factory=dict)
+    pending_evaluations: int = 0  # answers counted above whose evaluation has not landed yet
+    last_difficulty: Optional[str] = None
     overall_score: Optional[float] = None
     readiness_level: Optional[str] = None
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
@@ -60,12 +144,21 @@ class QuestionResponse(BaseModel):
     time_taken: Optional[int] = None
     score: Optional[float] = None
     feedback: Optional[str] = None
+    evaluation_status: Optional[str] = None  # pending, done
+    bank_id: Optional[str] = None  # question_bank entry this question was served from
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
 class AnswerSubmission(BaseModel):
     answer_text: str
     time_taken: int
 
+class BatchAnswer(AnswerSubmission):
+    question_id: str
+
+class BatchAnswerSubmission(BaseModel):
+    answers: List[BatchAnswer]
+    complete: bool = True  # finish the interview and build its report once graded
+
 class InterviewReport(BaseModel):
     interview_id: str
     overall_score: float
@@ -73,43 +166,15 @@ class InterviewReport(BaseModel):
     total_questions: int
     questions_answered: int
     skill_scores: Dict[str, float]
+    difficulty_scores: Dict[str, float] = Field(default_factory=dict)
     strengths: List[str]
     weaknesses: List[str]
     recommendations: List[str]
 
 # Helper functions
-def extract_text_from_pdf(file_content: bytes) -> str:
-    """Extract text from PDF file"""
-    try:
-        pdf_reader = PyPDF2.PdfReader(io.BytesIO(file_content))
-        text = ""
-        for page in pdf_reader.pages:
-            text += page.extract_text()
-        return text
-    except Exception as e:
-        logging.error(f"Error extracting PDF: {str(e)}")
-        return ""
-
-def extract_text_from_docx(file_content: bytes) -> str:
-    """Extract text from DOCX file"""
-    try:
-        doc = docx.Document(io.BytesIO(file_content))
-        text = "\n".join([paragraph.text for paragraph in doc.paragraphs])
-        return text
-    except Exception as e:
-        logging.error(f"Error extracting DOCX: {str(e)}")
-        return ""
-
-async def parse_resume_with_ai(resume_text: str) -> Dict[str, Any]:
-    """Parse resume using AI to extract skills and experience"""
-    try:
-        chat = LlmChat(
-            api_key=os.environ['EMERGENT_LLM_KEY'],
-            session_id=f"resume_parse_{uuid.uuid4()}",
-            system_message="You are an expert resume parser. Extract key information from resumes."
-        ).with_model("openai", "gpt-5.2")
-        
-        prompt = f"""Analyze this resume and extract:
+RESUME_PARSE_MODEL = ("openai", "gpt-5.2")
+RESUME_PARSE_SYSTEM_MESSAGE = "You are an expert resume parser. Extract key information from resumes."
+RESUME_PARSE_PROMPT = """Analyze this resume and extract:
 1. Technical skills (list)
 2. Years of experience
 3. Key projects or achievements (brief)
@@ -119,15 +184,28 @@ Resume:
 {resume_text}
 
 Respond in JSON format with keys: skills (array), experience_years (string), projects (string), education (string)"""
-        
-        message = UserMessage(text=prompt)
-        response = await chat.send_message(message)
+
+async def parse_resume_with_ai(resume_text: str, strict: bool = False) -> Dict[str, Any]:
+    """Parse resume using AI to extract skills and experience; strict raises instead of falling back"""
+    try:
+        prompt = RESUME_PARSE_PROMPT.format(resume_text=resume_text)
+        
+        response = await llm_gateway.complete(
+            "parse",
+            f"resume_parse_{uuid.uuid4()}",
+            RESUME_PARSE_SYSTEM_MESSAGE,
+            prompt,
+            model=RESUME_PARSE_MODEL
+        )
         
         # Parse JSON response
         try:
             parsed_data = json.loads(response)
         except:
+            if strict:
+                raise ValueError("Resume parse response was not valid JSON")
             # If not valid JSON, create structured response
+            FALLBACKS.inc("parse", "invalid_json")
             parsed_data = {
                 "skills": [],
                 "experience_years": "Not specified",
@@ -138,6 +216,9 @@ Respond in JSON format with keys: skills (array), experience_years (string), pro
         return parsed_data
     except Exception as e:
         logging.error(f"Error parsing resume: {str(e)}")
+        if strict:
+            raise
+        FALLBACKS.inc("parse", fallback_reason(e))
         return {
             "skills": [],
             "experience_years": "Unknown",
@@ -145,26 +226,248 @@ Respond in JSON format with keys: skills (array), experience_years (string), pro
             "education": "Unknown"
         }
 
-async def generate_question(interview_id: str, question_number: int, difficulty: str, 
-                           resume_data: Dict, jd_text: str, previous_performance: Optional[float] = None) -> Dict[str, Any]:
-    """Generate interview question based on context and difficulty"""
+class TTLCache:
+    """Size-bounded in-process LRU cache whose entries expire after ttl seconds"""
+
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any):
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: str) -> Optional[Any]:
+        entry = self._entries.pop(key, None)
+        return entry[1] if entry else None
+
+    def clear(self):
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+# Resume parse cache, keyed by a hash of the normalized resume text. The version
+# changes whenever the parse prompt or model does, so stale entries are never served.
+RESUME_PARSE_VERSION = hashlib.sha256(
+    "\n".join([*RESUME_PARSE_MODEL, RESUME_PARSE_SYSTEM_MESSAGE, RESUME_PARSE_PROMPT]).encode()
+).hexdigest()[:16]
+RESUME_CACHE_TTL = float(os.environ.get('RESUME_CACHE_TTL', 7 * 24 * 3600))
+resume_parse_cache = TTLCache(
+    max_size=int(os.environ.get('RESUME_CACHE_SIZE', 1024)),
+    ttl=RESUME_CACHE_TTL
+)
+resume_cache_stats = {"memory_hits": 0, "db_hits": 0, "misses": 0, "stores": 0}
+
+def normalized_text_hash(text: str) -> str:
+    """SHA-256 of the text with unicode and whitespace differences normalized away"""
+    normalized = " ".join(unicodedata.normalize("NFKC", text).split())
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+async def lookup_resume_parse(text_hash: str) -> Optional[Dict[str, Any]]:
+    """Previously stored parse for this resume text hash, from memory or MongoDB"""
+    cached = resume_parse_cache.get(text_hash)
+    if cached is not None:
+        resume_cache_stats["memory_hits"] += 1
+        return dict(cached)
+    
+    entry = await db.resume_parse_cache.find_one(
+        {
+            "text_hash": text_hash,
+            "version": RESUME_PARSE_VERSION,
+            "created_at": {"$gte": datetime.now(timezone.utc) - timedelta(seconds=RESUME_CACHE_TTL)}
+        },
+        {"_id": 0, "parsed_data": 1}
+    )
+    if entry:
+        resume_cache_stats["db_hits"] += 1
+        resume_parse_cache.set(text_hash, entry["parsed_data"])
+        return dict(entry["parsed_data"])
+    return None
+
+def checked_resume_parse(resume_text: str, parsed_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Parsed resume with its skills cross-checked against the ones found locally in the text.
+    
+    The cache keeps the LLM's own output, so a taxonomy change applies to cached parses too.
+    """
+    check = skill_extractor.cross_check(parsed_data.get('skills') or [], resume_text)
+    for outcome in ("confirmed", "unverified", "added"):
+        if check[outcome]:
+            SKILL_CROSS_CHECKS.inc(outcome, amount=len(check[outcome]))
+    return {**parsed_data, "skills": check["skills"]}
+
+async def parse_resume_cached(resume_text: str, strict: bool = False) -> Dict[str, Any]:
+    """Parse resume, reusing a previous result for identical resume text"""
+    text_hash = normalized_text_hash(resume_text)
+    cached = await lookup_resume_parse(text_hash)
+    if cached is not None:
+        return checked_resume_parse(resume_text, cached)
+    
+    resume_cache_stats["misses"] += 1
+    parsed_data = await parse_resume_with_ai(resume_text, strict)
+    
+    # Only cache successful parses; fallbacks should be retried on the next upload
+    if parsed_data.get('skills'):
+        resume_parse_cache.set(text_hash, parsed_data)
+        await db.resume_parse_cache.update_one(
+            {"text_hash": text_hash, "version": RESUME_PARSE_VERSION},
+            {"$set": {"parsed_data": parsed_data, "created_at": datetime.now(timezone.utc)}},
+            upsert=True
+        )
+        resume_cache_stats["stores"] += 1
+    
+    return checked_resume_parse(resume_text, parsed_data)
+
+# Job descriptions are reduced once, at upload, to the requirements questions are generated from
+JD_PARSE_SYSTEM_MESSAGE = "You are an expert technical recruiter. Extract the requirements from job descriptions."
+JD_PARSE_PROMPT = """Extract the hiring requirements from this job description:
+1. Role title
+2. Seniority (e.g. junior, mid, senior, lead)
+3. Must-have requirements (short phrases)
+4. Technical skills (list)
+5. Nice-to-have requirements (short phrases)
+
+Job Description:
+{jd_text}
+
+Respond in JSON format with keys: role (string), seniority (string), must_haves (array), skills (array), nice_to_haves (array)"""
+JD_PARSE_VERSION = hashlib.sha256(
+    "\n".join([*RESUME_PARSE_MODEL, JD_PARSE_SYSTEM_MESSAGE, JD_PARSE_PROMPT]).encode()
+).hexdigest()[:16]
+jd_parse_cache = TTLCache(
+    max_size=int(os.environ.get('JD_CACHE_SIZE', 256)),
+    ttl=RESUME_CACHE_TTL
+)
+jd_cache_stats = {"memory_hits": 0, "db_hits": 0, "misses": 0, "stores": 0}
+# Raw JD text per interview, read by every answer evaluation. Filled when the interview starts and
+# replaced on a JD upload; another worker serving the interview reads it from Mongo once
+interview_jd_cache = TTLCache(
+    max_size=int(os.environ.get('INTERVIEW_JD_CACHE_SIZE', 1024)),
+    ttl=float(os.environ.get('INTERVIEW_JD_CACHE_TTL', 3600))
+)
+
+async def interview_jd_text(interview_id: str) -> Optional[str]:
+    """The interview's raw JD text, from interview_jd_cache when possible"""
+    jd_text = interview_jd_cache.get(interview_id)
+    if jd_text is None:
+        interview = await db.interviews.find_one({"id": interview_id}, {"_id": 0, "jd_text": 1})
+        jd_text = (interview or {}).get('jd_text') or ""
+        interview_jd_cache.set(interview_id, jd_text)
+    return jd_text or None
+
+async def parse_jd_with_ai(jd_text: str) -> Optional[Dict[str, Any]]:
+    """Extract a structured requirement set from a job description; None if it could not be parsed"""
     try:
-        chat = LlmChat(
-            api_key=os.environ['EMERGENT_LLM_KEY'],
-            session_id=f"interview_{interview_id}",
-            system_message="You are an expert technical interviewer. Ask relevant, challenging questions."
-        ).with_model("openai", "gpt-5.2")
-        
-        skills_str = ", ".join(resume_data.get('skills', []))
-        
-        prompt = f"""Generate a {difficulty} difficulty interview question.
+        response = await llm_gateway.complete(
+            "parse",
+            f"jd_parse_{uuid.uuid4()}",
+            JD_PARSE_SYSTEM_MESSAGE,
+            JD_PARSE_PROMPT.format(jd_text=jd_text),
+            model=RESUME_PARSE_MODEL
+        )
+        data = json.loads(response)
+        requirements = {
+            "role": str(data.get('role') or "").strip(),
+            "seniority": str(data.get('seniority') or "").strip(),
+            "must_haves": [str(item).strip() for item in data.get('must_haves') or [] if str(item).strip()],
+            "skills": [str(item).strip() for item in data.get('skills') or [] if str(item).strip()],
+            "nice_to_haves": [str(item).strip() for item in data.get('nice_to_haves') or [] if str(item).strip()],
+        }
+        if not (requirements["must_haves"] or requirements["skills"]):
+            FALLBACKS.inc("parse", "empty_jd")
+            return None
+        return requirements
+    except Exception as e:
+        logging.error(f"Error parsing job description: {str(e)}")
+        FALLBACKS.inc("parse", "jd_deadline" if isinstance(e, deadlines.DeadlineExceeded) else "jd_error")
+        return None
+
+async def parse_jd_cached(jd_text: str) -> Optional[Dict[str, Any]]:
+    """Parse a job description, reusing the result for identical JD text shared by other interviews"""
+    text_hash = normalized_text_hash(jd_text)
+    
+    cached = jd_parse_cache.get(text_hash)
+    if cached is not None:
+        jd_cache_stats["memory_hits"] += 1
+        return dict(cached)
+    
+    entry = await db.jd_parse_cache.find_one(
+        {
+            "text_hash": text_hash,
+            "version": JD_PARSE_VERSION,
+            "created_at": {"$gte": datetime.now(timezone.utc) - timedelta(seconds=RESUME_CACHE_TTL)}
+        },
+        {"_id": 0, "requirements": 1}
+    )
+    if entry:
+        jd_cache_stats["db_hits"] += 1
+        jd_parse_cache.set(text_hash, entry["requirements"])
+        return dict(entry["requirements"])
+    
+    jd_cache_stats["misses"] += 1
+    requirements = await parse_jd_with_ai(jd_text)
+    
+    # Failed parses are not cached; questions fall back to the raw JD until a later upload succeeds
+    if requirements:
+        jd_parse_cache.set(text_hash, requirements)
+        await db.jd_parse_cache.update_one(
+            {"text_hash": text_hash, "version": JD_PARSE_VERSION},
+            {"$set": {"requirements": requirements, "created_at": datetime.now(timezone.utc)}},
+            upsert=True
+        )
+        jd_cache_stats["stores"] += 1
+    
+    return requirements
+
+def format_jd_requirements(requirements: Dict[str, Any]) -> str:
+    """Compact text form of a parsed JD for question prompts"""
+    role = " ".join(part for part in (requirements.get('seniority'), requirements.get('role')) if part)
+    lines = [f"Role: {role}"] if role else []
+    if requirements.get('must_haves'):
+        lines.append("Must have: " + "; ".join(requirements['must_haves']))
+    if requirements.get('skills'):
+        lines.append("Skills: " + ", ".join(requirements['skills']))
+    if requirements.get('nice_to_haves'):
+        lines.append("Nice to have: " + "; ".join(requirements['nice_to_haves']))
+    return "\n".join(lines)
+
+def jd_context_from(interview: Dict[str, Any]) -> str:
+    """Job requirements passed to question generation: the parsed summary, or the start of the raw JD"""
+    if interview.get('jd_requirements'):
+        return format_jd_requirements(interview['jd_requirements'])
+    return (interview.get('jd_text') or "")[:500]
+
+QUESTION_SYSTEM_MESSAGE = "You are an expert technical interviewer. Ask relevant, challenging questions."
+QUESTION_JSON_FORMAT = 'Respond with JSON: {"question": "your question here", "time_allocated": seconds}'
+QUESTION_STREAM_FORMAT = ('Respond in plain text. The first line must be exactly "TIME_ALLOCATED: <seconds>"; '
+                          'put only the question itself on the following lines.')
+
+def build_question_prompt(question_number: int, difficulty: str, resume_data: Dict, jd_context: str,
+                          previous_performance: Optional[float], response_format: str) -> str:
+    skills_str = ", ".join(resume_data.get('skills', []))
+    
+    return f"""Generate a {difficulty} difficulty interview question.
 
 Candidate Profile:
 - Skills: {skills_str}
 - Experience: {resume_data.get('experience_years', 'Unknown')}
 
 Job Requirements:
-{jd_text[:500]}
+{jd_context[:1500]}
 
 Question Number: {question_number}
 Previous Performance: {previous_performance if previous_performance else 'First question'}
@@ -174,29 +477,381 @@ Generate a question that:
 2. Is appropriate for {difficulty} difficulty
 3. Can be answered in 2-5 minutes
 
-Respond with JSON: {{"question": "your question here", "time_allocated": seconds}}"""
+{response_format}"""
+
+# Question bank: generated questions are kept with their skill profile, difficulty and observed
+# scores, and served again to later interviews with the same profile instead of calling the LLM
+QUESTION_BANK_ENABLED = os.environ.get('QUESTION_BANK', 'true').lower() == 'true'
+QUESTION_BANK_MAX_AGE = float(os.environ.get('QUESTION_BANK_MAX_AGE', 30 * 24 * 3600))
+QUESTION_BANK_MAX_REUSE = int(os.environ.get('QUESTION_BANK_MAX_REUSE', 20))
+
+def skill_tags(resume_data: Dict, jd_context: str) -> List[str]:
+    """Normalised resume skills the JD asks for (all of them when it mentions none)"""
+    skills = sorted({str(skill).strip().lower() for skill in resume_data.get('skills') or [] if str(skill).strip()})
+    jd = jd_context.lower()
+    jd_skills = {skill.lower() for skill in skill_extractor.extract(jd_context)}
+    # Whole-word match, so "go" is not found in "good" nor "java" in "javascript"
+    return [
+        skill for skill in skills
+        if skill in jd_skills or re.search(rf"(?<![\w+#]){re.escape(skill)}(?![\w+#])", jd)
+    ] or skills
+
+class QuestionBank:
+    """Generated questions in db.question_bank, keyed by (profile, difficulty).
+    
+    A profile is the JD context plus the candidate's JD-relevant skills, so candidates with
+    near-identical skill sets applying to the same JD share one. An entry is served to an interview
+    at most once, until it is max_age old or has been served max_reuse times.
+    """
+    
+    def __init__(self, enabled: bool, max_age: float, max_reuse: int):
+        self.enabled = enabled
+        self.max_age = max_age
+        self.max_reuse = max_reuse
+        self.stats = {"hits": 0, "misses": 0, "stored": 0, "errors": 0}
+    
+    @staticmethod
+    def profile(resume_data: Dict, jd_context: str) -> Dict[str, Any]:
+        tags = skill_tags(resume_data, jd_context)
+        jd_hash = normalized_text_hash(jd_context)
+        return {
+            "profile_key": hashlib.sha256(f"{jd_hash}|{'|'.join(tags)}".encode()).hexdigest()[:32],
+            "skill_tags": tags,
+            "jd_hash": jd_hash
+        }
+    
+    async def take(self, interview_id: str, difficulty: str, profile: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """A fresh bank question for the profile that this interview has not been served, least reused first"""
+        if not self.enabled:
+            return None
+        try:
+            entry = await db.question_bank.find_one(
+                {
+                    "profile_key": profile["profile_key"],
+                    "difficulty": difficulty,
+                    "served_count": {"$lt": self.max_reuse},
+                    "served_to": {"$ne": interview_id},
+                    "created_at": {"$gte": datetime.now(timezone.utc) - timedelta(seconds=self.max_age)}
+                },
+                {"_id": 0, "id": 1, "question": 1, "time_allocated": 1},
+                sort=[("served_count", 1)]
+            )
+        except Exception as e:
+            self.stats["errors"] += 1
+            logging.error(f"Error reading question bank: {str(e)}")
+            return None
+        self.stats["hits" if entry else "misses"] += 1
+        QUESTION_BANK_LOOKUPS.inc("hit" if entry else "miss")
+        if not entry:
+            return None
+        return {"question": entry["question"], "time_allocated": entry["time_allocated"], "bank_id": entry["id"]}
+    
+    async def add(self, question_data: Dict[str, Any], difficulty: str, profile: Dict[str, Any]) -> Optional[str]:
+        """Store a generated question and return its bank id"""
+        if not self.enabled:
+            return None
+        entry = {
+            "id": str(uuid.uuid4()),
+            **profile,
+            "difficulty": difficulty,
+            "question": question_data['question'],
+            "time_allocated": question_data.get('time_allocated', 180),
+            "served_count": 0,
+            "served_to": [],
+            "answer_count": 0,
+            "score_sum": 0.0,
+            "score_sq_sum": 0.0,
+            "created_at": datetime.now(timezone.utc)
+        }
+        try:
+            await db.question_bank.insert_one(entry)
+        except Exception as e:
+            self.stats["errors"] += 1
+            logging.error(f"Error storing question in bank: {str(e)}")
+            return None
+        self.stats["stored"] += 1
+        return entry["id"]
+    
+    async def mark_served(self, bank_id: str, interview_id: str):
+        await db.question_bank.update_one(
+            {"id": bank_id},
+            {"$inc": {"served_count": 1}, "$addToSet": {"served_to": interview_id},
+             "$set": {"last_served_at": datetime.now(timezone.utc)}}
+        )
+    
+    async def record_scores(self, scores: List[Tuple[Optional[str], Optional[float], Optional[Dict[str, Any]]]]):
+        """Fold (bank id, score, previous question state) answers into the entries' score statistics.
+        
+        A re-scored answer replaces its old score instead of counting twice; a pending one is not counted.
+        """
+        updates = []
+        for bank_id, score, previous in scores:
+            old = previous.get('score') if previous else None
+            if not bank_id or score == old:
+                continue
+            increments = {"answer_count": (score is not None) - (old is not None),
+                          "score_sum": (score or 0.0) - (old or 0.0),
+                          "score_sq_sum": (score or 0.0) ** 2 - (old or 0.0) ** 2}
+            updates.append(UpdateOne({"id": bank_id}, {"$inc": increments}))
+        if not updates:
+            return
+        try:
+            await db.question_bank.bulk_write(updates, ordered=False)
+        except Exception as e:
+            self.stats["errors"] += 1
+            logging.error(f"Error recording question bank scores: {str(e)}")
+
+question_bank = QuestionBank(QUESTION_BANK_ENABLED, QUESTION_BANK_MAX_AGE, QUESTION_BANK_MAX_REUSE)
+
+async def generate_question(interview_id: str, question_number: int, difficulty: str, 
+                           resume_data: Dict, jd_context: str, previous_performance: Optional[float] = None) -> Dict[str, Any]:
+    """Generate interview question based on context and difficulty; a question bank match skips the LLM"""
+    profile = question_bank.profile(resume_data, jd_context)
+    banked = await question_bank.take(interview_id, difficulty, profile)
+    if banked:
+        return banked
+    try:
+        prompt = build_question_prompt(
+            question_number, difficulty, resume_data, jd_context, previous_performance, QUESTION_JSON_FORMAT
+        )
         
-        message = UserMessage(text=prompt)
-        response = await chat.send_message(message)
+        response = await llm_gateway.complete(
+            "question",
+            f"interview_{interview_id}",
+            QUESTION_SYSTEM_MESSAGE,
+            prompt,
+            hedge=True
+        )
         
         try:
             question_data = json.loads(response)
         except:
+            FALLBACKS.inc("question", "invalid_json")
             question_data = {
                 "question": response[:500],
                 "time_allocated": 180
             }
+            return question_data
         
+        if isinstance(question_data.get('question'), str) and question_data['question'].strip():
+            question_data['bank_id'] = await question_bank.add(question_data, difficulty, profile)
         return question_data
     except Exception as e:
         logging.error(f"Error generating question: {str(e)}")
-        return {
-            "question": "Please describe your experience with the technologies mentioned in the job description.",
-            "time_allocated": 180
+        FALLBACKS.inc("question", fallback_reason(e))
+        return dict(FALLBACK_QUESTION)
+
+# Token streaming
+def split_time_header(text: str) -> tuple:
+    """Split a leading "TIME_ALLOCATED: N" line off streamed question text"""
+    first_line, _, rest = text.partition("\n")
+    match = re.match(r"\s*TIME_ALLOCATED:\s*(\d+)", first_line, re.IGNORECASE)
+    if match:
+        return int(match.group(1)), rest.lstrip("\n")
+    return None, text
+
+async def stream_question(interview_id: str, question_number: int, difficulty: str,
+                          resume_data: Dict, jd_context: str, previous_performance: Optional[float] = None):
+    """Streaming counterpart of generate_question.
+
+    Yields ("token", text) as the question arrives and finally ("question", question_data). A stream
+    that fails partway yields ("reset", None) before the fallback question: the text sent so far is void.
+    """
+    profile = question_bank.profile(resume_data, jd_context)
+    banked = await question_bank.take(interview_id, difficulty, profile)
+    if banked:
+        yield ("token", banked['question'])
+        yield ("question", banked)
+        return
+    
+    prompt = build_question_prompt(
+        question_number, difficulty, resume_data, jd_context, previous_performance, QUESTION_STREAM_FORMAT
+    )
+    time_allocated = 180
+    header, header_done, parts = "", False, []
+    failure = None
+    try:
+        async for delta in llm_gateway.stream("question", f"interview_{interview_id}", QUESTION_SYSTEM_MESSAGE, prompt):
+            if not header_done:
+                # Hold text back until the metadata line is complete
+                header += delta
+                if "\n" not in header and len(header) < 64:
+                    continue
+                header_done = True
+                seconds, delta = split_time_header(header)
+                time_allocated = seconds or time_allocated
+            if delta:
+                parts.append(delta)
+                yield ("token", delta)
+        if not header_done and header:
+            seconds, rest = split_time_header(header)
+            time_allocated = seconds or time_allocated
+            if rest:
+                parts.append(rest)
+                yield ("token", rest)
+    except Exception as e:
+        logging.error(f"Error streaming question: {str(e)}")
+        failure = fallback_reason(e)
+    
+    question_text = "".join(parts).strip()
+    if failure or not question_text:
+        # Text from a stream cut off partway is not a question: it is neither served nor banked
+        FALLBACKS.inc("question", failure or "stream_error")
+        if question_text:
+            yield ("reset", None)
+        question_data = dict(FALLBACK_QUESTION)
+        yield ("token", question_data['question'])
+        yield ("question", question_data)
+        return
+    question_data = {"question": question_text[:2000], "time_allocated": time_allocated}
+    question_data['bank_id'] = await question_bank.add(question_data, difficulty, profile)
+    yield ("question", question_data)
+
+# Speculative prefetch of the next question
+PREFETCH_ENABLED = os.environ.get('QUESTION_PREFETCH', 'true').lower() == 'true'
+prefetch_stats = {"scheduled": 0, "pregenerated": 0, "hits": 0, "misses": 0, "errors": 0}
+_prefetch_tasks: Dict[str, asyncio.Task] = {}
+
+async def prefetch_next_questions(interview_id: str, question_number: int,
+                                  resume_data: Dict, jd_context: str):
+    """Generate easy/medium/hard candidates for the next question and store them on the interview"""
+    try:
+        results = await asyncio.gather(*[
+            generate_question(interview_id, question_number, difficulty, resume_data, jd_context)
+            for difficulty in DIFFICULTIES
+        ])
+        # Fallback questions are not worth serving from the cache; a live call may do better
+        candidates = {
+            difficulty: data for difficulty, data in zip(DIFFICULTIES, results)
+            if data.get('question') and data['question'] != FALLBACK_QUESTION['question']
         }
+        if not candidates:
+            return
+        await db.interviews.update_one(
+            {"id": interview_id, "status": "in_progress"},
+            {"$set": {"prefetched_questions": {
+                "question_number": question_number,
+                "candidates": candidates,
+                "created_at": datetime.now(timezone.utc).isoformat()
+            }}}
+        )
+    except asyncio.CancelledError:
+        raise
+    except Exception as e:
+        prefetch_stats["errors"] += 1
+        logging.error(f"Error prefetching questions: {str(e)}")
+
+def schedule_prefetch(interview_id: str, question_number: int, resume_data: Dict, jd_context: str):
+    """Start generating candidates for question_number in the background"""
+    if not PREFETCH_ENABLED or question_number > MAX_QUESTIONS:
+        return
+    cancel_prefetch(interview_id)
+    task = deadlines.spawn(
+        prefetch_next_questions(interview_id, question_number, resume_data, jd_context)
+    )
+    _prefetch_tasks[interview_id] = task
+    task.add_done_callback(
+        lambda t: _prefetch_tasks.pop(interview_id, None) if _prefetch_tasks.get(interview_id) is t else None
+    )
+    prefetch_stats["scheduled"] += 1
+
+def cancel_prefetch(interview_id: str):
+    """Cancel any in-flight prefetch for an interview"""
+    task = _prefetch_tasks.pop(interview_id, None)
+    if task and not task.done():
+        task.cancel()
+
+async def take_prefetched_question(interview_id: str, question_number: int,
+                                   difficulty: str) -> Optional[Dict[str, Any]]:
+    """Claim the prefetched candidate for the given question and difficulty, if any"""
+    if not PREFETCH_ENABLED:
+        return None
+
+    # A prefetch still running in this process is already ahead of a fresh live call, but only
+    # worth waiting for within the request's budget; past that the caller falls back and the
+    # prefetch keeps running
+    task = _prefetch_tasks.get(interview_id)
+    if task and not task.done():
+        await asyncio.wait({task}, timeout=deadlines.remaining(deadlines.DB_RESERVE))
+
+    # Claim and clear atomically so a candidate set is never served twice
+    interview = await db.interviews.find_one_and_update(
+        {"id": interview_id, "prefetched_questions.question_number": question_number},
+        {"$unset": {"prefetched_questions": ""}},
+        projection={"_id": 0, "prefetched_questions": 1}
+    )
+    candidate = None
+    if interview:
+        candidate = interview["prefetched_questions"].get("candidates", {}).get(difficulty)
+
+    if candidate:
+        prefetch_stats["hits"] += 1
+    else:
+        prefetch_stats["misses"] += 1
+    return candidate
+
+# The first question is generated as soon as the resume is parsed and the JD is uploaded, in
+# either order, so start_interview only has to claim it
+FIRST_QUESTION_INPUTS = ("resume_text", "jd_text", "parsed_skills", "parsed_experience", "jd_requirements")
+# Setup changes that make a pregenerated first question stale
+RESET_PREGENERATION = {"prefetched_questions": "", "pregeneration_id": ""}
+
+async def pregenerate_first_question(interview_id: str):
+    """Generate the first (easy) question before the interview starts and store it as prefetched"""
+    try:
+        # The token ties the stored question to the inputs read here; any upload clears it
+        token = str(uuid.uuid4())
+        interview = await db.interviews.find_one_and_update(
+            {
+                "id": interview_id,
+                "status": "setup",
+                "resume_text": {"$ne": None},
+                "jd_text": {"$ne": None},
+                "resume_parse_status": {"$nin": list(ACTIVE_PARSE_STATUSES)}
+            },
+            {"$set": {"pregeneration_id": token}},
+            projection={"_id": 0, **{field: 1 for field in FIRST_QUESTION_INPUTS}},
+            return_document=ReturnDocument.AFTER
+        )
+        if not interview:
+            return
+        
+        question_data = await generate_question(
+            interview_id, 1, "easy", resume_data_from(interview), jd_context_from(interview)
+        )
+        if question_data['question'] == FALLBACK_QUESTION['question']:
+            return
+        result = await db.interviews.update_one(
+            {"id": interview_id, "status": "setup", "pregeneration_id": token},
+            {"$set": {"prefetched_questions": {
+                "question_number": 1,
+                "candidates": {"easy": question_data},
+                "created_at": datetime.now(timezone.utc).isoformat()
+            }}}
+        )
+        if result.modified_count:
+            prefetch_stats["pregenerated"] += 1
+    except asyncio.CancelledError:
+        raise
+    except Exception as e:
+        prefetch_stats["errors"] += 1
+        logging.error(f"Error pregenerating first question: {str(e)}")
+
+def schedule_first_question(interview_id: str):
+    """Pregenerate the first question in the background; a no-op until resume and JD are both ready"""
+    if not PREFETCH_ENABLED:
+        return
+    cancel_prefetch(interview_id)
+    task = deadlines.spawn(pregenerate_first_question(interview_id))
+    _prefetch_tasks[interview_id] = task
+    task.add_done_callback(
+        lambda t: _prefetch_tasks.pop(interview_id, None) if _prefetch_tasks.get(interview_id) is t else None
+    )
+
+ANSWER_PRESCORE_ENABLED = os.environ.get('ANSWER_PRESCORE', 'true').lower() == 'true'
 
 async def evaluate_answer(question_text: str, answer_text: str, time_allocated: int, 
-                         time_taken: int, difficulty: str) -> Dict[str, Any]:
+                         time_taken: int, difficulty: str, jd_text: Optional[str] = None) -> Dict[str, Any]:
     """Evaluate answer and provide score and feedback"""
     try:
         # Check for empty or invalid answers
@@ -218,11 +873,16 @@ async def evaluate_answer(question_text: str, answer_text: str, time_allocated:
                 "weaknesses": "Insufficient attempt at answering"
             }
         
-        chat = LlmChat(
-            api_key=os.environ['EMERGENT_LLM_KEY'],
-            session_id=f"eval_{uuid.uuid4()}",
-            system_message="You are an expert interviewer. Evaluate answers objectively."
-        ).with_model("openai", "gpt-5.2")
+        # Echoed questions, repetitive filler and off-topic text are scored locally; any answer to
+        # the generic fallback question can look off topic, so the LLM (or its fallback) judges those
+        if ANSWER_PRESCORE_ENABLED:
+            local_eval = prescore_answer(
+                question_text, answer_text, jd_text, off_topic_check=question_text != FALLBACK_QUESTION["question"]
+            )
+            if local_eval:
+                ANSWER_PRESCORES.inc(local_eval.pop("reason"))
+                return local_eval
+            ANSWER_PRESCORES.inc("llm")
         
         time_efficiency = min(100, (time_allocated / max(time_taken, 1)) * 100)
         
@@ -247,8 +907,13 @@ Provide:
 
 Respond in JSON: {{"score": number, "feedback": "text", "strengths": "text", "weaknesses": "text"}}"""
         
-        message = UserMessage(text=prompt)
-        response = await chat.send_message(message)
+        response = await llm_gateway.complete(
+            "eval",
+            f"eval_{uuid.uuid4()}",
+            "You are an expert interviewer. Evaluate answers objectively.",
+            prompt,
+            hedge=True
+        )
         
         try:
             eval_data = json.loads(response)
@@ -256,6 +921,7 @@ Respond in JSON: {{"score": number, "feedback": "text", "strengths": "text", "we
             final_score = (eval_data['score'] * 0.85) + (time_efficiency * 0.15)
             eval_data['score'] = round(final_score, 2)
         except:
+            FALLBACKS.inc("eval", "invalid_json")
             eval_data = {
                 "score": 50.0,
                 "feedback": "Unable to evaluate fully. Please provide more detailed answers.",
@@ -266,6 +932,7 @@ Respond in JSON: {{"score": number, "feedback": "text", "strengths": "text", "we
         return eval_data
     except Exception as e:
         logging.error(f"Error evaluating answer: {str(e)}")
+        FALLBACKS.inc("eval", fallback_reason(e))
         return {
             "score": 50.0,
             "feedback": "Evaluation error occurred.",
@@ -273,6 +940,132 @@ Respond in JSON: {{"score": number, "feedback": "text", "strengths": "text", "we
             "weaknesses": "N/A"
         }
 
+async def record_answer_aggregates(interview_id: str,
+                                  answers: List[Tuple[str, float, Optional[Dict[str, Any]]]]) -> Dict[str, Any]:
+    """Apply (difficulty, score, previous question state) answers to the interview's running
+    score aggregates in one update and return the updated interview.
+    
+    A None score records the answer as pending evaluation: counted, but not scored yet.
+    """
+    increments: Dict[str, float] = {}
+    for difficulty, score, previous in answers:
+        # A re-submitted answer replaces its old score instead of counting twice
+        already_answered = bool(previous) and previous.get('answer_text') is not None
+        score_delta = (score or 0.0) - ((previous.get('score') or 0.0) if already_answered else 0.0)
+        pending_delta = (score is None) - (bool(previous) and previous.get('evaluation_status') == "pending")
+        if pending_delta:
+            increments["pending_evaluations"] = increments.get("pending_evaluations", 0) + pending_delta
+        for field, amount in (("score_sum", score_delta), (f"difficulty_score_sums.{difficulty}", score_delta)):
+            increments[field] = increments.get(field, 0) + amount
+        if not already_answered:
+            for field in ("answered_count", f"difficulty_answer_counts.{difficulty}"):
+                increments[field] = increments.get(field, 0) + 1
+    
+    interview = await db.interviews.find_one_and_update(
+        {"id": interview_id, "answered_count": {"$exists": True}},
+        {"$inc": increments, "$set": {"last_difficulty": answers[-1][0]}},
+        projection={"_id": 0, "prefetched_questions": 0},
+        return_document=ReturnDocument.AFTER
+    )
+    if not interview:
+        interview = await backfill_answer_aggregates(interview_id, answers[-1][0])
+    return interview
+
+async def backfill_answer_aggregates(interview_id: str, last_difficulty: str) -> Dict[str, Any]:
+    """Build the running aggregates, once, for an interview started before they existed.
+    
+    Callers have already written their answers to db.questions, so the scan includes them.
+    """
+    questions = await db.questions.find(
+        {"interview_id": interview_id, "answer_text": {"$ne": None}},
+        {"_id": 0, "difficulty": 1, "score": 1, "evaluation_status": 1}
+    ).to_list(None)
+    aggregates: Dict[str, Any] = {
+        "answered_count": len(questions),
+        "score_sum": 0.0,
+        "pending_evaluations": 0,
+        "difficulty_score_sums": {},
+        "difficulty_answer_counts": {}
+    }
+    for question in questions:
+        difficulty = question.get('difficulty', "medium")
+        score = question.get('score') if question.get('evaluation_status') != "pending" else None
+        aggregates["pending_evaluations"] += question.get('evaluation_status') == "pending"
+        aggregates["score_sum"] += score or 0.0
+        sums, counts = aggregates["difficulty_score_sums"], aggregates["difficulty_answer_counts"]
+        sums[difficulty] = sums.get(difficulty, 0.0) + (score or 0.0)
+        counts[difficulty] = counts.get(difficulty, 0) + 1
+    
+    # The filter makes the backfill one-shot; a concurrent request that got there first wins
+    interview = await db.interviews.find_one_and_update(
+        {"id": interview_id, "answered_count": {"$exists": False}},
+        {"$set": {**aggregates, "last_difficulty": last_difficulty}},
+        projection={"_id": 0, "prefetched_questions": 0},
+        return_document=ReturnDocument.AFTER
+    )
+    if not interview:
+        interview = await db.interviews.find_one({"id": interview_id}, {"_id": 0, "prefetched_questions": 0})
+    if not interview:
+        raise HTTPException(status_code=404, detail="Interview not found")
+    return interview
+
+def scored_average(interview: Dict[str, Any]) -> Tuple[int, float]:
+    """Number of scored answers and their mean; answers pending evaluation are left out"""
+    scored = interview.get('answered_count', 0) - interview.get('pending_evaluations', 0)
+    return scored, interview.get('score_sum', 0.0) / max(scored, 1)
+
+# Evaluations still running when the request's budget runs out finish in the background and are
+# patched into db.questions; the response says the evaluation is pending
+EVALUATION_PENDING = {
+    "score": None,
+    "feedback": "Your answer has been recorded and is still being evaluated.",
+    "strengths": None,
+    "weaknesses": None,
+    "evaluation_status": "pending"
+}
+DEFERRED_EVALUATION_DRAIN = 10.0
+_deferred_evaluations: Dict[str, asyncio.Task] = {}
+
+async def await_evaluations(tasks: List[asyncio.Task], reserve: float = 0.0) -> List[Optional[Dict[str, Any]]]:
+    """Results of the evaluation tasks that finish within the remaining budget minus reserve,
+    None for those still running (which are left running)"""
+    remaining = deadlines.remaining(reserve)
+    if remaining is None:
+        return list(await asyncio.gather(*tasks))
+    if remaining > 0:
+        await asyncio.wait(tasks, timeout=remaining)
+    return [task.result() if task.done() else None for task in tasks]
+
+async def apply_deferred_evaluation(interview_id: str, question: Dict[str, Any], evaluation_id: str,
+                                    evaluation: asyncio.Task):
+    """Patch a finished evaluation into its question and the interview aggregates"""
+    try:
+        eval_data = await evaluation
+        # Matches only if the answer was not re-submitted in the meantime
+        previous = await db.questions.find_one_and_update(
+            {"id": question['id'], "evaluation_id": evaluation_id},
+            {"$set": {"score": eval_data['score'], "feedback": eval_data['feedback'], "evaluation_status": "done"}},
+            projection={"_id": 0, "answer_text": 1, "score": 1, "evaluation_status": 1}
+        )
+        if not previous:
+            DEFERRED_EVALUATIONS.inc("superseded")
+            return
+        interview = await record_answer_aggregates(interview_id, [(question['difficulty'], eval_data['score'], previous)])
+        await question_bank.record_scores([(question.get('bank_id'), eval_data['score'], previous)])
+        DEFERRED_EVALUATIONS.inc("applied")
+        # A report built while this answer was pending is rebuilt with its score
+        if interview['status'] in ("completed", "terminated"):
+            schedule_report(interview_id)
+    except Exception as e:
+        logging.error(f"Error applying deferred evaluation: {str(e)}")
+
+def defer_evaluation(interview_id: str, question: Dict[str, Any], evaluation_id: str, evaluation: asyncio.Task):
+    """Apply an evaluation after the response; call once the pending answer is stored"""
+    DEFERRED_EVALUATIONS.inc("deferred")
+    task = deadlines.spawn(apply_deferred_evaluation(interview_id, question, evaluation_id, evaluation))
+    _deferred_evaluations[evaluation_id] = task
+    task.add_done_callback(lambda t: _deferred_evaluations.pop(evaluation_id, None))
+
 async def generate_final_report(interview_id: str) -> InterviewReport:
     """Generate comprehensive interview report"""
     try:
@@ -281,21 +1074,38 @@ async def generate_final_report(interview_id: str) -> InterviewReport:
         if not interview:
             raise HTTPException(status_code=404, detail="Interview not found")
         
-        # Get all questions
-        questions = await db.questions.find({"interview_id": interview_id}, {"_id": 0}).to_list(100)
+        # Only the fields needed for the insights prompt
+        questions = await db.questions.find(
+            {"interview_id": interview_id},
+            {"_id": 0, "question_text": 1, "score": 1, "answer_text": 1}
+        ).sort("question_number", 1).to_list(100)
         
         if not questions:
             raise HTTPException(status_code=400, detail="No questions answered")
         
         # Calculate metrics
         total_questions = len(questions)
-        answered_questions = [q for q in questions if q.get('answer_text')]
-        questions_answered = len(answered_questions)
-        
-        if questions_answered == 0:
-            overall_score = 0.0
+        answered_questions = [q for q in questions if q.get('answer_text') is not None]
+        
+        if 'answered_count' in interview:
+            # Running aggregates maintained by submit_answer
+            questions_answered = interview['answered_count']
+            score_sum = interview.get('score_sum', 0.0)
+            # Answers still awaiting a deferred evaluation are averaged in once it lands
+            scored_answers = questions_answered - interview.get('pending_evaluations', 0)
         else:
-            overall_score = sum(q.get('score', 0) for q in answered_questions) / questions_answered
+            # Interviews created before aggregates existed
+            questions_answered = len(answered_questions)
+            score_sum = sum(q.get('score') or 0 for q in answered_questions)
+            scored_answers = questions_answered
+        
+        overall_score = score_sum / scored_answers if scored_answers else 0.0
+        
+        difficulty_counts = interview.get('difficulty_answer_counts') or {}
+        difficulty_scores = {
+            difficulty: round(interview['difficulty_score_sums'].get(difficulty, 0.0) / count, 2)
+            for difficulty, count in difficulty_counts.items() if count
+        }
         
         # Determine readiness level
         if overall_score >= 75:
@@ -314,12 +1124,6 @@ async def generate_final_report(interview_id: str) -> InterviewReport:
         }
         
         # Generate AI-powered insights
-        chat = LlmChat(
-            api_key=os.environ['EMERGENT_LLM_KEY'],
-            session_id=f"report_{interview_id}",
-            system_message="You are an interview coach providing actionable feedback."
-        ).with_model("openai", "gpt-5.2")
-        
         qa_summary = "\n".join([f"Q{i+1}: {q['question_text'][:100]}... Score: {q.get('score', 0)}" 
                                 for i, q in enumerate(answered_questions)])
         
@@ -334,23 +1138,33 @@ Provide:
 
 Respond in JSON: {{"strengths": ["s1", "s2", "s3"], "weaknesses": ["w1", "w2", "w3"], "recommendations": ["r1", "r2", "r3"]}}"""
         
-        message = UserMessage(text=prompt)
-        response = await chat.send_message(message)
-        
+        insights = None
         try:
-            insights = json.loads(response)
-        except:
+            response = await llm_gateway.complete(
+                "report",
+                f"report_{interview_id}",
+                "You are an interview coach providing actionable feedback.",
+                prompt
+            )
+            try:
+                insights = json.loads(response)
+            except ValueError:
+                FALLBACKS.inc("report", "invalid_json")
+        except Exception as e:
+            logging.error(f"Error generating report insights: {str(e)}")
+            FALLBACKS.inc("report", fallback_reason(e))
+        if insights is None:
             insights = {
                 "strengths": ["Completed interview", "Provided answers", "Engaged with questions"],
                 "weaknesses": ["Need more technical depth", "Time management", "Answer clarity"],
                 "recommendations": ["Practice more", "Study core concepts", "Work on communication"]
             }
         
-        # Update interview
+        # Update interview; a terminated interview keeps its status
         await db.interviews.update_one(
             {"id": interview_id},
             {"$set": {
-                "status": "completed",
+                "status": "terminated" if interview.get('status') == "terminated" else "completed",
                 "overall_score": overall_score,
                 "readiness_level": readiness_level,
                 "completed_at": datetime.now(timezone.utc).isoformat()
@@ -364,6 +1178,7 @@ Respond in JSON: {{"strengths": ["s1", "s2", "s3"], "weaknesses": ["w1", "w2", "
             total_questions=total_questions,
             questions_answered=questions_answered,
             skill_scores=skill_scores,
+            difficulty_scores=difficulty_scores,
             strengths=insights['strengths'],
             weaknesses=insights['weaknesses'],
             recommendations=insights['recommendations']
@@ -371,10 +1186,166 @@ Respond in JSON: {{"strengths": ["s1", "s2", "s3"], "weaknesses": ["w1", "w2", "
         
         return report
         
+    except HTTPException:
+        raise
     except Exception as e:
         logging.error(f"Error generating report: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+# Materialized reports: generated once when the interview ends, then served from db.reports
+_report_tasks: Dict[str, asyncio.Task] = {}
+
+async def materialize_report(interview_id: str) -> Dict[str, Any]:
+    """Generate the report and persist it together with its ETag"""
+    report = jsonable_encoder(await generate_final_report(interview_id))
+    digest = hashlib.sha256(json.dumps(report, sort_keys=True).encode()).hexdigest()[:32]
+    stored = {
+        "interview_id": interview_id,
+        "report": report,
+        "etag": f'"{digest}"',
+        "generated_at": datetime.now(timezone.utc).isoformat()
+    }
+    await db.reports.update_one({"interview_id": interview_id}, {"$set": stored}, upsert=True)
+    return stored
+
+async def _materialize_report_in_background(interview_id: str) -> Optional[Dict[str, Any]]:
+    try:
+        return await materialize_report(interview_id)
+    except Exception as e:
+        logging.error(f"Error materializing report: {str(e)}")
+        return None
+
+def schedule_report(interview_id: str):
+    """Build the report in the background so the first GET is already a single lookup"""
+    task = deadlines.spawn(_materialize_report_in_background(interview_id))
+    _report_tasks[interview_id] = task
+    task.add_done_callback(
+        lambda t: _report_tasks.pop(interview_id, None) if _report_tasks.get(interview_id) is t else None
+    )
+
+# MongoDB indexes backing every non-_id lookup in the routes above and below
+MONGO_INDEXES = {
+    "interviews": [
+        ([("id", 1)], {"unique": True}),
+        ([("created_at", -1), ("id", -1)], {}),
+        ([("status", 1), ("created_at", -1), ("id", -1)], {}),
+    ],
+    "questions": [
+        ([("interview_id", 1), ("question_number", 1)], {}),
+        ([("id", 1)], {}),
+    ],
+    "drafts": [
+        ([("interview_id", 1), ("question_id", 1)], {"unique": True}),
+    ],
+    "reports": [
+        ([("interview_id", 1)], {"unique": True}),
+    ],
+    "resume_parse_cache": [
+        ([("text_hash", 1), ("version", 1)], {"unique": True}),
+        ([("created_at", 1)], {"expireAfterSeconds": int(RESUME_CACHE_TTL)}),
+    ],
+    "traces": [
+        ([("duration_ms", -1)], {}),
+    ],
+    "jd_parse_cache": [
+        ([("text_hash", 1), ("version", 1)], {"unique": True}),
+        ([("created_at", 1)], {"expireAfterSeconds": int(RESUME_CACHE_TTL)}),
+    ],
+    "resume_parse_jobs": [
+        ([("id", 1)], {"unique": True}),
+        ([("status", 1), ("next_attempt_at", 1)], {}),
+        ([("status", 1), ("locked_until", 1)], {}),
+        ([("interview_id", 1), ("status", 1)], {}),
+        ([("status", 1), ("updated_at", -1)], {}),
+    ],
+    "onboarding_jobs": [
+        ([("id", 1)], {"unique": True}),
+    ],
+    "idempotency_keys": [
+        ([("key", 1)], {"unique": True}),
+        ([("created_at", 1)], {"expireAfterSeconds": IDEMPOTENCY_TTL}),
+    ],
+    "question_bank": [
+        ([("id", 1)], {"unique": True}),
+        ([("profile_key", 1), ("difficulty", 1), ("served_count", 1)], {}),
+        ([("created_at", 1)], {"expireAfterSeconds": int(QUESTION_BANK_MAX_AGE)}),
+    ],
+}
+
+# Representative query shapes issued by the routes, checked against their query plans
+ROUTE_QUERY_SHAPES = [
+    ("interviews", {"id": "probe"}, None),
+    ("interviews", {}, [("created_at", -1), ("id", -1)]),
+    ("interviews", {"status": "completed", "created_at": {"$lt": "probe"}}, [("created_at", -1), ("id", -1)]),
+    ("interviews", {"status": "completed"}, None),
+    ("questions", {"interview_id": "probe"}, None),
+    ("questions", {"id": "probe", "interview_id": "probe"}, None),
+    ("questions", {"interview_id": "probe"}, [("question_number", 1)]),
+    ("drafts", {"interview_id": "probe", "question_id": "probe"}, None),
+    ("reports", {"interview_id": "probe"}, None),
+    ("resume_parse_cache", {"text_hash": "probe", "version": RESUME_PARSE_VERSION}, None),
+    ("traces", {}, [("duration_ms", -1)]),
+    ("jd_parse_cache", {"text_hash": "probe", "version": JD_PARSE_VERSION}, None),
+    ("resume_parse_jobs", {"id": "probe"}, None),
+    ("resume_parse_jobs", {"status": "pending", "next_attempt_at": {"$lte": "probe"}}, [("next_attempt_at", 1)]),
+    ("resume_parse_jobs", {"status": "parsing", "locked_until": {"$lt": "probe"}}, None),
+    ("resume_parse_jobs", {"interview_id": "probe", "status": {"$in": ["pending", "parsing"]}}, None),
+    ("resume_parse_jobs", {"status": "dead"}, [("updated_at", -1)]),
+    ("onboarding_jobs", {"id": "probe"}, None),
+    ("idempotency_keys", {"key": "probe"}, None),
+    ("question_bank", {"profile_key": "probe", "difficulty": "easy", "served_count": {"$lt": 1}},
+     [("served_count", 1)]),
+]
+
+# Slow request traces: a capped collection so old traces age out on their own
+TRACE_SLOW_MS = float(os.environ.get('TRACE_SLOW_MS', 1000))
+TRACE_COLLECTION_BYTES = int(os.environ.get('TRACE_COLLECTION_BYTES', 16 * 1024 * 1024))
+
+async def ensure_traces_collection():
+    """Create the capped traces collection if it does not exist yet"""
+    try:
+        if "traces" not in await db.list_collection_names():
+            await db.create_collection("traces", capped=True, size=TRACE_COLLECTION_BYTES)
+    except Exception as e:
+        logging.error(f"Error creating traces collection: {str(e)}")
+
+async def store_slow_trace(trace: Dict[str, Any]):
+    """Persist the trace of a request slower than TRACE_SLOW_MS"""
+    trace["id"] = str(uuid.uuid4())
+    trace["created_at"] = datetime.now(timezone.utc).isoformat()
+    await db.traces.insert_one(trace)
+
+async def ensure_indexes():
+    """Create the indexes in MONGO_INDEXES; existing indexes are left untouched"""
+    for collection, indexes in MONGO_INDEXES.items():
+        for keys, options in indexes:
+            try:
+                await db[collection].create_index(keys, **options)
+            except Exception as e:
+                logging.error(f"Error creating index {keys} on {collection}: {str(e)}")
+
+def _plan_stages(plan: Dict[str, Any]) -> List[str]:
+    """Flatten the stage names of an explain() plan tree"""
+    stages = [plan.get("stage", "")]
+    if plan.get("inputStage"):
+        stages += _plan_stages(plan["inputStage"])
+    for child in plan.get("inputStages", []):
+        stages += _plan_stages(child)
+    return stages
+
+async def find_collscans() -> List[Dict[str, Any]]:
+    """Explain each route query shape and return the ones whose winning plan scans the collection"""
+    offenders = []
+    for collection, query, sort in ROUTE_QUERY_SHAPES:
+        cursor = db[collection].find(query)
+        if sort:
+            cursor = cursor.sort(sort)
+        explain = await cursor.explain()
+        stages = _plan_stages(explain["queryPlanner"]["winningPlan"])
+        if "COLLSCAN" in stages:
+            offenders.append({"collection": collection, "query": query, "sort": sort, "stages": stages})
+    return offenders
+
 # API Routes
 @api_router.post("/interviews", response_model=Interview)
 async def create_interview(data: InterviewCreate):
@@ -390,6 +1361,272 @@ async def create_interview(data: InterviewCreate):
     await db.interviews.insert_one(doc)
     return interview
 
+# Resume parse jobs: upload_resume queues the LLM parse and workers claim jobs from MongoDB
+RESUME_PARSE_IN_PROCESS = os.environ.get('RESUME_PARSE_IN_PROCESS', 'true').lower() == 'true'
+RESUME_PARSE_WORKERS = int(os.environ.get('RESUME_PARSE_WORKERS', 4))
+RESUME_PARSE_MAX_ATTEMPTS = int(os.environ.get('RESUME_PARSE_MAX_ATTEMPTS', 4))
+RESUME_PARSE_BACKOFF = float(os.environ.get('RESUME_PARSE_BACKOFF', 2))
+RESUME_PARSE_BACKOFF_MAX = 60.0
+RESUME_PARSE_LEASE = 120.0
+RESUME_PARSE_POLL_INTERVAL = 1.0
+RESUME_PARSE_WAIT = float(os.environ.get('RESUME_PARSE_WAIT', 30))
+ACTIVE_PARSE_STATUSES = ("pending", "parsing")
+
+class ResumeParseQueue:
+    """Durable resume parse jobs in db.resume_parse_jobs.
+
+    Workers claim a job by leasing it; a lease left behind by a crashed worker
+    expires and the job is picked up again. Failed attempts are retried with
+    exponential backoff until max_attempts, then the job is dead-lettered.
+    """
+
+    def __init__(self, workers: int, max_attempts: int, backoff: float, lease: float, poll_interval: float):
+        self.workers = workers
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.lease = lease
+        self.poll_interval = poll_interval
+        self.stats = {"enqueued": 0, "done": 0, "retried": 0, "dead": 0}
+        self._tasks: List[asyncio.Task] = []
+        self._wakeup = asyncio.Event()
+
+    async def enqueue(self, interview_id: str) -> Dict[str, Any]:
+        now = datetime.now(timezone.utc)
+        job = {
+            "id": str(uuid.uuid4()),
+            "interview_id": interview_id,
+            "status": "pending",
+            "attempts": 0,
+            "max_attempts": self.max_attempts,
+            "next_attempt_at": now,
+            "locked_until": None,
+            "error": None,
+            "created_at": now,
+            "updated_at": now
+        }
+        # A new upload supersedes any parse still queued for the interview
+        await db.resume_parse_jobs.update_many(
+            {"interview_id": interview_id, "status": {"$in": list(ACTIVE_PARSE_STATUSES)}},
+            {"$set": {"status": "superseded", "updated_at": now}}
+        )
+        # Point the interview at the job before a worker can see it
+        await db.interviews.update_one(
+            {"id": interview_id},
+            {"$set": {"resume_parse_status": "pending", "resume_parse_job_id": job["id"], "resume_parse_error": None}}
+        )
+        await db.resume_parse_jobs.insert_one(dict(job))
+        self.stats["enqueued"] += 1
+        self._wakeup.set()
+        return job
+
+    @staticmethod
+    def claimable(now: datetime) -> Dict[str, Any]:
+        """Jobs due for a first attempt or a retry, plus jobs whose worker's lease ran out"""
+        return {"$or": [
+            {"status": "pending", "next_attempt_at": {"$lte": now}},
+            {"status": "parsing", "locked_until": {"$lt": now}},
+        ]}
+    
+    def claim_update(self, now: datetime) -> Dict[str, Any]:
+        return {
+            "$set": {"status": "parsing", "locked_until": now + timedelta(seconds=self.lease), "updated_at": now},
+            "$inc": {"attempts": 1}
+        }
+    
+    async def claim(self) -> Optional[Dict[str, Any]]:
+        now = datetime.now(timezone.utc)
+        return await db.resume_parse_jobs.find_one_and_update(
+            self.claimable(now),
+            self.claim_update(now),
+            sort=[("next_attempt_at", 1)],
+            projection={"_id": 0},
+            return_document=ReturnDocument.AFTER
+        )
+
+    async def _set_job(self, job: Dict[str, Any], fields: Dict[str, Any]):
+        await db.resume_parse_jobs.update_one(
+            {"id": job["id"], "status": "parsing"},
+            {"$set": {**fields, "locked_until": None, "updated_at": datetime.now(timezone.utc)}}
+        )
+
+    async def process(self, job: Dict[str, Any]):
+        # Writes only land while the interview still points at this job
+        current = {"id": job["interview_id"], "resume_parse_job_id": job["id"]}
+        interview = await db.interviews.find_one_and_update(
+            current, {"$set": {"resume_parse_status": "parsing"}}, projection={"_id": 0, "resume_text": 1}
+        )
+        if not interview:
+            await self._set_job(job, {"status": "superseded"})
+            return
+        
+        try:
+            parsed_data = await parse_resume_cached(interview.get('resume_text') or "", strict=True)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            await self._fail(job, current, str(e))
+            return
+        
+        await db.interviews.update_one(current, {"$set": {
+            "parsed_skills": parsed_data.get('skills', []),
+            "parsed_experience": parsed_data.get('experience_years', 'Unknown'),
+            "resume_parse_status": "done",
+            "resume_parse_error": None
+        }})
+        await self._set_job(job, {"status": "done", "error": None})
+        self.stats["done"] += 1
+        schedule_first_question(job["interview_id"])
+
+    async def _fail(self, job: Dict[str, Any], current: Dict[str, Any], error: str):
+        if job["attempts"] >= job.get("max_attempts", self.max_attempts):
+            logging.error(f"Resume parse job {job['id']} dead-lettered after {job['attempts']} attempts: {error}")
+            await self._set_job(job, {"status": "dead", "error": error})
+            # The interview can still start, with the skills the local extractor finds in the resume
+            interview = await db.interviews.find_one(current, {"_id": 0, "resume_text": 1}) or {}
+            await db.interviews.update_one(current, {"$set": {
+                "parsed_skills": skill_extractor.extract(interview.get('resume_text') or ""),
+                "parsed_experience": "Unknown",
+                "resume_parse_status": "failed",
+                "resume_parse_error": error
+            }})
+            self.stats["dead"] += 1
+            schedule_first_question(job["interview_id"])
+            return
+        
+        delay = min(self.backoff * 2 ** (job["attempts"] - 1), RESUME_PARSE_BACKOFF_MAX)
+        delay *= random.uniform(0.5, 1.0)
+        await self._set_job(job, {
+            "status": "pending",
+            "error": error,
+            "next_attempt_at": datetime.now(timezone.utc) + timedelta(seconds=delay)
+        })
+        await db.interviews.update_one(current, {"$set": {"resume_parse_status": "pending", "resume_parse_error": error}})
+        self.stats["retried"] += 1
+
+    async def retry(self, job_id: str) -> bool:
+        """Requeue a dead-lettered job with a fresh attempt budget"""
+        job = await db.resume_parse_jobs.find_one_and_update(
+            {"id": job_id, "status": "dead"},
+            {"$set": {
+                "status": "pending",
+                "attempts": 0,
+                "next_attempt_at": datetime.now(timezone.utc),
+                "updated_at": datetime.now(timezone.utc)
+            }},
+            projection={"_id": 0, "interview_id": 1}
+        )
+        if not job:
+            return False
+        await db.interviews.update_one(
+            {"id": job["interview_id"], "resume_parse_job_id": job_id},
+            {"$set": {"resume_parse_status": "pending"}}
+        )
+        self._wakeup.set()
+        return True
+
+    async def _run(self):
+        while True:
+            try:
+                job = await self.claim()
+                if job:
+                    await self.process(job)
+                    continue
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logging.error(f"Error in resume parse worker: {str(e)}")
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+
+    def start(self):
+        if not self._tasks:
+            self._tasks = [asyncio.create_task(self._run()) for _ in range(self.workers)]
+
+    async def stop(self):
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+resume_parse_queue = ResumeParseQueue(
+    workers=RESUME_PARSE_WORKERS,
+    max_attempts=RESUME_PARSE_MAX_ATTEMPTS,
+    backoff=RESUME_PARSE_BACKOFF,
+    lease=RESUME_PARSE_LEASE,
+    poll_interval=RESUME_PARSE_POLL_INTERVAL
+)
+
+async def wait_for_resume_parse(interview_id: str, timeout: float = RESUME_PARSE_WAIT) -> Dict[str, Any]:
+    """Poll until the interview's resume parse has finished, or raise 409 after timeout seconds"""
+    deadline = time.monotonic() + timeout
+    while True:
+        interview = await db.interviews.find_one({"id": interview_id}, {"_id": 0, "prefetched_questions": 0})
+        if not interview:
+            raise HTTPException(status_code=404, detail="Interview not found")
+        if interview.get('resume_parse_status') not in ACTIVE_PARSE_STATUSES:
+            return interview
+        if time.monotonic() >= deadline:
+            raise HTTPException(status_code=409, detail="Resume is still being parsed, please retry shortly")
+        await asyncio.sleep(0.5)
+
+@api_router.get("/interviews/{interview_id}/resume-parse")
+async def get_resume_parse_status(interview_id: str):
+    """Get the status of the interview's resume parse"""
+    interview = await db.interviews.find_one(
+        {"id": interview_id},
+        {"_id": 0, "resume_parse_status": 1, "resume_parse_job_id": 1, "resume_parse_error": 1,
+         "parsed_skills": 1, "parsed_experience": 1}
+    )
+    if not interview:
+        raise HTTPException(status_code=404, detail="Interview not found")
+    
+    job = None
+    if interview.get('resume_parse_job_id'):
+        job = await db.resume_parse_jobs.find_one(
+            {"id": interview['resume_parse_job_id']},
+            {"_id": 0, "attempts": 1, "max_attempts": 1, "next_attempt_at": 1}
+        )
+    status = interview.get('resume_parse_status') or ("done" if interview.get('parsed_skills') is not None else None)
+    return {
+        "status": status,
+        "job_id": interview.get('resume_parse_job_id'),
+        "attempts": job["attempts"] if job else None,
+        "max_attempts": job["max_attempts"] if job else None,
+        "next_attempt_at": job["next_attempt_at"] if job and status == "pending" else None,
+        "error": interview.get('resume_parse_error'),
+        "parsed_data": {
+            "skills": interview.get('parsed_skills') or [],
+            "experience_years": interview.get('parsed_experience')
+        } if status in ("done", "failed") else None
+    }
+
+@api_router.get("/admin/resume-parse-jobs/stats")
+async def get_resume_parse_job_stats():
+    """Get resume parse job counts by status"""
+    counts = await db.resume_parse_jobs.aggregate([
+        {"$group": {"_id": "$status", "count": {"$sum": 1}}}
+    ]).to_list(None)
+    return {
+        "by_status": {entry["_id"]: entry["count"] for entry in counts},
+        "workers": len(resume_parse_queue._tasks),
+        **resume_parse_queue.stats
+    }
+
+@api_router.get("/admin/resume-parse-jobs/dead")
+async def get_dead_resume_parse_jobs(limit: int = Query(50, ge=1, le=500)):
+    """List dead-lettered resume parse jobs"""
+    return await db.resume_parse_jobs.find({"status": "dead"}, {"_id": 0}).sort("updated_at", -1).to_list(limit)
+
+@api_router.post("/admin/resume-parse-jobs/{job_id}/retry")
+async def retry_resume_parse_job(job_id: str):
+    """Requeue a dead-lettered resume parse job"""
+    if not await resume_parse_queue.retry(job_id):
+        raise HTTPException(status_code=404, detail="Dead-lettered job not found")
+    return {"success": True}
+
 @api_router.post("/interviews/{interview_id}/upload-resume")
 async def upload_resume(
     interview_id: str,
@@ -405,38 +1642,55 @@ async def upload_resume(
         # Read file
         content = await file.read()
         
-        # Extract text based on file type
-        filename = file.filename.lower()
-        if filename.endswith('.pdf'):
-            resume_text = extract_text_from_pdf(content)
-        elif filename.endswith('.docx'):
-            resume_text = extract_text_from_docx(content)
-        elif filename.endswith('.txt'):
-            resume_text = content.decode('utf-8')
-        else:
-            raise HTTPException(status_code=400, detail="Unsupported file format")
+        # Extract text in the process pool so parsing doesn't block the event loop
+        with tracing.span("extract"):
+            resume_text = await extraction_service.extract(file.filename, content)
         
         if not resume_text.strip():
             raise HTTPException(status_code=400, detail="Could not extract text from resume")
         
-        # Parse resume with AI
-        parsed_data = await parse_resume_with_ai(resume_text)
+        # A new resume makes a pregenerated first question stale
+        cancel_prefetch(interview_id)
         
-        # Update interview
+        # A previously seen resume is answered from the parse cache right away
+        parsed_data = await lookup_resume_parse(normalized_text_hash(resume_text))
+        if parsed_data is not None:
+            parsed_data = checked_resume_parse(resume_text, parsed_data)
+            await db.interviews.update_one(
+                {"id": interview_id},
+                {"$set": {
+                    "resume_text": resume_text,
+                    "parsed_skills": parsed_data.get('skills', []),
+                    "parsed_experience": parsed_data.get('experience_years', 'Unknown'),
+                    "resume_parse_status": "done",
+                    "resume_parse_job_id": None,
+                    "resume_parse_error": None
+                }, "$unset": RESET_PREGENERATION}
+            )
+            schedule_first_question(interview_id)
+            return {
+                "success": True,
+                "parsed_data": parsed_data,
+                "resume_parse_status": "done",
+                "message": "Resume uploaded and parsed successfully"
+            }
+        
+        # Anything else is parsed by the job queue so the request doesn't wait on the LLM;
+        # until it finishes the interview has the skills found locally in the text
+        local_skills = skill_extractor.extract(resume_text)
         await db.interviews.update_one(
             {"id": interview_id},
-            {"$set": {
-                "resume_text": resume_text,
-                "parsed_skills": parsed_data.get('skills', []),
-                "parsed_experience": parsed_data.get('experience_years', 'Unknown')
-            }}
+            {"$set": {"resume_text": resume_text, "parsed_skills": local_skills, "parsed_experience": None},
+             "$unset": RESET_PREGENERATION}
         )
-        
-        return {
+        job = await resume_parse_queue.enqueue(interview_id)
+        return JSONResponse(status_code=202, content={
             "success": True,
-            "parsed_data": parsed_data,
-            "message": "Resume uploaded and parsed successfully"
-        }
+            "job_id": job["id"],
+            "skills": local_skills,
+            "resume_parse_status": "pending",
+            "message": "Resume uploaded, parsing in progress"
+        })
         
     except HTTPException:
         raise
@@ -445,6 +1699,7 @@ async def upload_resume(
         raise HTTPException(status_code=500, detail=str(e))
 
 @api_router.post("/interviews/{interview_id}/upload-jd")
+@deadlines.with_budget(ENDPOINT_DEADLINES["upload_jd"])
 async def upload_jd(
     interview_id: str,
     jd_text: str = Form(...)
@@ -452,33 +1707,291 @@ async def upload_jd(
     """Upload job description"""
     try:
         # Check interview exists
-        interview = await db.interviews.find_one({"id": interview_id}, {"_id": 0})
+        interview = await db.interviews.find_one({"id": interview_id}, {"_id": 0, "id": 1})
         if not interview:
             raise HTTPException(status_code=404, detail="Interview not found")
         
-        # Update interview
+        # Reduce the JD to its requirements once, shared by every interview with the same JD
+        requirements = await parse_jd_cached(jd_text)
+        
+        # Update interview; a question pregenerated for the previous JD is stale
+        cancel_prefetch(interview_id)
         await db.interviews.update_one(
             {"id": interview_id},
-            {"$set": {"jd_text": jd_text}}
+            {"$set": {"jd_text": jd_text, "jd_requirements": requirements}, "$unset": RESET_PREGENERATION}
         )
+        interview_jd_cache.set(interview_id, jd_text)
+        schedule_first_question(interview_id)
         
-        return {"success": True, "message": "Job description uploaded successfully"}
+        return {
+            "success": True,
+            "jd_requirements": requirements,
+            "message": "Job description uploaded successfully"
+        }
         
+    except HTTPException:
+        raise
     except Exception as e:
         logging.error(f"Error uploading JD: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+# Bulk onboarding: a ZIP of resumes plus a CSV of candidates, processed as a background job
+BULK_MAX_ENTRIES = int(os.environ.get('BULK_ONBOARDING_MAX_ENTRIES', 1000))
+BULK_CONCURRENCY = int(os.environ.get('BULK_ONBOARDING_CONCURRENCY', 16))
+BULK_INSERT_BATCH = 100
+BULK_PROGRESS_EVERY = 20
+BULK_MAX_ERRORS = 200
+_onboarding_tasks: Dict[str, asyncio.Task] = {}
+
+def read_candidate_csv(content: bytes) -> Dict[str, Dict[str, str]]:
+    """Map each resume file name (lower-cased, without folders) to its candidate's name and email"""
+    try:
+        reader = csv.DictReader(io.StringIO(content.decode('utf-8-sig')))
+        rows = [
+            {(key or "").strip().lower(): (value or "").strip() for key, value in row.items()}
+            for row in reader
+        ]
+    except (UnicodeDecodeError, csv.Error):
+        raise HTTPException(status_code=400, detail="Candidates file must be a UTF-8 CSV")
+    if not {"filename", "name", "email"} <= {(field or "").strip().lower() for field in reader.fieldnames or []}:
+        raise HTTPException(status_code=400, detail="CSV must have filename, name and email columns")
+    return {
+        os.path.basename(row["filename"]).lower(): {"name": row["name"], "email": row["email"]}
+        for row in rows if row.get("filename")
+    }
+
+def resume_entries(archive: zipfile.ZipFile) -> List[zipfile.ZipInfo]:
+    """Files in the archive, skipping folders and OS metadata"""
+    return [
+        info for info in archive.infolist()
+        if not info.is_dir()
+        and not info.filename.startswith("__MACOSX/")
+        and not os.path.basename(info.filename).startswith(".")
+    ]
+
+def spool_to_disk(source) -> str:
+    """Copy an uploaded file to a temporary file that outlives the request"""
+    with tempfile.NamedTemporaryFile(suffix=".zip", delete=False) as target:
+        shutil.copyfileobj(source, target, 1024 * 1024)
+    return target.name
+
+async def extract_with_backoff(filename: str, content: bytes, attempts: int = 5) -> str:
+    """Extract text, waiting and retrying while the extraction queue is full"""
+    for attempt in range(attempts):
+        try:
+            return await extraction_service.extract(filename, content)
+        except HTTPException as e:
+            if e.status_code != 503 or attempt == attempts - 1:
+                raise
+            await asyncio.sleep(0.5 * (attempt + 1))
+
+async def onboard_candidate(filename: str, content: bytes, candidate: Dict[str, str], jd_text: str,
+                            jd_requirements: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Extract and parse one resume and build its interview document"""
+    resume_text = await extract_with_backoff(filename, content)
+    if not resume_text.strip():
+        raise HTTPException(status_code=400, detail="Could not extract text from resume")
+    parsed_data = await parse_resume_cached(resume_text)
+    
+    interview = Interview(
+        candidate_name=candidate["name"],
+        candidate_email=candidate["email"],
+        resume_text=resume_text,
+        jd_text=jd_text,
+        jd_requirements=jd_requirements,
+        parsed_skills=parsed_data.get('skills', []),
+        parsed_experience=parsed_data.get('experience_years', 'Unknown')
+    )
+    doc = interview.model_dump()
+    doc['created_at'] = doc['created_at'].isoformat()
+    return doc
+
+async def run_onboarding_job(job_id: str, archive_path: str, candidates: Dict[str, Dict[str, str]], jd_text: str):
+    """Stream resumes out of the archive through a bounded pool of workers and insert interviews in batches"""
+    progress = {"processed": 0, "succeeded": 0, "failed": 0}
+    errors: List[Dict[str, str]] = []
+    pending: List[Dict[str, Any]] = []
+    # Bounded, so the archive is only read as fast as workers can take entries
+    queue: asyncio.Queue = asyncio.Queue(maxsize=BULK_CONCURRENCY * 2)
+    
+    def fail(filename: str, detail: str):
+        progress["failed"] += 1
+        if len(errors) < BULK_MAX_ERRORS:
+            errors.append({"file": filename, "error": detail})
+    
+    async def save_progress(**fields):
+        await db.onboarding_jobs.update_one(
+            {"id": job_id}, {"$set": {**progress, "errors": errors, **fields}}
+        )
+    
+    async def flush():
+        batch = pending[:]
+        pending.clear()
+        if batch:
+            await db.interviews.insert_many(batch, ordered=False)
+            await db.onboarding_jobs.update_one(
+                {"id": job_id}, {"$push": {"interview_ids": {"$each": [doc['id'] for doc in batch]}}}
+            )
+    
+    async def produce():
+        seen = set()
+        try:
+            with zipfile.ZipFile(archive_path) as archive:
+                for info in resume_entries(archive)[:BULK_MAX_ENTRIES]:
+                    name = os.path.basename(info.filename).lower()
+                    seen.add(name)
+                    if info.file_size > extraction_service.max_bytes:
+                        fail(info.filename, "File too large")
+                        continue
+                    try:
+                        # Only one member is decompressed into memory at a time
+                        content = await asyncio.to_thread(archive.read, info)
+                    except (zipfile.BadZipFile, zipfile.LargeZipFile, NotImplementedError, RuntimeError) as e:
+                        fail(info.filename, f"Unreadable archive entry: {str(e)}")
+                        continue
+                    await queue.put((info.filename, name, content))
+        finally:
+            for _ in range(BULK_CONCURRENCY):
+                await queue.put(None)
+        for name in candidates.keys() - seen:
+            fail(name, "No resume in archive for this CSV row")
+    
+    async def consume():
+        while (item := await queue.get()) is not None:
+            filename, name, content = item
+            try:
+                if name not in candidates:
+                    raise HTTPException(status_code=400, detail="No CSV row for this resume")
+                pending.append(await onboard_candidate(filename, content, candidates[name], jd_text, jd_requirements))
+                progress["succeeded"] += 1
+                if len(pending) >= BULK_INSERT_BATCH:
+                    await flush()
+            except HTTPException as e:
+                fail(filename, str(e.detail))
+            except Exception as e:
+                logging.error(f"Error onboarding {filename}: {str(e)}")
+                fail(filename, str(e))
+            progress["processed"] += 1
+            if progress["processed"] % BULK_PROGRESS_EVERY == 0:
+                await save_progress()
+    
+    try:
+        await save_progress(status="running")
+        jd_requirements = await parse_jd_cached(jd_text)
+        await asyncio.gather(produce(), *[consume() for _ in range(BULK_CONCURRENCY)])
+        await flush()
+        await save_progress(status="completed", completed_at=datetime.now(timezone.utc).isoformat())
+    except asyncio.CancelledError:
+        await save_progress(status="cancelled", completed_at=datetime.now(timezone.utc).isoformat())
+        raise
+    except Exception as e:
+        logging.error(f"Error in onboarding job {job_id}: {str(e)}")
+        await save_progress(status="failed", error=str(e), completed_at=datetime.now(timezone.utc).isoformat())
+    finally:
+        os.unlink(archive_path)
+
+@api_router.post("/onboarding/bulk", status_code=202)
+async def bulk_onboard(
+    archive: UploadFile = File(...),
+    candidates: UploadFile = File(...),
+    jd_text: str = Form(...)
+):
+    """Create interviews for every resume in a ZIP archive, matched to a CSV of filename,name,email"""
+    candidate_rows = read_candidate_csv(await candidates.read())
+    if not candidate_rows:
+        raise HTTPException(status_code=400, detail="No candidates in CSV")
+    
+    # The upload is closed when this request returns, so the job reads its own copy
+    archive_path = await asyncio.to_thread(spool_to_disk, archive.file)
+    try:
+        with zipfile.ZipFile(archive_path) as zipped:
+            total = len(resume_entries(zipped))
+    except zipfile.BadZipFile:
+        os.unlink(archive_path)
+        raise HTTPException(status_code=400, detail="Archive must be a ZIP file")
+    if total > BULK_MAX_ENTRIES:
+        os.unlink(archive_path)
+        raise HTTPException(status_code=413, detail=f"Archive has more than {BULK_MAX_ENTRIES} resumes")
+    
+    job = {
+        "id": str(uuid.uuid4()),
+        "status": "queued",
+        "total": total,
+        "candidates": len(candidate_rows),
+        "processed": 0,
+        "succeeded": 0,
+        "failed": 0,
+        "errors": [],
+        "interview_ids": [],
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "completed_at": None
+    }
+    await db.onboarding_jobs.insert_one(dict(job))
+    
+    task = asyncio.create_task(run_onboarding_job(job["id"], archive_path, candidate_rows, jd_text))
+    _onboarding_tasks[job["id"]] = task
+    task.add_done_callback(lambda t: _onboarding_tasks.pop(job["id"], None))
+    return job
+
+@api_router.get("/onboarding/jobs/{job_id}")
+async def get_onboarding_job(job_id: str):
+    """Get the progress of a bulk onboarding job"""
+    job = await db.onboarding_jobs.find_one({"id": job_id}, {"_id": 0})
+    if not job:
+        raise HTTPException(status_code=404, detail="Onboarding job not found")
+    return job
+
+def resume_data_from(interview: Dict[str, Any]) -> Dict[str, Any]:
+    """Candidate context passed to question generation"""
+    return {
+        "skills": interview.get('parsed_skills', []),
+        "experience_years": interview.get('parsed_experience', 'Unknown')
+    }
+
+async def save_question(interview_id: str, question_number: int, difficulty: str,
+                        question_data: Dict[str, Any]) -> QuestionResponse:
+    """Persist a generated question and return it"""
+    question = QuestionResponse(
+        interview_id=interview_id,
+        question_number=question_number,
+        question_text=question_data['question'],
+        difficulty=difficulty,
+        time_allocated=question_data.get('time_allocated', 180),
+        bank_id=question_data.get('bank_id')
+    )
+    
+    doc = question.model_dump()
+    doc['created_at'] = doc['created_at'].isoformat()
+    await db.questions.insert_one(doc)
+    if question.bank_id:
+        await question_bank.mark_served(question.bank_id, interview_id)
+    return question
+
+async def load_startable_interview(interview_id: str) -> Dict[str, Any]:
+    """Fetch an interview that has everything needed to start"""
+    interview = await db.interviews.find_one({"id": interview_id}, {"_id": 0, "prefetched_questions": 0})
+    if not interview:
+        raise HTTPException(status_code=404, detail="Interview not found")
+    
+    if not interview.get('resume_text') or not interview.get('jd_text'):
+        raise HTTPException(status_code=400, detail="Resume and JD required")
+    
+    # Questions are tailored to the parsed profile, so wait for a queued parse to finish
+    if interview.get('resume_parse_status') in ACTIVE_PARSE_STATUSES:
+        interview = await wait_for_resume_parse(interview_id)
+    interview_jd_cache.set(interview_id, interview['jd_text'])
+    return interview
+
 @api_router.post("/interviews/{interview_id}/start")
+@admission.admit(ADMISSION_LIMITERS["start_interview"])
+@deadlines.with_budget(ENDPOINT_DEADLINES["start_interview"])
 async def start_interview(interview_id: str):
     """Start interview and get first question"""
     try:
-        # Get interview
-        interview = await db.interviews.find_one({"id": interview_id}, {"_id": 0})
-        if not interview:
-            raise HTTPException(status_code=404, detail="Interview not found")
+        interview = await load_startable_interview(interview_id)
         
-        if not interview.get('resume_text') or not interview.get('jd_text'):
-            raise HTTPException(status_code=400, detail="Resume and JD required")
+        # Normally the first question was pregenerated during setup and this is only DB work
+        question_data = await take_prefetched_question(interview_id, 1, "easy")
         
         # Update status
         await db.interviews.update_one(
@@ -487,27 +2000,16 @@ async def start_interview(interview_id: str):
         )
         
         # Generate first question (easy difficulty)
-        resume_data = {
-            "skills": interview.get('parsed_skills', []),
-            "experience_years": interview.get('parsed_experience', 'Unknown')
-        }
+        resume_data = resume_data_from(interview)
         
-        question_data = await generate_question(
-            interview_id, 1, "easy", resume_data, interview['jd_text']
-        )
+        if not question_data:
+            question_data = await generate_question(
+                interview_id, 1, "easy", resume_data, jd_context_from(interview)
+            )
         
-        # Save question
-        question = QuestionResponse(
-            interview_id=interview_id,
-            question_number=1,
-            question_text=question_data['question'],
-            difficulty="easy",
-            time_allocated=question_data.get('time_allocated', 180)
-        )
+        question = await save_question(interview_id, 1, "easy", question_data)
         
-        doc = question.model_dump()
-        doc['created_at'] = doc['created_at'].isoformat()
-        await db.questions.insert_one(doc)
+        schedule_prefetch(interview_id, 2, resume_data, jd_context_from(interview))
         
         return question
         
@@ -517,214 +2019,802 @@ async def start_interview(interview_id: str):
         logging.error(f"Error starting interview: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
-@api_router.post("/interviews/{interview_id}/questions/{question_id}/answer")
-async def submit_answer(
-    interview_id: str,
-    question_id: str,
-    data: AnswerSubmission
-):
-    """Submit answer and get next question"""
-    try:
-        # Get question
-        question = await db.questions.find_one(
-            {"id": question_id, "interview_id": interview_id},
-            {"_id": 0}
-        )
-        if not question:
-            raise HTTPException(status_code=404, detail="Question not found")
-        
-        # Evaluate answer
-        eval_data = await evaluate_answer(
-            question['question_text'],
-            data.answer_text,
-            question['time_allocated'],
-            data.time_taken,
-            question['difficulty']
-        )
-        
-        # Update question with answer and score
-        await db.questions.update_one(
-            {"id": question_id},
-            {"$set": {
-                "answer_text": data.answer_text,
-                "time_taken": data.time_taken,
-                "score": eval_data['score'],
-                "feedback": eval_data['feedback']
-            }}
+async def load_question(interview_id: str, question_id: str) -> Dict[str, Any]:
+    question = await db.questions.find_one(
+        {"id": question_id, "interview_id": interview_id},
+        {"_id": 0}
+    )
+    if not question:
+        raise HTTPException(status_code=404, detail="Question not found")
+    return question
+
+async def grade_answer(interview_id: str, question: Dict[str, Any], data: AnswerSubmission) -> Dict[str, Any]:
+    """Evaluate and record an answer, then decide how the interview continues.
+
+    Returns the evaluation, the updated interview and either a final response
+    (terminated/completed) or the difficulty of the next question.
+    """
+    # An empty submission (e.g. after a page reload) falls back to the latest saved draft
+    if not data.answer_text.strip():
+        draft_answer = await draft_buffer.get(interview_id, question['id'])
+        if draft_answer:
+            data = AnswerSubmission(answer_text=draft_answer, time_taken=data.time_taken)
+    draft_buffer.discard(interview_id, question['id'])
+    
+    # Evaluate answer; the JD lets the local pre-scorer tell on-topic answers from filler.
+    # The evaluation runs outside the request budget: if it would eat into the time needed for
+    # the next question, the answer is recorded as pending and scored after the response
+    evaluation = deadlines.spawn(evaluate_answer(
+        question['question_text'],
+        data.answer_text,
+        question['time_allocated'],
+        data.time_taken,
+        question['difficulty'],
+        await interview_jd_text(interview_id)
+    ))
+    eval_data = (await await_evaluations([evaluation], NEXT_QUESTION_RESERVE))[0]
+    evaluation_id = None
+    if eval_data is None:
+        evaluation_id = str(uuid.uuid4())
+        eval_data = dict(EVALUATION_PENDING)
+    
+    # Update question with answer and score; the previous state tells us whether this is a re-answer
+    previous = await db.questions.find_one_and_update(
+        {"id": question['id']},
+        {"$set": {
+            "answer_text": data.answer_text,
+            "time_taken": data.time_taken,
+            "score": eval_data['score'],
+            "feedback": eval_data['feedback'],
+            "evaluation_status": eval_data.get('evaluation_status', "done"),
+            "evaluation_id": evaluation_id
+        }},
+        projection={"_id": 0, "answer_text": 1, "score": 1, "evaluation_status": 1}
+    )
+    if evaluation_id:
+        defer_evaluation(interview_id, question, evaluation_id, evaluation)
+    
+    # Fold the answer into the interview's running aggregates
+    interview = await record_answer_aggregates(
+        interview_id, [(question['difficulty'], eval_data['score'], previous)]
+    )
+    await question_bank.record_scores([(question.get('bank_id'), eval_data['score'], previous)])
+    answered_count = interview.get('answered_count', 0)
+    scored_count, avg_score = scored_average(interview)
+    graded = {"eval": eval_data, "interview": interview, "final": None, "next_difficulty": None}
+    evaluation_status = eval_data.get('evaluation_status', "done")
+    
+    # Check if should terminate early (score < 30 on 2+ questions)
+    if scored_count >= 2 and avg_score < 30:
+        # Terminate interview
+        cancel_prefetch(interview_id)
+        await db.interviews.update_one(
+            {"id": interview_id},
+            {"$set": {"status": "terminated"}, "$unset": {"prefetched_questions": ""}}
         )
-        
-        # Check if should terminate early (score < 30 on 2+ questions)
-        questions_so_far = await db.questions.find(
-            {"interview_id": interview_id, "answer_text": {"$ne": None}},
-            {"_id": 0}
-        ).to_list(100)
-        
-        avg_score = sum(q.get('score', 0) for q in questions_so_far) / len(questions_so_far)
-        
-        if len(questions_so_far) >= 2 and avg_score < 30:
-            # Terminate interview
-            await db.interviews.update_one(
-                {"id": interview_id},
-                {"$set": {"status": "terminated"}}
+        schedule_report(interview_id)
+        graded["final"] = {
+            "question": None,
+            "terminated": True,
+            "reason": "Performance below threshold",
+            "score": eval_data['score'],
+            "feedback": eval_data['feedback'],
+            "evaluation_status": evaluation_status
+        }
+        return graded
+    
+    # Determine next difficulty; a pending evaluation keeps the current one
+    if eval_data['score'] is None:
+        next_difficulty = question['difficulty']
+    elif eval_data['score'] >= 75:
+        next_difficulty = "hard" if question['difficulty'] == "medium" else "medium"
+    elif eval_data['score'] >= 50:
+        next_difficulty = "medium"
+    else:
+        next_difficulty = "easy"
+    
+    # Check if reached max questions
+    if answered_count >= MAX_QUESTIONS:
+        cancel_prefetch(interview_id)
+        await db.interviews.update_one(
+            {"id": interview_id},
+            {"$set": {"status": "completed"}, "$unset": {"prefetched_questions": ""}}
+        )
+        schedule_report(interview_id)
+        graded["final"] = {
+            "question": None,
+            "completed": True,
+            "score": eval_data['score'],
+            "feedback": eval_data['feedback'],
+            "evaluation_status": evaluation_status
+        }
+        return graded
+    
+    graded["next_difficulty"] = next_difficulty
+    return graded
+
+BATCH_EVAL_CONCURRENCY = int(os.environ.get('BATCH_EVAL_CONCURRENCY', 8))
+
+@api_router.post("/interviews/{interview_id}/answers/batch")
+@deadlines.with_budget(ENDPOINT_DEADLINES["submit_answers_batch"])
+async def submit_answers_batch(interview_id: str, data: BatchAnswerSubmission):
+    """Evaluate all answers of an interview concurrently and record them in one bulk write"""
+    question_ids = [answer.question_id for answer in data.answers]
+    if not question_ids:
+        raise HTTPException(status_code=400, detail="No answers provided")
+    if len(set(question_ids)) != len(question_ids):
+        raise HTTPException(status_code=400, detail="Each question may only be answered once per batch")
+    
+    interview = await db.interviews.find_one({"id": interview_id}, {"_id": 0, "status": 1, "jd_text": 1})
+    if not interview:
+        raise HTTPException(status_code=404, detail="Interview not found")
+    if interview['status'] != "in_progress":
+        raise HTTPException(status_code=400, detail="Interview is not in progress")
+    
+    questions = await db.questions.find(
+        {"interview_id": interview_id, "id": {"$in": question_ids}}, {"_id": 0}
+    ).to_list(len(question_ids))
+    by_id = {question['id']: question for question in questions}
+    missing = [question_id for question_id in question_ids if question_id not in by_id]
+    if missing:
+        raise HTTPException(status_code=404, detail=f"Question not found: {', '.join(missing)}")
+    
+    # All evaluations in flight at once, up to BATCH_EVAL_CONCURRENCY, so the batch
+    # takes roughly as long as its slowest evaluation
+    slots = asyncio.Semaphore(BATCH_EVAL_CONCURRENCY)
+    
+    async def evaluate(answer: BatchAnswer) -> Dict[str, Any]:
+        question = by_id[answer.question_id]
+        async with slots:
+            return await evaluate_answer(
+                question['question_text'],
+                answer.answer_text,
+                question['time_allocated'],
+                answer.time_taken,
+                question['difficulty'],
+                interview.get('jd_text')
             )
-            return {
-                "question": None,
-                "terminated": True,
-                "reason": "Performance below threshold",
+    
+    # Evaluations still running when the budget runs out are recorded as pending and scored later
+    tasks = [deadlines.spawn(evaluate(answer)) for answer in data.answers]
+    evaluations = await await_evaluations(tasks, deadlines.DB_RESERVE)
+    evaluation_ids = [None if eval_data else str(uuid.uuid4()) for eval_data in evaluations]
+    evaluations = [eval_data or dict(EVALUATION_PENDING) for eval_data in evaluations]
+    
+    await db.questions.bulk_write([
+        UpdateOne({"id": answer.question_id}, {"$set": {
+            "answer_text": answer.answer_text,
+            "time_taken": answer.time_taken,
+            "score": eval_data['score'],
+            "feedback": eval_data['feedback'],
+            "evaluation_status": eval_data.get('evaluation_status', "done"),
+            "evaluation_id": evaluation_id
+        }})
+        for answer, eval_data, evaluation_id in zip(data.answers, evaluations, evaluation_ids)
+    ], ordered=False)
+    for answer, task, evaluation_id in zip(data.answers, tasks, evaluation_ids):
+        draft_buffer.discard(interview_id, answer.question_id)
+        if evaluation_id:
+            defer_evaluation(interview_id, by_id[answer.question_id], evaluation_id, task)
+    
+    ordered = sorted(zip(data.answers, evaluations), key=lambda pair: by_id[pair[0].question_id]['question_number'])
+    interview = await record_answer_aggregates(interview_id, [
+        (by_id[answer.question_id]['difficulty'], eval_data['score'], by_id[answer.question_id])
+        for answer, eval_data in ordered
+    ])
+    await question_bank.record_scores([
+        (by_id[answer.question_id].get('bank_id'), eval_data['score'], by_id[answer.question_id])
+        for answer, eval_data in zip(data.answers, evaluations)
+    ])
+    answered_count = interview.get('answered_count', 0)
+    scored_count, avg_score = scored_average(interview)
+    
+    status = interview['status']
+    if data.complete:
+        status = "terminated" if scored_count >= 2 and avg_score < 30 else "completed"
+        cancel_prefetch(interview_id)
+        await db.interviews.update_one(
+            {"id": interview_id},
+            {"$set": {"status": status}, "$unset": {"prefetched_questions": ""}}
+        )
+        schedule_report(interview_id)
+    
+    return {
+        "results": [
+            {
+                "question_id": answer.question_id,
                 "score": eval_data['score'],
-                "feedback": eval_data['feedback']
+                "feedback": eval_data['feedback'],
+                "strengths": eval_data.get('strengths'),
+                "weaknesses": eval_data.get('weaknesses'),
+                "evaluation_status": eval_data.get('evaluation_status', "done")
             }
-        
-        # Determine next difficulty
-        if eval_data['score'] >= 75:
-            next_difficulty = "hard" if question['difficulty'] == "medium" else "medium"
-        elif eval_data['score'] >= 50:
-            next_difficulty = "medium"
+            for answer, eval_data in zip(data.answers, evaluations)
+        ],
+        "answered_count": answered_count,
+        "average_score": round(avg_score, 2),
+        "status": status
+    }
+
+class IdempotentRequests:
+    """Executes each idempotency key once per route.
+    
+    Concurrent duplicates in this process share one execution (singleflight); later duplicates,
+    from any process, replay the response stored in db.idempotency_keys until it expires.
+    """
+    
+    def __init__(self, route: str):
+        self.route = route
+        self._inflight: Dict[str, Tuple[str, asyncio.Task]] = {}
+    
+    async def run(self, key: str, request_hash: str, handler: Callable[[], Awaitable[Any]]) -> Any:
+        inflight = self._inflight.get(key)
+        if inflight is None:
+            task = asyncio.create_task(self._execute(key, request_hash, handler))
+            self._inflight[key] = (request_hash, task)
+            task.add_done_callback(
+                lambda t: self._inflight.pop(key, None) if self._inflight.get(key, (None, None))[1] is t else None
+            )
         else:
-            next_difficulty = "easy"
-        
-        # Check if reached max questions (8)
-        if len(questions_so_far) >= 8:
-            await db.interviews.update_one(
-                {"id": interview_id},
-                {"$set": {"status": "completed"}}
+            if inflight[0] != request_hash:
+                self._mismatch()
+            IDEMPOTENT_REQUESTS.inc(self.route, "coalesced")
+            task = inflight[1]
+        # Shielded so a caller that disconnects does not cancel the work the others are waiting on
+        return await asyncio.shield(task)
+    
+    def _mismatch(self):
+        IDEMPOTENT_REQUESTS.inc(self.route, "mismatch")
+        raise HTTPException(status_code=422, detail="Idempotency-Key was already used for a different request")
+    
+    async def _execute(self, key: str, request_hash: str, handler: Callable[[], Awaitable[Any]]) -> Any:
+        now = datetime.now(timezone.utc)
+        try:
+            await db.idempotency_keys.insert_one(
+                {"key": key, "request_hash": request_hash, "status": "in_progress", "created_at": now}
             )
-            return {
-                "question": None,
-                "completed": True,
-                "score": eval_data['score'],
-                "feedback": eval_data['feedback']
-            }
-        
-        # Generate next question
-        interview = await db.interviews.find_one({"id": interview_id}, {"_id": 0})
-        resume_data = {
-            "skills": interview.get('parsed_skills', []),
-            "experience_years": interview.get('parsed_experience', 'Unknown')
-        }
+        except DuplicateKeyError:
+            existing = await db.idempotency_keys.find_one({"key": key}, {"_id": 0})
+            if existing and existing['request_hash'] != request_hash:
+                self._mismatch()
+            if existing and existing['status'] == "done":
+                IDEMPOTENT_REQUESTS.inc(self.route, "replayed")
+                return existing['response']
+            # Still running elsewhere; a holder that died is taken over once its lease has run out
+            taken = await db.idempotency_keys.find_one_and_update(
+                {"key": key, "status": "in_progress", "created_at": {"$lt": now - timedelta(seconds=IDEMPOTENCY_LEASE)}},
+                {"$set": {"created_at": now}}
+            )
+            if not taken:
+                IDEMPOTENT_REQUESTS.inc(self.route, "conflict")
+                raise HTTPException(status_code=409, detail="A request with this Idempotency-Key is still being processed",
+                                    headers={"Retry-After": "1"})
         
-        next_question_data = await generate_question(
-            interview_id,
-            question['question_number'] + 1,
-            next_difficulty,
-            resume_data,
-            interview['jd_text'],
-            eval_data['score']
+        IDEMPOTENT_REQUESTS.inc(self.route, "executed")
+        try:
+            result = await handler()
+        except BaseException:
+            # Nothing is stored for a failed request, so a retry with the same key runs it again
+            await db.idempotency_keys.delete_one({"key": key, "status": "in_progress"})
+            raise
+        await db.idempotency_keys.update_one(
+            {"key": key},
+            {"$set": {"status": "done", "response": jsonable_encoder(result),
+                      "completed_at": datetime.now(timezone.utc)}}
         )
+        return result
+
+answer_submissions = IdempotentRequests("submit_answer")
+
+@api_router.post("/interviews/{interview_id}/questions/{question_id}/answer")
+@admission.admit(ADMISSION_LIMITERS["submit_answer"])
+@deadlines.with_budget(ENDPOINT_DEADLINES["submit_answer"])
+async def submit_answer(
+    interview_id: str,
+    question_id: str,
+    data: AnswerSubmission,
+    idempotency_key: Optional[str] = Header(None)
+):
+    """Submit answer and get next question; a repeated submission gets the first response back.
+    
+    Without an Idempotency-Key header, identical resubmissions of the same question share a key.
+    """
+    key, request_hash = answer_idempotency(interview_id, question_id, data, idempotency_key)
+    return await answer_submissions.run(
+        key, request_hash, lambda: grade_and_advance(interview_id, question_id, data)
+    )
+
+def answer_idempotency(interview_id: str, question_id: str, data: AnswerSubmission,
+                       idempotency_key: Optional[str]) -> Tuple[str, str]:
+    """Idempotency key and request hash of an answer submission.
+    
+    time_taken is left out of the hash: clients recompute it when they retry a submission whose
+    response was lost, and the retry must replay the first response rather than fail.
+    """
+    request_hash = hashlib.sha256(json.dumps([question_id, data.answer_text]).encode()).hexdigest()
+    key = f"{interview_id}:{idempotency_key}" if idempotency_key else f"{interview_id}:{question_id}:{request_hash}"
+    return key, request_hash
+
+async def grade_and_advance(interview_id: str, question_id: str, data: AnswerSubmission,
+                            emit: Optional[Callable[[str, Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+    """Grade an answer and produce the next question (or the final result).
+    
+    emit, when given, receives the evaluation and the next question's text as SSE events while
+    they are produced, and a live question is streamed token by token.
+    """
+    try:
+        question = await load_question(interview_id, question_id)
         
-        # Save next question
-        next_question = QuestionResponse(
-            interview_id=interview_id,
-            question_number=question['question_number'] + 1,
-            question_text=next_question_data['question'],
-            difficulty=next_difficulty,
-            time_allocated=next_question_data.get('time_allocated', 180)
-        )
+        graded = await grade_answer(interview_id, question, data)
+        if emit:
+            emit("evaluation", {"score": graded["eval"]['score'], "feedback": graded["eval"]['feedback']})
+        if graded["final"]:
+            return graded["final"]
         
-        doc = next_question.model_dump()
-        doc['created_at'] = doc['created_at'].isoformat()
-        await db.questions.insert_one(doc)
+        eval_data, interview = graded["eval"], graded["interview"]
+        next_difficulty = graded["next_difficulty"]
+        next_number = question['question_number'] + 1
         
-        return {
-            "question": next_question,
+        response = {
             "previous_score": eval_data['score'],
             "previous_feedback": eval_data['feedback'],
+            "evaluation_status": eval_data.get('evaluation_status', "done"),
             "terminated": False,
             "completed": False
         }
         
+        # A re-answered question already has its successor; serve it rather than numbering a second one
+        existing = await db.questions.find_one(
+            {"interview_id": interview_id, "question_number": next_number}, {"_id": 0}
+        )
+        if existing:
+            if emit:
+                emit("token", {"text": existing['question_text']})
+            return {"question": QuestionResponse(**existing), **response}
+        
+        # Generate next question
+        resume_data = resume_data_from(interview)
+        
+        # Serve the speculatively generated candidate, falling back to a live call on a miss
+        next_question_data = await take_prefetched_question(interview_id, next_number, next_difficulty)
+        if next_question_data and emit:
+            # Already complete: sent as a single chunk
+            emit("token", {"text": next_question_data['question']})
+        elif emit:
+            async for kind, payload in stream_question(
+                interview_id, next_number, next_difficulty, resume_data, jd_context_from(interview), eval_data['score']
+            ):
+                if kind == "token":
+                    emit("token", {"text": payload})
+                elif kind == "reset":
+                    emit("reset", {})
+                else:
+                    next_question_data = payload
+        elif not next_question_data:
+            next_question_data = await generate_question(
+                interview_id,
+                next_number,
+                next_difficulty,
+                resume_data,
+                jd_context_from(interview),
+                eval_data['score']
+            )
+        
+        next_question = await save_question(interview_id, next_number, next_difficulty, next_question_data)
+        
+        schedule_prefetch(interview_id, next_number + 1, resume_data, jd_context_from(interview))
+        
+        return {"question": next_question, **response}
+        
     except HTTPException:
         raise
     except Exception as e:
         logging.error(f"Error submitting answer: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+# Server-Sent Events variants: stream question text as tokens arrive, then persist it
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+def sse_event(event: str, data: Any) -> str:
+    return f"event: {event}\ndata: {json.dumps(jsonable_encoder(data))}\n\n"
+
+async def stream_question_events(interview_id: str, question_number: int, difficulty: str,
+                                 resume_data: Dict, jd_context: str,
+                                 previous_performance: Optional[float] = None):
+    """SSE events for one question: token chunks, then the persisted question"""
+    question_data = None
+    async for kind, payload in stream_question(
+        interview_id, question_number, difficulty, resume_data, jd_context, previous_performance
+    ):
+        if kind == "token":
+            yield sse_event("token", {"text": payload})
+        elif kind == "reset":
+            # The stream failed partway; clients drop the text received so far
+            yield sse_event("reset", {})
+        else:
+            question_data = payload
+    
+    # Metadata is only final once the stream completes
+    question = await save_question(interview_id, question_number, difficulty, question_data)
+    schedule_prefetch(interview_id, question_number + 1, resume_data, jd_context)
+    yield sse_event("question", question)
+
+@api_router.post("/interviews/{interview_id}/start/stream")
+@admission.admit(ADMISSION_LIMITERS["start_interview"])
+async def start_interview_stream(interview_id: str):
+    """Start interview and stream the first question as Server-Sent Events"""
+    interview = await load_startable_interview(interview_id)
+    prefetched = await take_prefetched_question(interview_id, 1, "easy")
+    
+    await db.interviews.update_one(
+        {"id": interview_id},
+        {"$set": {"status": "in_progress"}}
+    )
+    
+    async def events():
+        try:
+            if prefetched:
+                # Pregenerated during setup: send it as a single chunk
+                yield sse_event("token", {"text": prefetched['question']})
+                question = await save_question(interview_id, 1, "easy", prefetched)
+                schedule_prefetch(interview_id, 2, resume_data_from(interview), jd_context_from(interview))
+                yield sse_event("question", question)
+                return
+            async for event in stream_question_events(
+                interview_id, 1, "easy", resume_data_from(interview), jd_context_from(interview)
+            ):
+                yield event
+        except Exception as e:
+            logging.error(f"Error streaming first question: {str(e)}")
+            yield sse_event("error", {"detail": str(e)})
+    
+    return StreamingResponse(events(), media_type="text/event-stream", headers=SSE_HEADERS)
+
+@api_router.post("/interviews/{interview_id}/questions/{question_id}/answer/stream")
+@admission.admit(ADMISSION_LIMITERS["submit_answer"])
+async def submit_answer_stream(
+    interview_id: str,
+    question_id: str,
+    data: AnswerSubmission,
+    idempotency_key: Optional[str] = Header(None)
+):
+    """Submit answer; stream the evaluation, then the next question token by token.
+    
+    Shares idempotency keys with submit_answer: a duplicate submission gets the first one's result.
+    """
+    await load_question(interview_id, question_id)
+    key, request_hash = answer_idempotency(interview_id, question_id, data, idempotency_key)
+    produced: asyncio.Queue = asyncio.Queue()
+    
+    async def events():
+        sent = set()
+        submission = asyncio.ensure_future(answer_submissions.run(
+            key, request_hash,
+            lambda: grade_and_advance(interview_id, question_id, data, lambda *event: produced.put_nowait(event))
+        ))
+        next_event = None
+        try:
+            # Events arrive only when this request runs the submission; a duplicate just gets its result
+            while True:
+                next_event = asyncio.ensure_future(produced.get())
+                await asyncio.wait({next_event, submission}, return_when=asyncio.FIRST_COMPLETED)
+                if not next_event.done():
+                    break
+                event, payload = next_event.result()
+                sent.add(event)
+                yield sse_event(event, payload)
+            while not produced.empty():
+                event, payload = produced.get_nowait()
+                sent.add(event)
+                yield sse_event(event, payload)
+            result = jsonable_encoder(submission.result())
+        except Exception as e:
+            logging.error(f"Error streaming answer submission: {str(e)}")
+            yield sse_event("error", {"detail": e.detail if isinstance(e, HTTPException) else str(e)})
+            return
+        finally:
+            if next_event is not None:
+                next_event.cancel()
+        
+        if not result.get("question"):
+            if "evaluation" not in sent:
+                yield sse_event("evaluation", {"score": result.get('score'), "feedback": result.get('feedback')})
+            yield sse_event("done", result)
+            return
+        if "evaluation" not in sent:
+            yield sse_event("evaluation", {"score": result['previous_score'], "feedback": result['previous_feedback']})
+        if "token" not in sent:
+            yield sse_event("token", {"text": result['question']['question_text']})
+        yield sse_event("question", result['question'])
+        yield sse_event("done", {"terminated": False, "completed": False})
+    
+    return StreamingResponse(events(), media_type="text/event-stream", headers=SSE_HEADERS)
+
+# Interview history: keyset pagination on (created_at, id)
+HISTORY_PROJECTION = {"_id": 0, "resume_text": 0, "jd_text": 0, "prefetched_questions": 0}
+
+def encode_history_cursor(interview: Dict[str, Any]) -> str:
+    """Opaque cursor pointing just past the given interview"""
+    raw = json.dumps([interview['created_at'], interview['id']], default=str).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+def decode_history_cursor(cursor: str) -> tuple:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, interview_id = json.loads(raw)
+        return str(created_at), str(interview_id)
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+def build_history_query(cursor: Optional[str], status: Optional[str], min_score: Optional[float],
+                        max_score: Optional[float], created_after: Optional[datetime],
+                        created_before: Optional[datetime]) -> Dict[str, Any]:
+    """Mongo filter for a history page; created_at is stored as an ISO string"""
+    clauses = []
+    if status:
+        clauses.append({"status": status})
+    if min_score is not None or max_score is not None:
+        score_range = {}
+        if min_score is not None:
+            score_range["$gte"] = min_score
+        if max_score is not None:
+            score_range["$lte"] = max_score
+        clauses.append({"overall_score": score_range})
+    for bound, op in ((created_after, "$gte"), (created_before, "$lt")):
+        if bound is not None:
+            if bound.tzinfo is None:
+                bound = bound.replace(tzinfo=timezone.utc)
+            clauses.append({"created_at": {op: bound.astimezone(timezone.utc).isoformat()}})
+    if cursor:
+        created_at, interview_id = decode_history_cursor(cursor)
+        clauses.append({"$or": [
+            {"created_at": {"$lt": created_at}},
+            {"created_at": created_at, "id": {"$lt": interview_id}}
+        ]})
+    return {"$and": clauses} if clauses else {}
+
+HISTORY_TABS = ("completed", "terminated")
+
+async def history_counts(min_score: Optional[float], max_score: Optional[float],
+                         created_after: Optional[datetime], created_before: Optional[datetime]) -> Dict[str, int]:
+    """Interviews per history tab under the filters other than status"""
+    base = build_history_query(None, None, min_score, max_score, created_after, created_before)
+    totals = await asyncio.gather(
+        db.interviews.count_documents(base),
+        *[db.interviews.count_documents({**base, "status": tab}) for tab in HISTORY_TABS]
+    )
+    return dict(zip(("all", *HISTORY_TABS), totals))
+
+def serialize_history_entry(interview: Dict[str, Any]) -> Dict[str, Any]:
+    # Convert datetime to ISO string for JSON serialization
+    if isinstance(interview.get('created_at'), datetime):
+        interview['created_at'] = interview['created_at'].isoformat()
+    if interview.get('completed_at') and isinstance(interview['completed_at'], datetime):
+        interview['completed_at'] = interview['completed_at'].isoformat()
+    return interview
+
+@api_router.get("/interviews/history")
+async def get_interview_history(
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
+    status: Optional[str] = None,
+    min_score: Optional[float] = None,
+    max_score: Optional[float] = None,
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None,
+    include_text: bool = False,
+    stream: bool = False
+):
+    """Get interviews for history view, newest first, one page at a time.
+    
+    The first page also carries the totals per status tab, which the loaded pages cannot give.
+    """
+    query = build_history_query(cursor, status, min_score, max_score, created_after, created_before)
+    projection = {"_id": 0} if include_text else HISTORY_PROJECTION
+    sort = [("created_at", -1), ("id", -1)]
+    
+    if stream:
+        # NDJSON: every matching interview, one per line, without buffering the result set
+        async def ndjson():
+            async for interview in db.interviews.find(query, projection).sort(sort).batch_size(200):
+                yield json.dumps(serialize_history_entry(interview), default=str) + "\n"
+        return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+    
+    try:
+        interviews = await db.interviews.find(query, projection).sort(sort).to_list(limit + 1)
+        next_cursor = encode_history_cursor(interviews[limit - 1]) if len(interviews) > limit else None
+        
+        page = {
+            "interviews": [serialize_history_entry(interview) for interview in interviews[:limit]],
+            "next_cursor": next_cursor
+        }
+        if not cursor:
+            page["counts"] = await history_counts(min_score, max_score, created_after, created_before)
+        return page
+    except Exception as e:
+        logging.error(f"Error fetching history: {str(e)}")
+        return {"interviews": [], "next_cursor": None}
+
 @api_router.get("/interviews/{interview_id}")
 async def get_interview(interview_id: str):
     """Get interview details"""
-    interview = await db.interviews.find_one({"id": interview_id}, {"_id": 0})
+    # Prefetched candidates are upcoming questions and must not reach the client
+    interview = await db.interviews.find_one({"id": interview_id}, {"_id": 0, "prefetched_questions": 0})
     if not interview:
         raise HTTPException(status_code=404, detail="Interview not found")
     return interview
 
 @api_router.get("/interviews/{interview_id}/report")
-async def get_interview_report(interview_id: str):
+async def get_interview_report(interview_id: str, if_none_match: Optional[str] = Header(None)):
     """Get comprehensive interview report"""
     try:
-        report = await generate_final_report(interview_id)
-        return report
+        stored = await db.reports.find_one({"interview_id": interview_id}, {"_id": 0})
+        if not stored:
+            # Not materialized yet: join the background build if it's running, otherwise build now
+            task = _report_tasks.get(interview_id)
+            if task and not task.done():
+                stored = await asyncio.shield(task)
+            if not stored:
+                stored = await materialize_report(interview_id)
+        
+        if if_none_match and stored['etag'] in [tag.strip() for tag in if_none_match.split(",")]:
+            return Response(status_code=304, headers={"ETag": stored['etag']})
+        return JSONResponse(content=stored['report'], headers={"ETag": stored['etag'], "Cache-Control": "no-cache"})
     except HTTPException:
         raise
     except Exception as e:
         logging.error(f"Error getting report: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@api_router.post("/interviews/{interview_id}/report/regenerate")
+async def regenerate_interview_report(interview_id: str):
+    """Rebuild and store the interview report"""
+    try:
+        stored = await materialize_report(interview_id)
+        return JSONResponse(content=stored['report'], headers={"ETag": stored['etag']})
+    except HTTPException:
+        raise
+    except Exception as e:
+        logging.error(f"Error regenerating report: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
 @api_router.get("/interviews/{interview_id}/questions")
 async def get_interview_questions(interview_id: str):
     """Get all questions for an interview"""
     questions = await db.questions.find({"interview_id": interview_id}, {"_id": 0}).to_list(100)
     return questions
 
-@api_router.get("/interviews/history")
-async def get_interview_history():
-    """Get all interviews for history view"""
-    try:
-        interviews = await db.interviews.find(
-            {},
-            {"_id": 0}
-        ).sort("created_at", -1).to_list(100)
-        
-        # Convert datetime to ISO string for JSON serialization
-        for interview in interviews:
-            if isinstance(interview.get('created_at'), datetime):
-                interview['created_at'] = interview['created_at'].isoformat()
-            if interview.get('completed_at') and isinstance(interview['completed_at'], datetime):
-                interview['completed_at'] = interview['completed_at'].isoformat()
-        
-        return interviews
-    except Exception as e:
-        logging.error(f"Error fetching history: {str(e)}")
-        return []
-
 # New endpoints for enhanced features
 
 class DraftSave(BaseModel):
     question_id: str
     draft_answer: str
 
+class DraftBuffer:
+    """Write-behind buffer for draft autosaves.
+
+    Keeps only the latest draft per (interview_id, question_id) and writes the
+    pending set with a single bulk_write every `interval` seconds, or sooner
+    once `max_pending` drafts are waiting.
+    """
+
+    def __init__(self, collection, interval: float, max_pending: int):
+        self.collection = collection
+        self.interval = interval
+        self.max_pending = max_pending
+        self._pending: Dict[tuple, Dict[str, Any]] = {}
+        self._lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._early_flush: Optional[asyncio.Task] = None
+        self.stats = {"saves": 0, "flushes": 0, "documents_written": 0, "flush_errors": 0}
+
+    def put(self, interview_id: str, question_id: str, draft_answer: str):
+        self._pending[(interview_id, question_id)] = {
+            "draft_answer": draft_answer,
+            "updated_at": datetime.now(timezone.utc).isoformat()
+        }
+        self.stats["saves"] += 1
+        if len(self._pending) >= self.max_pending and (self._early_flush is None or self._early_flush.done()):
+            self._early_flush = asyncio.create_task(self.flush())
+
+    async def get(self, interview_id: str, question_id: str) -> Optional[str]:
+        """Latest draft, read through the buffer to the drafts collection"""
+        pending = self._pending.get((interview_id, question_id))
+        if pending:
+            return pending["draft_answer"]
+        draft = await self.collection.find_one(
+            {"interview_id": interview_id, "question_id": question_id},
+            {"_id": 0, "draft_answer": 1}
+        )
+        return draft.get("draft_answer") if draft else None
+
+    def discard(self, interview_id: str, question_id: str):
+        self._pending.pop((interview_id, question_id), None)
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    async def flush(self):
+        async with self._lock:
+            if not self._pending:
+                return
+            batch, self._pending = self._pending, {}
+            operations = [
+                UpdateOne(
+                    {"interview_id": interview_id, "question_id": question_id},
+                    {"$set": fields},
+                    upsert=True
+                )
+                for (interview_id, question_id), fields in batch.items()
+            ]
+            try:
+                await self.collection.bulk_write(operations, ordered=False)
+                self.stats["flushes"] += 1
+                self.stats["documents_written"] += len(operations)
+            except Exception as e:
+                self.stats["flush_errors"] += 1
+                logging.error(f"Error flushing drafts: {str(e)}")
+                # Put back anything that hasn't been superseded by a newer save
+                for key, fields in batch.items():
+                    self._pending.setdefault(key, fields)
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            await self.flush()
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            self._task = None
+        await self.flush()
+
+draft_buffer = DraftBuffer(
+    db.drafts,
+    interval=float(os.environ.get('DRAFT_FLUSH_INTERVAL', 2)),
+    max_pending=int(os.environ.get('DRAFT_FLUSH_MAX_PENDING', 500))
+)
+
 @api_router.post("/interviews/{interview_id}/save-draft")
 async def save_draft(interview_id: str, data: DraftSave):
     """Save draft answer"""
     try:
-        await db.drafts.update_one(
-            {"interview_id": interview_id, "question_id": data.question_id},
-            {"$set": {
-                "draft_answer": data.draft_answer,
-                "updated_at": datetime.now(timezone.utc).isoformat()
-            }},
-            upsert=True
-        )
+        draft_buffer.put(interview_id, data.question_id, data.draft_answer)
         return {"success": True, "message": "Draft saved"}
     except Exception as e:
         logging.error(f"Error saving draft: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@api_router.get("/interviews/{interview_id}/drafts/{question_id}")
+async def get_draft(interview_id: str, question_id: str):
+    """Get the latest saved draft for a question"""
+    draft_answer = await draft_buffer.get(interview_id, question_id)
+    return {"question_id": question_id, "draft_answer": draft_answer}
+
+@api_router.get("/drafts/stats")
+async def get_draft_stats():
+    """Get draft write-behind buffer statistics"""
+    saves = draft_buffer.stats["saves"]
+    return {
+        **draft_buffer.stats,
+        "pending": len(draft_buffer),
+        "write_reduction": round(saves / draft_buffer.stats["documents_written"], 2)
+        if draft_buffer.stats["documents_written"] else None
+    }
+
 class AssistantRequest(BaseModel):
     interview_id: str
     question: str
     user_message: str
 
-@api_router.post("/assistant/help")
-async def get_assistant_help(data: AssistantRequest):
-    """Get AI assistant help"""
-    try:
-        chat = LlmChat(
-            api_key=os.environ['EMERGENT_LLM_KEY'],
-            session_id=f"assistant_{data.interview_id}",
-            system_message="You are a helpful interview coach. Provide guidance without giving direct answers."
-        ).with_model("openai", "gpt-5.2")
-        
-        prompt = f"""Interview Question: {data.question}
+ASSISTANT_SYSTEM_MESSAGE = "You are a helpful interview coach. Provide guidance without giving direct answers."
+
+def build_assistant_prompt(data: AssistantRequest) -> str:
+    return f"""Interview Question: {data.question}
 
 User needs help: {data.user_message}
 
@@ -735,15 +2825,162 @@ Provide helpful guidance that:
 4. Encourages the candidate to think critically
 
 Keep response concise (2-3 sentences)."""
+
+async def assistant_bucket_key(data: AssistantRequest) -> str:
+    """Rate-limit key for assistant help; only real interviews get a bucket"""
+    if not await db.interviews.find_one({"id": data.interview_id}, {"_id": 1}):
+        raise HTTPException(status_code=404, detail="Interview not found")
+    return data.interview_id
+
+@api_router.post("/assistant/help")
+@admission.admit(ADMISSION_LIMITERS["assistant_help"], assistant_buckets, key=assistant_bucket_key)
+@deadlines.with_budget(ENDPOINT_DEADLINES["assistant_help"])
+async def get_assistant_help(data: AssistantRequest):
+    """Get AI assistant help"""
+    try:
+        prompt = build_assistant_prompt(data)
         
-        message = UserMessage(text=prompt)
-        response = await chat.send_message(message)
+        response = await llm_gateway.complete(
+            "assistant",
+            f"assistant_{data.interview_id}",
+            ASSISTANT_SYSTEM_MESSAGE,
+            prompt
+        )
         
         return {"response": response}
     except Exception as e:
         logging.error(f"Error with assistant: {str(e)}")
+        FALLBACKS.inc("assistant", fallback_reason(e))
         return {"response": "I'm here to help! Please try rephrasing your question."}
 
+@api_router.post("/assistant/help/stream")
+@admission.admit(ADMISSION_LIMITERS["assistant_help"], assistant_buckets, key=assistant_bucket_key)
+async def get_assistant_help_stream(data: AssistantRequest):
+    """Stream AI assistant help as Server-Sent Events"""
+    async def events():
+        sent = False
+        try:
+            async for delta in llm_gateway.stream(
+                "assistant", f"assistant_{data.interview_id}", ASSISTANT_SYSTEM_MESSAGE, build_assistant_prompt(data)
+            ):
+                sent = True
+                yield sse_event("token", {"text": delta})
+        except Exception as e:
+            logging.error(f"Error streaming assistant help: {str(e)}")
+            if not sent:
+                FALLBACKS.inc("assistant", "stream_error")
+                yield sse_event("token", {"text": "I'm here to help! Please try rephrasing your question."})
+        yield sse_event("done", {})
+    
+    return StreamingResponse(events(), media_type="text/event-stream", headers=SSE_HEADERS)
+
+@api_router.get("/llm/stats")
+async def get_llm_stats():
+    """Get LLM gateway queue depth, circuit state and latency per call site"""
+    return llm_gateway.stats()
+
+@api_router.get("/admin/admission/stats")
+async def get_admission_stats():
+    """Admitted, queued and shed requests per protected route"""
+    return {
+        "routes": {route: limiter.snapshot() for route, limiter in ADMISSION_LIMITERS.items()},
+        "assistant_rate_limit": assistant_buckets.snapshot()
+    }
+
+@api_router.get("/prefetch/stats")
+async def get_prefetch_stats():
+    """Get next-question prefetch hit/miss counters"""
+    lookups = prefetch_stats["hits"] + prefetch_stats["misses"]
+    return {
+        **prefetch_stats,
+        "in_flight": len(_prefetch_tasks),
+        "hit_rate": round(prefetch_stats["hits"] / lookups, 4) if lookups else 0.0
+    }
+
+@api_router.get("/admin/resume-cache/stats")
+async def get_resume_cache_stats():
+    """Get resume parse cache statistics"""
+    lookups = resume_cache_stats["memory_hits"] + resume_cache_stats["db_hits"] + resume_cache_stats["misses"]
+    hits = resume_cache_stats["memory_hits"] + resume_cache_stats["db_hits"]
+    return {
+        **resume_cache_stats,
+        "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+        "memory_entries": len(resume_parse_cache),
+        "stored_entries": await db.resume_parse_cache.count_documents({"version": RESUME_PARSE_VERSION}),
+        "version": RESUME_PARSE_VERSION
+    }
+
+@api_router.get("/admin/question-bank/stats")
+async def get_question_bank_stats():
+    """Question bank hit rate, size and the most reused entries with their observed scores"""
+    lookups = question_bank.stats["hits"] + question_bank.stats["misses"]
+    top = await db.question_bank.find(
+        {}, {"_id": 0, "id": 1, "difficulty": 1, "skill_tags": 1, "question": 1, "served_count": 1,
+             "answer_count": 1, "score_sum": 1, "score_sq_sum": 1}
+    ).sort("served_count", -1).limit(10).to_list(10)
+    for entry in top:
+        count, total, total_sq = entry.pop("answer_count"), entry.pop("score_sum"), entry.pop("score_sq_sum")
+        mean = total / count if count else None
+        variance = total_sq / count - mean * mean if count else None
+        entry["score_stats"] = {
+            "answers": count,
+            "mean": round(mean, 2) if mean is not None else None,
+            "stddev": round(max(variance, 0.0) ** 0.5, 2) if variance is not None else None
+        }
+    return {
+        **question_bank.stats,
+        "enabled": question_bank.enabled,
+        "hit_rate": round(question_bank.stats["hits"] / lookups, 4) if lookups else 0.0,
+        "entries": await db.question_bank.count_documents({}),
+        "max_age_s": question_bank.max_age,
+        "max_reuse": question_bank.max_reuse,
+        "most_reused": top
+    }
+
+@api_router.get("/admin/jd-cache/stats")
+async def get_jd_cache_stats():
+    """Get job description parse cache statistics"""
+    lookups = jd_cache_stats["memory_hits"] + jd_cache_stats["db_hits"] + jd_cache_stats["misses"]
+    hits = jd_cache_stats["memory_hits"] + jd_cache_stats["db_hits"]
+    return {
+        **jd_cache_stats,
+        "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+        "memory_entries": len(jd_parse_cache),
+        "version": JD_PARSE_VERSION
+    }
+
+@api_router.delete("/admin/resume-cache")
+async def invalidate_resume_cache(text_hash: Optional[str] = None, stale_only: bool = False):
+    """Invalidate resume parse cache entries: one hash, all stale versions, or everything"""
+    if text_hash:
+        resume_parse_cache.pop(text_hash)
+        result = await db.resume_parse_cache.delete_many({"text_hash": text_hash})
+    elif stale_only:
+        result = await db.resume_parse_cache.delete_many({"version": {"$ne": RESUME_PARSE_VERSION}})
+    else:
+        resume_parse_cache.clear()
+        result = await db.resume_parse_cache.delete_many({})
+    return {"success": True, "deleted": result.deleted_count}
+
+@api_router.get("/admin/traces")
+async def get_slow_traces(
+    limit: int = Query(20, ge=1, le=200),
+    route: Optional[str] = None,
+    min_duration_ms: Optional[float] = None
+):
+    """Get the slowest recently traced requests, optionally for one route template"""
+    query: Dict[str, Any] = {}
+    if route:
+        query["route"] = route
+    if min_duration_ms is not None:
+        query["duration_ms"] = {"$gte": min_duration_ms}
+    return await db.traces.find(query, {"_id": 0}).sort("duration_ms", -1).to_list(limit)
+
+@app.get("/metrics", include_in_schema=False)
+async def get_metrics():
+    """Prometheus scrape endpoint"""
+    return PlainTextResponse(metrics.render(), media_type=metrics.CONTENT_TYPE)
+
 # Include router
 app.include_router(api_router)
 
@@ -755,12 +2992,35 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+app.add_middleware(metrics.PrometheusMiddleware)
+# Outermost, so storing a slow trace happens after the latency metric is recorded
+app.add_middleware(tracing.TracingMiddleware, threshold_ms=TRACE_SLOW_MS, on_slow=store_slow_trace)
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
 
+@app.on_event("startup")
+async def startup_ensure_indexes():
+    await ensure_traces_collection()
+    await ensure_indexes()
+    draft_buffer.start()
+    if RESUME_PARSE_IN_PROCESS:
+        resume_parse_queue.start()
+
 @app.on_event("shutdown")
 async def shutdown_db_client():
+    for interview_id in list(_prefetch_tasks):
+        cancel_prefetch(interview_id)
+    for task in list(_onboarding_tasks.values()):
+        task.cancel()
+    # Give evaluations that outlived their request a chance to land before the loop stops
+    if _deferred_evaluations:
+        await asyncio.wait(list(_deferred_evaluations.values()), timeout=DEFERRED_EVALUATION_DRAIN)
+    extraction_service.shutdown()
+    await draft_buffer.stop()
+    await resume_parse_queue.stop()
+    await llm_gateway.close()
     client.close()
\ No newline at end of file
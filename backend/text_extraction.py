@@ -0,0 +1,165 @@
+"""Resume text extraction offloaded to a bounded process pool.
+
+PDF and DOCX parsing is CPU-bound and would otherwise stall the event loop
+for every other request on the worker, so it runs in separate processes.
+"""
+import asyncio
+import io
+import logging
+import multiprocessing
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import islice
+from typing import Callable, Dict, Optional
+
+import PyPDF2
+import docx
+from fastapi import HTTPException
+
+MAX_FILE_BYTES = int(os.environ.get('EXTRACTION_MAX_BYTES', 10 * 1024 * 1024))
+MAX_PDF_PAGES = int(os.environ.get('EXTRACTION_MAX_PAGES', 50))
+EXTRACTION_TIMEOUT = float(os.environ.get('EXTRACTION_TIMEOUT', 20))
+EXTRACTION_WORKERS = int(os.environ.get('EXTRACTION_WORKERS', 2))
+EXTRACTION_MAX_QUEUE = int(os.environ.get('EXTRACTION_MAX_QUEUE', 32))
+
+def extract_text_from_pdf(file_content: bytes, max_pages: int = MAX_PDF_PAGES) -> str:
+    """Extract text from PDF file, reading at most max_pages pages"""
+    try:
+        pdf_reader = PyPDF2.PdfReader(io.BytesIO(file_content))
+        return "\n".join(page.extract_text() or "" for page in islice(pdf_reader.pages, max_pages))
+    except Exception as e:
+        logging.error(f"Error extracting PDF: {str(e)}")
+        return ""
+
+def extract_text_from_docx(file_content: bytes) -> str:
+    """Extract text from DOCX file"""
+    try:
+        doc = docx.Document(io.BytesIO(file_content))
+        return "\n".join(paragraph.text for paragraph in doc.paragraphs)
+    except Exception as e:
+        logging.error(f"Error extracting DOCX: {str(e)}")
+        return ""
+
+EXTRACTORS: Dict[str, Callable[[bytes], str]] = {
+    '.pdf': extract_text_from_pdf,
+    '.docx': extract_text_from_docx,
+}
+
+class ExtractionService:
+    """Runs extractors in a process pool with size caps, a bounded queue and timeouts"""
+
+    def __init__(self, workers: int = EXTRACTION_WORKERS, max_queue: int = EXTRACTION_MAX_QUEUE,
+                 timeout: float = EXTRACTION_TIMEOUT, max_bytes: int = MAX_FILE_BYTES):
+        self.workers = workers
+        self.max_queue = max_queue
+        self.timeout = timeout
+        self.max_bytes = max_bytes
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._slots = asyncio.Semaphore(workers)
+        self._waiting = 0
+        self.stats = {"completed": 0, "rejected": 0, "timeouts": 0, "cancelled": 0, "pool_restarts": 0}
+
+    def _pool(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # forkserver keeps children independent of the event loop and driver threads
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("forkserver")
+            )
+        return self._executor
+
+    def _recycle(self):
+        """Kill the pool so a runaway extraction stops consuming CPU"""
+        executor, self._executor = self._executor, None
+        if executor is None:
+            return
+        self.stats["pool_restarts"] += 1
+        # ProcessPoolExecutor cannot cancel a running call, so terminate its workers directly
+        for process in list((getattr(executor, '_processes', None) or {}).values()):
+            process.terminate()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    async def extract(self, filename: str, content: bytes) -> str:
+        """Extract text from an uploaded file without blocking the event loop"""
+        if len(content) > self.max_bytes:
+            self.stats["rejected"] += 1
+            raise HTTPException(status_code=413, detail="File too large")
+
+        filename = (filename or "").lower()
+        if filename.endswith('.txt'):
+            return content.decode('utf-8')
+        extractor = next((fn for ext, fn in EXTRACTORS.items() if filename.endswith(ext)), None)
+        if extractor is None:
+            raise HTTPException(status_code=400, detail="Unsupported file format")
+
+        if self._waiting >= self.max_queue:
+            self.stats["rejected"] += 1
+            raise HTTPException(status_code=503, detail="Extraction queue is full, please retry shortly")
+
+        self._waiting += 1
+        try:
+            await self._slots.acquire()
+        finally:
+            self._waiting -= 1
+        # _run gives the slot back once its job has left the pool
+        return await self._run(extractor, content)
+
+    async def _run(self, extractor: Callable[[bytes], str], content: bytes) -> str:
+        loop = asyncio.get_running_loop()
+        release = True
+        try:
+            for _ in range(2):
+                executor = self._pool()
+                started = loop.time()
+                job = executor.submit(extractor, content)
+                try:
+                    text = await asyncio.wait_for(asyncio.wrap_future(job), self.timeout)
+                    self.stats["completed"] += 1
+                    return text
+                except asyncio.TimeoutError:
+                    self.stats["timeouts"] += 1
+                    self._recycle()
+                    raise HTTPException(status_code=422, detail="Timed out extracting text from file")
+                except asyncio.CancelledError:
+                    # Client went away. The pool is shared with other uploads, so only this job is
+                    # dropped: a queued one is discarded, a running one is left to finish
+                    self.stats["cancelled"] += 1
+                    if not job.cancel():
+                        release = False
+                        self._abandon(job, executor, started + self.timeout)
+                    raise
+                except BrokenProcessPool:
+                    # A worker died or another caller recycled the pool; retry once on a fresh one
+                    if self._executor is executor:
+                        self._recycle()
+            raise HTTPException(status_code=500, detail="Extraction worker crashed")
+        finally:
+            if release:
+                self._slots.release()
+
+    def _abandon(self, job: Future, executor: ProcessPoolExecutor, deadline: float):
+        """Keep the slot of a running job nobody waits for until it finishes; at its timeout it is
+        a runaway and the pool is recycled, as for a job that is still awaited"""
+        loop = asyncio.get_running_loop()
+
+        def expire():
+            if not job.done() and self._executor is executor:
+                self.stats["timeouts"] += 1
+                self._recycle()
+
+        watchdog = loop.call_later(max(0.0, deadline - loop.time()), expire)
+
+        def finished(_):
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(watchdog.cancel)
+                loop.call_soon_threadsafe(self._slots.release)
+
+        job.add_done_callback(finished)
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+extraction_service = ExtractionService()
@@ -0,0 +1,132 @@
+"""Per-request stage tracing.
+
+TracingMiddleware opens a Trace for every HTTP request and keeps it in a
+contextvar. DB commands (via a pymongo listener), LLM calls (recorded by the
+gateway) and blocks wrapped in span() append spans to it. Spans are summed per
+name into the response's Server-Timing header; requests slower than the
+threshold are handed to an on_slow callback for persistence.
+"""
+import contextvars
+import logging
+import time
+from contextlib import contextmanager
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from pymongo import monitoring
+
+_current_trace: contextvars.ContextVar[Optional["Trace"]] = contextvars.ContextVar("trace", default=None)
+
+# Spans kept per trace; a runaway request should not grow without bound
+MAX_SPANS = 500
+
+class Trace:
+    def __init__(self, method: str, path: str):
+        self.method = method
+        self.path = path
+        self.route: Optional[str] = None
+        self.started = time.perf_counter()
+        self.spans: List[Dict[str, Any]] = []
+        self.totals: Dict[str, float] = {}
+        self.finished = False
+
+    def add(self, name: str, started: float, duration: float, detail: Optional[str] = None):
+        # Background tasks inherit the request's context; ignore anything after the response
+        if self.finished:
+            return
+        self.totals[name] = self.totals.get(name, 0.0) + duration
+        if len(self.spans) < MAX_SPANS:
+            span = {"name": name, "start_ms": round((started - self.started) * 1000, 2),
+                    "duration_ms": round(duration * 1000, 2)}
+            if detail:
+                span["detail"] = detail
+            self.spans.append(span)
+
+    def server_timing(self) -> str:
+        parts = [f"{name};dur={seconds * 1000:.1f}" for name, seconds in self.totals.items()]
+        parts.append(f"total;dur={(time.perf_counter() - self.started) * 1000:.1f}")
+        return ", ".join(parts)
+
+def current_trace() -> Optional[Trace]:
+    return _current_trace.get()
+
+def record(name: str, started: float, duration: float, detail: Optional[str] = None):
+    """Attach a finished span (perf_counter start, seconds) to the current request, if any"""
+    trace = _current_trace.get()
+    if trace is not None:
+        trace.add(name, started, duration, detail)
+
+@contextmanager
+def span(name: str, detail: Optional[str] = None):
+    """Time the enclosed block as a span of the current request"""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(name, started, time.perf_counter() - started, detail)
+
+class TracingMiddleware:
+    """ASGI middleware adding Server-Timing and reporting requests slower than threshold_ms"""
+
+    def __init__(self, app, threshold_ms: float,
+                 on_slow: Optional[Callable[[Dict[str, Any]], Awaitable[None]]] = None):
+        self.app = app
+        self.threshold_ms = threshold_ms
+        self.on_slow = on_slow
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        trace = Trace(scope["method"], scope["path"])
+        token = _current_trace.set(trace)
+        status = 500
+
+        async def send_with_timing(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", trace.server_timing().encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current_trace.reset(token)
+            trace.finished = True
+            duration_ms = (time.perf_counter() - trace.started) * 1000
+            if self.on_slow and duration_ms >= self.threshold_ms:
+                route = scope.get("route")
+                try:
+                    await self.on_slow({
+                        "method": trace.method,
+                        "path": trace.path,
+                        "route": getattr(route, "path", None),
+                        "status": status,
+                        "duration_ms": round(duration_ms, 2),
+                        "stages_ms": {name: round(s * 1000, 2) for name, s in trace.totals.items()},
+                        "spans": trace.spans,
+                    })
+                except Exception as e:
+                    logging.error(f"Error storing slow request trace: {str(e)}")
+
+class MongoCommandSpans(monitoring.CommandListener):
+    """Records every MongoDB command as a "db" span; motor copies the caller's context to its threads"""
+
+    def started(self, event):
+        pass
+
+    def _record(self, event):
+        trace = _current_trace.get()
+        if trace is not None:
+            duration = event.duration_micros / 1e6
+            trace.add("db", time.perf_counter() - duration, duration, event.command_name)
+
+    def succeeded(self, event):
+        self._record(event)
+
+    def failed(self, event):
+        self._record(event)
+
+mongo_command_spans = MongoCommandSpans()
@@ -0,0 +1,135 @@
+"""Latency of /assistant/help under overload, with and without admission control.
+
+Runs the FastAPI app in-process against the stub LLM (benchmarks/stub_llm.py)
+with the LLM gateway limited to --llm-concurrency calls, i.e. a capacity of
+about llm_concurrency / llm_latency requests per second. Requests arrive
+open-loop at --overload times that capacity for --duration seconds, each for
+its own interview, plus one noisy interview sending --noisy-rps on its own.
+
+For each mode reports how many requests got an LLM answer ("ok"), a deadline
+fallback, a 503 or a 429, and latency percentiles of the ok responses. Without
+admission control every request queues in front of the LLM and latency climbs
+for all of them; with it the newest arrivals are shed quickly and admitted
+requests stay close to the uncontended latency.
+
+Usage: python benchmarks/admission_control.py [--duration 15] [--overload 2] [--output results.json]
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(BENCH_DIR.parent / "backend"))
+sys.path.insert(0, str(BENCH_DIR))
+
+from load_test import configure_database, percentile, use_in_memory_database  # noqa: E402
+
+ASSISTANT_FALLBACK = "I'm here to help! Please try rephrasing your question."
+
+async def drive(client, db, args, capacity: float) -> dict:
+    statuses: Counter = Counter()
+    ok_latencies: list = []
+    all_latencies: list = []
+
+    async def request(interview_id: str, noisy: bool = False):
+        started = time.perf_counter()
+        response = await client.post("/api/assistant/help", json={
+            "interview_id": interview_id,
+            "question": "How would you design a rate limiter?",
+            "user_message": "Where should I start?"
+        })
+        elapsed = (time.perf_counter() - started) * 1000
+        if noisy:
+            statuses[f"noisy_{response.status_code}"] += 1
+            return
+        all_latencies.append(elapsed)
+        if response.status_code == 200:
+            fallback = response.json()["response"] == ASSISTANT_FALLBACK
+            statuses["fallback" if fallback else "ok"] += 1
+            if not fallback:
+                ok_latencies.append(elapsed)
+        else:
+            statuses[str(response.status_code)] += 1
+
+    rate = capacity * args.overload
+    # The assistant only rate-limits (and answers) interviews that exist
+    interview_ids = [f"bench-{os.getpid()}-{time.time_ns()}-{index}" for index in range(int(rate * args.duration))]
+    await db.interviews.insert_many([{"id": interview_id} for interview_id in interview_ids])
+    if not await db.interviews.find_one({"id": "noisy-interview"}):
+        await db.interviews.insert_one({"id": "noisy-interview"})
+    tasks = []
+    started = time.perf_counter()
+    noisy_every = max(1, round(rate / args.noisy_rps)) if args.noisy_rps else 0
+    for index, interview_id in enumerate(interview_ids):
+        # Open loop: arrivals keep coming at the offered rate however slow the responses get
+        tasks.append(asyncio.create_task(request(interview_id)))
+        if noisy_every and index % noisy_every == 0:
+            tasks.append(asyncio.create_task(request("noisy-interview", noisy=True)))
+        await asyncio.sleep(max(0.0, started + (index + 1) / rate - time.perf_counter()))
+    await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - started
+
+    ok_latencies.sort()
+    all_latencies.sort()
+    return {
+        "offered_rps": round(rate, 1),
+        "responses": dict(statuses),
+        "goodput_rps": round(statuses["ok"] / elapsed, 1),
+        "ok_latency_ms": {
+            "p50": percentile(ok_latencies, 50),
+            "p95": percentile(ok_latencies, 95),
+            "p99": percentile(ok_latencies, 99),
+        },
+        "all_latency_ms_p99": percentile(all_latencies, 99),
+    }
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--duration", type=float, default=15)
+    parser.add_argument("--overload", type=float, default=2.0, help="offered load as a multiple of capacity")
+    parser.add_argument("--llm-latency-ms", type=float, default=500)
+    parser.add_argument("--llm-jitter-ms", type=float, default=100)
+    parser.add_argument("--llm-concurrency", type=int, default=16)
+    parser.add_argument("--noisy-rps", type=float, default=5, help="requests per second from one interview")
+    parser.add_argument("--mongo-url", default=os.environ.get("MONGO_URL", "mongodb://localhost:27017"))
+    parser.add_argument("--db-name", default=f"admission_bench_{int(time.time())}")
+    parser.add_argument("--output", help="write the JSON results to this file")
+    args = parser.parse_args()
+
+    configure_database(args)
+    os.environ["LLM_MAX_CONCURRENCY"] = str(args.llm_concurrency)
+    import httpx
+    import server
+    import stub_llm
+
+    stub_llm.install(args.llm_latency_ms, args.llm_jitter_ms)
+    use_in_memory_database(server)
+    await server.startup_ensure_indexes()
+    capacity = args.llm_concurrency / (args.llm_latency_ms / 1000)
+
+    results = {"config": {key: value for key, value in vars(args).items() if key != "output"},
+               "capacity_rps": round(capacity, 1)}
+    transport = httpx.ASGITransport(app=server.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://admission-bench", timeout=300) as client:
+        for mode, enabled in (("without_admission", False), ("with_admission", True)):
+            for limiter in server.ADMISSION_LIMITERS.values():
+                limiter.enabled = enabled
+            server.assistant_buckets.enabled = enabled
+            results[mode] = await drive(client, server.db, args, capacity)
+            results[mode]["admission"] = server.ADMISSION_LIMITERS["assistant_help"].snapshot()
+
+    await server.draft_buffer.stop()
+    await server.resume_parse_queue.stop()
+
+    output = json.dumps(results, indent=2)
+    print(output)
+    if args.output:
+        Path(args.output).write_text(output)
+
+if __name__ == "__main__":
+    asyncio.run(main())
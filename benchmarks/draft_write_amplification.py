@@ -0,0 +1,106 @@
+"""Write amplification of draft autosaves: per-save upserts vs the DraftBuffer.
+
+Simulates --candidates candidates autosaving every --save-ms for --seconds.
+The drafts collection is replaced by a counter that records how many
+database round trips and document writes each strategy issues, so the
+numbers reflect the backend's behaviour rather than Mongo's speed.
+
+Usage: python benchmarks/draft_write_amplification.py [--candidates 300] [--seconds 10]
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+os.environ.setdefault("MONGO_URL", "mongodb://localhost:27017")
+os.environ.setdefault("DB_NAME", "benchmark")
+os.environ.setdefault("EMERGENT_LLM_KEY", "benchmark")
+
+from server import DraftBuffer  # noqa: E402
+
+class CountingCollection:
+    """Records round trips and documents written instead of talking to Mongo"""
+
+    def __init__(self):
+        self.round_trips = 0
+        self.documents_written = 0
+
+    async def update_one(self, *args, **kwargs):
+        self.round_trips += 1
+        self.documents_written += 1
+
+    async def bulk_write(self, operations, ordered=True):
+        self.round_trips += 1
+        self.documents_written += len(operations)
+
+async def candidate(index: int, save, seconds: float, save_interval: float):
+    await asyncio.sleep(random.random() * save_interval)
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + seconds
+    question = 0
+    while loop.time() < deadline:
+        # Move on to the next question every ~20 saves
+        if random.random() < 0.05:
+            question += 1
+        await save(f"interview-{index}", f"question-{question}", "draft text " * 20)
+        await asyncio.sleep(save_interval)
+
+async def run(strategy: str, args) -> dict:
+    collection = CountingCollection()
+    saves = 0
+    if strategy == "direct":
+        async def save(interview_id, question_id, draft):
+            nonlocal saves
+            saves += 1
+            await collection.update_one(
+                {"interview_id": interview_id, "question_id": question_id},
+                {"$set": {"draft_answer": draft}},
+                upsert=True
+            )
+    else:
+        buffer = DraftBuffer(collection, interval=args.flush_seconds, max_pending=args.max_pending)
+        buffer.start()
+
+        async def save(interview_id, question_id, draft):
+            nonlocal saves
+            saves += 1
+            buffer.put(interview_id, question_id, draft)
+
+    await asyncio.gather(*[
+        candidate(i, save, args.seconds, args.save_ms / 1000) for i in range(args.candidates)
+    ])
+    if strategy == "buffered":
+        await buffer.stop()
+
+    return {
+        "strategy": strategy,
+        "saves": saves,
+        "round_trips": collection.round_trips,
+        "documents_written": collection.documents_written,
+        "round_trips_per_second": round(collection.round_trips / args.seconds, 1),
+    }
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--candidates", type=int, default=300)
+    parser.add_argument("--seconds", type=float, default=10)
+    parser.add_argument("--save-ms", type=float, default=500)
+    parser.add_argument("--flush-seconds", type=float, default=2)
+    parser.add_argument("--max-pending", type=int, default=500)
+    args = parser.parse_args()
+
+    direct = await run("direct", args)
+    buffered = await run("buffered", args)
+    for result in (direct, buffered):
+        print(json.dumps(result))
+    print(json.dumps({
+        "round_trip_reduction": round(direct["round_trips"] / max(buffered["round_trips"], 1), 1),
+        "document_write_reduction": round(direct["documents_written"] / max(buffered["documents_written"], 1), 1),
+    }))
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,112 @@
+"""Event-loop lag while large PDFs are parsed concurrently.
+
+Compares parsing inline on the event loop (the old upload_resume behaviour)
+with the process-pool ExtractionService. A probe task sleeps for a fixed
+interval in a loop and records how late it wakes up; that overshoot is the
+lag every other request on the worker would see.
+
+Usage: python benchmarks/extraction_event_loop_lag.py [--pages 20] [--files 8]
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+from text_extraction import ExtractionService, extract_text_from_pdf  # noqa: E402
+
+PROBE_INTERVAL = 0.005
+
+def build_pdf(pages: int, lines_per_page: int = 60) -> bytes:
+    """Build a text-only PDF with the given number of pages"""
+    objects = [b"<< /Type /Catalog /Pages 2 0 R >>", None,
+               b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    page_ids = []
+    for page in range(pages):
+        lines = [f"(Page {page + 1} line {i}: Python FastAPI MongoDB Kubernetes distributed systems) Tj T*"
+                 for i in range(lines_per_page)]
+        stream = ("BT /F1 9 Tf 11 TL 40 800 Td " + " ".join(lines) + " ET").encode()
+        objects.append(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+        content_id = len(objects)
+        objects.append(("<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 842] "
+                        f"/Resources << /Font << /F1 3 0 R >> >> /Contents {content_id} 0 R >>").encode())
+        page_ids.append(len(objects))
+    kids = " ".join(f"{pid} 0 R" for pid in page_ids)
+    objects[1] = f"<< /Type /Pages /Kids [{kids}] /Count {pages} >>".encode()
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return bytes(out)
+
+async def probe_lag(stop: asyncio.Event, samples: list):
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        start = loop.time()
+        await asyncio.sleep(PROBE_INTERVAL)
+        samples.append((loop.time() - start - PROBE_INTERVAL) * 1000)
+
+async def run_mode(mode: str, pdf: bytes, files: int, service: ExtractionService) -> dict:
+    samples: list = []
+    stop = asyncio.Event()
+    probe = asyncio.create_task(probe_lag(stop, samples))
+    await asyncio.sleep(0.05)
+
+    async def inline():
+        # Old behaviour: synchronous parse inside the async route
+        await asyncio.sleep(0)
+        return extract_text_from_pdf(pdf)
+
+    started = time.perf_counter()
+    if mode == "inline":
+        results = await asyncio.gather(*[inline() for _ in range(files)])
+    else:
+        results = await asyncio.gather(*[service.extract("resume.pdf", pdf) for _ in range(files)])
+    elapsed = time.perf_counter() - started
+
+    stop.set()
+    await probe
+    samples.sort()
+    return {
+        "mode": mode,
+        "files": files,
+        "wall_seconds": round(elapsed, 3),
+        "chars_per_file": len(results[0]),
+        "lag_ms_p50": round(statistics.median(samples), 2),
+        "lag_ms_p99": round(samples[int(len(samples) * 0.99) - 1], 2),
+        "lag_ms_max": round(samples[-1], 2),
+        "probe_samples": len(samples),
+    }
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=20)
+    parser.add_argument("--files", type=int, default=8)
+    parser.add_argument("--workers", type=int, default=2)
+    args = parser.parse_args()
+
+    pdf = build_pdf(args.pages)
+    service = ExtractionService(workers=args.workers)
+    # Warm the pool so process start-up is not counted against the pooled mode
+    await service.extract("warmup.pdf", build_pdf(1))
+
+    results = [
+        await run_mode("inline", pdf, args.files, service),
+        await run_mode("process_pool", pdf, args.files, service),
+    ]
+    service.shutdown()
+    for result in results:
+        print(json.dumps(result))
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,84 @@
+"""Tail latency of LLM calls with and without request hedging.
+
+Drives the LLM gateway directly with a stub provider whose latency is
+usually --base-ms but, with probability --slow-rate, --slow-ms. Reports
+p50/p95/p99 per mode plus the gateway's hedge counters (issued, won, lost,
+capped), where every issued hedge is one extra provider call.
+
+Usage: python benchmarks/llm_hedging.py [--calls 2000] [--concurrency 20]
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+os.environ.setdefault("EMERGENT_LLM_KEY", "benchmark")
+
+import llm_gateway  # noqa: E402
+
+def install_stub(base_ms: float, slow_ms: float, slow_rate: float):
+    class StubChat:
+        def __init__(self, **kwargs):
+            pass
+
+        def with_model(self, *args):
+            return self
+
+        async def send_message(self, message):
+            slow = random.random() < slow_rate
+            await asyncio.sleep((slow_ms if slow else random.uniform(0.8, 1.2) * base_ms) / 1000)
+            return "ok"
+
+    llm_gateway.LlmChat = StubChat
+
+def percentile(values: list, pct: float) -> float:
+    ordered = sorted(values)
+    return round(ordered[min(len(ordered) - 1, int(len(ordered) * pct))] * 1000, 1)
+
+async def run(hedge: bool, calls: int, concurrency: int) -> dict:
+    gateway = llm_gateway.LlmGateway()
+    gateway.hedge_enabled = hedge
+    latencies = []
+    slots = asyncio.Semaphore(concurrency)
+
+    async def call(index: int):
+        async with slots:
+            started = time.perf_counter()
+            await gateway.complete("eval", f"bench_{index}", "system", "prompt", hedge=True)
+            latencies.append(time.perf_counter() - started)
+
+    await asyncio.gather(*[call(i) for i in range(calls)])
+    await gateway.close()
+    hedging = gateway.stats()["hedging"]["call_sites"].get("eval", {})
+    return {
+        "mode": "hedged" if hedge else "plain",
+        "calls": calls,
+        "p50_ms": percentile(latencies, 0.50),
+        "p95_ms": percentile(latencies, 0.95),
+        "p99_ms": percentile(latencies, 0.99),
+        "max_ms": round(max(latencies) * 1000, 1),
+        "hedges": {key: hedging.get(key, 0) for key in ("issued", "won", "lost", "capped")},
+        "extra_call_rate": round(hedging.get("issued", 0) / calls, 4),
+    }
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--base-ms", type=float, default=50)
+    parser.add_argument("--slow-ms", type=float, default=1000)
+    parser.add_argument("--slow-rate", type=float, default=0.03)
+    args = parser.parse_args()
+
+    install_stub(args.base_ms, args.slow_ms, args.slow_rate)
+    for hedge in (False, True):
+        random.seed(7)
+        print(json.dumps(await run(hedge, args.calls, args.concurrency)))
+
+if __name__ == "__main__":
+    asyncio.run(main())
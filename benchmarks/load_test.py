@@ -0,0 +1,247 @@
+"""Offline load test of the full interview flow.
+
+Runs the FastAPI app in-process against a stub LLM (benchmarks/stub_llm.py)
+and either a local mongod or an in-memory stand-in, then drives N concurrent
+candidates through:
+
+    create_interview -> upload_resume -> upload_jd -> start -> submit_answer x8 -> report
+
+Reports p50/p95/p99 latency per endpoint, requests/sec and event-loop lag as
+JSON. With --baseline, exits non-zero if any endpoint's p95 regressed by more
+than --tolerance against a previous --output file.
+
+Usage:
+    python benchmarks/load_test.py --candidates 50 --in-memory --output results.json
+    python benchmarks/load_test.py --candidates 200 --mongo-url mongodb://localhost:27017 \\
+        --baseline results.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import sys
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(BENCH_DIR.parent / "backend"))
+sys.path.insert(0, str(BENCH_DIR))
+
+PROBE_INTERVAL = 0.01
+
+JD_TEXT = ("We are hiring a backend engineer with strong Python, FastAPI and MongoDB experience. "
+           "You will design REST APIs, own data modelling and indexing, and run services on Docker "
+           "and Kubernetes. Must have: 3+ years Python, async IO, SQL or NoSQL databases.")
+
+ANSWERS = [
+    "I would start by clarifying the access patterns, then add a compound index that matches the "
+    "filter and sort order, and verify with explain that the plan uses an index scan.",
+    "A token bucket per client works well: refill at a fixed rate, reject when empty, and keep the "
+    "state in Redis so every instance shares it.",
+    "I'm not sure",
+]
+
+def resume_text(index: int, unique: bool) -> bytes:
+    suffix = f" Candidate reference {index}." if unique else ""
+    return (f"Software engineer with 4 years of Python, FastAPI, MongoDB and Docker experience. "
+            f"Built high-throughput REST services and data pipelines.{suffix}").encode()
+
+class Recorder:
+    def __init__(self):
+        self.latencies = defaultdict(list)
+        self.errors = defaultdict(int)
+
+    async def call(self, client, endpoint: str, method: str, url: str, **kwargs):
+        started = time.perf_counter()
+        response = await client.request(method, url, **kwargs)
+        self.latencies[endpoint].append((time.perf_counter() - started) * 1000)
+        if response.status_code >= 400:
+            self.errors[endpoint] += 1
+            raise RuntimeError(f"{endpoint} -> {response.status_code}: {response.text[:200]}")
+        return response.json()
+
+def percentile(sorted_values: list, pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(pct / 100 * len(sorted_values))) - 1))
+    return round(sorted_values[index], 2)
+
+async def run_candidate(index: int, client, recorder: Recorder, args):
+    interview = await recorder.call(client, "POST /interviews", "POST", "/api/interviews", json={
+        "candidate_name": f"Candidate {index}", "candidate_email": f"candidate{index}@example.com"
+    })
+    interview_id = interview["id"]
+    await recorder.call(
+        client, "POST /upload-resume", "POST", f"/api/interviews/{interview_id}/upload-resume",
+        files={"file": ("resume.txt", resume_text(index, args.unique_resumes), "text/plain")}
+    )
+    await recorder.call(
+        client, "POST /upload-jd", "POST", f"/api/interviews/{interview_id}/upload-jd",
+        data={"jd_text": JD_TEXT}
+    )
+    question = await recorder.call(client, "POST /start", "POST", f"/api/interviews/{interview_id}/start")
+
+    while question:
+        # Candidate think time, during which prefetch and other background work can run
+        await asyncio.sleep(random.uniform(0.5, 1.5) * args.think_ms / 1000)
+        result = await recorder.call(
+            client, "POST /answer", "POST",
+            f"/api/interviews/{interview_id}/questions/{question['id']}/answer",
+            json={"answer_text": random.choice(ANSWERS), "time_taken": random.randint(30, 200)}
+        )
+        question = result.get("question")
+
+    await recorder.call(client, "GET /report", "GET", f"/api/interviews/{interview_id}/report")
+
+async def probe_lag(stop: asyncio.Event, samples: list):
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        started = loop.time()
+        await asyncio.sleep(PROBE_INTERVAL)
+        samples.append((loop.time() - started - PROBE_INTERVAL) * 1000)
+
+def configure_database(args):
+    os.environ["MONGO_URL"] = args.mongo_url
+    os.environ["DB_NAME"] = args.db_name
+    os.environ.setdefault("EMERGENT_LLM_KEY", "load-test")
+
+def use_in_memory_database(server):
+    try:
+        from mongomock_motor import AsyncMongoMockClient
+    except ImportError:
+        sys.exit("--in-memory needs the mongomock-motor package (pip install mongomock-motor)")
+    server.client = AsyncMongoMockClient()
+    server.db = server.client[os.environ["DB_NAME"]]
+    server.draft_buffer.collection = server.db.drafts
+    server.resume_parse_queue.claim = in_memory_claim(server)
+
+def in_memory_claim(server):
+    """Resume parse job claim that works on mongomock.
+
+    mongomock re-applies the filter to the updated document for ReturnDocument.AFTER, so the
+    queue's find_one_and_update claims a job but returns None and the job is stuck until its
+    lease expires. Claim with a read and a conditional update instead.
+    """
+    queue = server.resume_parse_queue
+
+    async def claim():
+        jobs = server.db.resume_parse_jobs
+        while True:
+            now = datetime.now(timezone.utc)
+            job = await jobs.find_one(queue.claimable(now), {"_id": 0}, sort=[("next_attempt_at", 1)])
+            if job is None:
+                return None
+            update = queue.claim_update(now)
+            result = await jobs.update_one(
+                {"id": job["id"], "status": job["status"], "attempts": job["attempts"]}, update
+            )
+            if result.modified_count:
+                return {**job, **update["$set"], "attempts": job["attempts"] + 1}
+            # Another worker claimed it first; look for the next one
+
+    return claim
+
+def compare_to_baseline(results: dict, baseline_path: str, tolerance: float) -> list:
+    baseline = json.loads(Path(baseline_path).read_text())
+    regressions = []
+    for endpoint, stats in results["endpoints"].items():
+        previous = baseline.get("endpoints", {}).get(endpoint)
+        if previous and previous["p95_ms"] and stats["p95_ms"] > previous["p95_ms"] * (1 + tolerance):
+            regressions.append({"endpoint": endpoint, "baseline_p95_ms": previous["p95_ms"],
+                                "p95_ms": stats["p95_ms"]})
+    return regressions
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--candidates", type=int, default=50)
+    parser.add_argument("--llm-latency-ms", type=float, default=800)
+    parser.add_argument("--llm-jitter-ms", type=float, default=200)
+    parser.add_argument("--think-ms", type=float, default=1000)
+    parser.add_argument("--unique-resumes", action="store_true",
+                        help="give every candidate a distinct resume (defeats the parse cache)")
+    parser.add_argument("--mongo-url", default=os.environ.get("MONGO_URL", "mongodb://localhost:27017"))
+    parser.add_argument("--db-name", default=f"load_test_{int(time.time())}")
+    parser.add_argument("--in-memory", action="store_true", help="use mongomock-motor instead of mongod")
+    parser.add_argument("--output", help="write the JSON results to this file")
+    parser.add_argument("--baseline", help="previous --output file to compare p95 latencies against")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args()
+
+    configure_database(args)
+    import httpx
+    import server
+    import stub_llm
+
+    stub_llm.install(args.llm_latency_ms, args.llm_jitter_ms)
+    if args.in_memory:
+        use_in_memory_database(server)
+    await server.startup_ensure_indexes()
+
+    recorder = Recorder()
+    lag_samples: list = []
+    stop = asyncio.Event()
+    probe = asyncio.create_task(probe_lag(stop, lag_samples))
+
+    transport = httpx.ASGITransport(app=server.app)
+    started = time.perf_counter()
+    async with httpx.AsyncClient(transport=transport, base_url="http://load-test", timeout=300) as client:
+        outcomes = await asyncio.gather(
+            *[run_candidate(i, client, recorder, args) for i in range(args.candidates)],
+            return_exceptions=True
+        )
+    elapsed = time.perf_counter() - started
+
+    stop.set()
+    await probe
+    await server.draft_buffer.stop()
+    await server.resume_parse_queue.stop()
+    if not args.in_memory:
+        await server.client.drop_database(args.db_name)
+
+    failures = [str(outcome) for outcome in outcomes if isinstance(outcome, Exception)]
+    total_requests = sum(len(samples) for samples in recorder.latencies.values())
+    lag_samples.sort()
+    results = {
+        "config": {key: value for key, value in vars(args).items() if key not in ("output", "baseline")},
+        "duration_s": round(elapsed, 2),
+        "requests": total_requests,
+        "requests_per_s": round(total_requests / elapsed, 2),
+        "candidates_failed": len(failures),
+        "endpoints": {
+            endpoint: {
+                "count": len(samples),
+                "errors": recorder.errors[endpoint],
+                "mean_ms": round(statistics.fmean(samples), 2),
+                "p50_ms": percentile(sorted(samples), 50),
+                "p95_ms": percentile(sorted(samples), 95),
+                "p99_ms": percentile(sorted(samples), 99),
+            }
+            for endpoint, samples in recorder.latencies.items()
+        },
+        "event_loop_lag_ms": {
+            "p50": percentile(lag_samples, 50),
+            "p99": percentile(lag_samples, 99),
+            "max": round(lag_samples[-1], 2) if lag_samples else 0.0,
+        },
+        "prefetch": await server.get_prefetch_stats(),
+        "llm": server.llm_gateway.stats()["call_sites"],
+        "sample_failures": failures[:5],
+    }
+
+    exit_code = 0
+    if args.baseline:
+        results["regressions"] = compare_to_baseline(results, args.baseline, args.tolerance)
+        exit_code = 1 if results["regressions"] else 0
+
+    output = json.dumps(results, indent=2)
+    print(output)
+    if args.output:
+        Path(args.output).write_text(output)
+    return exit_code
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,67 @@
+"""Agreement of the local answer pre-scorer with labelled answers.
+
+Runs backend/answer_prescorer.py over a labelled sample (JSON lines with
+question, answer, label "bad"/"ok" and a reference score), one answer at a
+time through prescore_answer exactly as evaluate_answer does, and reports how
+many LLM evaluations it would skip, how often a local verdict agrees with the
+label and how far local scores are from the reference scores.
+
+Usage: python benchmarks/prescorer_agreement.py [--sample benchmarks/data/prescorer_sample.jsonl]
+"""
+import argparse
+import json
+import sys
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(BENCH_DIR.parent / "backend"))
+
+from answer_prescorer import prescore_answer  # noqa: E402
+
+# server.FALLBACK_QUESTION, served when question generation fails
+FALLBACK_QUESTION = "Please describe your experience with the technologies mentioned in the job description."
+
+JD_TEXT = ("We are hiring a backend engineer with strong Python, FastAPI and MongoDB experience. "
+           "You will design REST APIs, own data modelling and indexing, and run services on Docker "
+           "and Kubernetes. Must have: 3+ years Python, async IO, SQL or NoSQL databases.")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sample", default=str(BENCH_DIR / "data" / "prescorer_sample.jsonl"))
+    parser.add_argument("--jd", default=JD_TEXT)
+    args = parser.parse_args()
+
+    rows = [json.loads(line) for line in Path(args.sample).read_text().splitlines() if line.strip()]
+    # Row by row: IDF over the whole sample would not measure what production scores
+    verdicts = [
+        prescore_answer(row["question"], row["answer"], args.jd,
+                        off_topic_check=row["question"] != FALLBACK_QUESTION)
+        for row in rows
+    ]
+
+    local = [(row, verdict) for row, verdict in zip(rows, verdicts) if verdict]
+    bad = [row for row in rows if row["label"] == "bad"]
+    agreeing = [row for row, _ in local if row["label"] == "bad"]
+    results = {
+        "answers": len(rows),
+        "labelled_bad": len(bad),
+        "decided_locally": len(local),
+        "llm_call_reduction": round(len(local) / len(rows), 3),
+        "precision": round(len(agreeing) / len(local), 3) if local else None,
+        "recall_of_bad": round(len(agreeing) / len(bad), 3) if bad else None,
+        "mean_abs_score_error": round(
+            sum(abs(verdict["score"] - row["score"]) for row, verdict in local) / len(local), 2
+        ) if local else None,
+        "by_reason": {},
+        "disagreements": [
+            {"answer": row["answer"], "label": row["label"], "reason": verdict["reason"]}
+            for row, verdict in local if row["label"] != "bad"
+        ],
+        "missed_bad": [row["answer"] for row, verdict in zip(rows, verdicts) if row["label"] == "bad" and not verdict],
+    }
+    for _, verdict in local:
+        results["by_reason"][verdict["reason"]] = results["by_reason"].get(verdict["reason"], 0) + 1
+    print(json.dumps(results, indent=2))
+
+if __name__ == "__main__":
+    main()
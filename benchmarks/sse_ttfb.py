@@ -0,0 +1,101 @@
+"""Time-to-first-byte of the JSON vs Server-Sent-Events assistant endpoints.
+
+Runs the app under uvicorn in-process with the LLM replaced by a stub that
+emits --tokens chunks, --token-ms apart. The JSON endpoint can only answer
+once the whole completion is in; the SSE endpoint forwards the first chunk
+as soon as it arrives.
+
+Usage: python benchmarks/sse_ttfb.py [--requests 20] [--tokens 60] [--token-ms 25]
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+os.environ.setdefault("MONGO_URL", "mongodb://localhost:27017")
+os.environ.setdefault("DB_NAME", "benchmark")
+os.environ.setdefault("EMERGENT_LLM_KEY", "benchmark")
+
+import httpx  # noqa: E402
+import uvicorn  # noqa: E402
+
+import llm_gateway  # noqa: E402
+import server  # noqa: E402
+
+PORT = 8765
+
+def install_stub_llm(tokens: int, token_delay: float):
+    words = [f"word{i} " for i in range(tokens)]
+
+    class StubChat:
+        def __init__(self, **kwargs):
+            pass
+
+        def with_model(self, *args):
+            return self
+
+        async def send_message(self, message):
+            await asyncio.sleep(token_delay * tokens)
+            return "".join(words)
+
+    async def stub_stream():
+        for word in words:
+            await asyncio.sleep(token_delay)
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=word))])
+
+    async def stub_acompletion(**kwargs):
+        return stub_stream()
+
+    llm_gateway.LlmChat = StubChat
+    llm_gateway.litellm.acompletion = stub_acompletion
+
+async def measure(client: httpx.AsyncClient, path: str) -> tuple:
+    body = {"interview_id": "bench", "question": "Explain CAP theorem", "user_message": "Where do I start?"}
+    started = time.perf_counter()
+    ttfb = None
+    async with client.stream("POST", path, json=body) as response:
+        async for chunk in response.aiter_bytes():
+            if ttfb is None and chunk:
+                ttfb = time.perf_counter() - started
+    return ttfb * 1000, (time.perf_counter() - started) * 1000
+
+def summarize(mode: str, samples: list) -> dict:
+    ttfb = sorted(s[0] for s in samples)
+    total = sorted(s[1] for s in samples)
+    return {
+        "mode": mode,
+        "requests": len(samples),
+        "ttfb_ms_p50": round(statistics.median(ttfb), 1),
+        "ttfb_ms_p95": round(ttfb[int(len(ttfb) * 0.95) - 1], 1),
+        "total_ms_p50": round(statistics.median(total), 1),
+    }
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=20)
+    parser.add_argument("--tokens", type=int, default=60)
+    parser.add_argument("--token-ms", type=float, default=25)
+    args = parser.parse_args()
+
+    install_stub_llm(args.tokens, args.token_ms / 1000)
+    uv = uvicorn.Server(uvicorn.Config(server.app, port=PORT, log_level="warning", lifespan="off"))
+    serve = asyncio.create_task(uv.serve())
+    while not uv.started:
+        await asyncio.sleep(0.05)
+
+    async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{PORT}", timeout=60) as client:
+        for mode, path in (("json", "/api/assistant/help"), ("sse", "/api/assistant/help/stream")):
+            samples = await asyncio.gather(*[measure(client, path) for _ in range(args.requests)])
+            print(json.dumps(summarize(mode, samples)))
+
+    uv.should_exit = True
+    await serve
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,87 @@
+"""Local stand-in for the LLM provider used by the offline benchmarks.
+
+install() swaps LlmChat and litellm.acompletion inside llm_gateway for stubs
+that sleep for a configurable latency (plus jitter) and return well-formed
+responses for each prompt the backend sends.
+"""
+import asyncio
+import json
+import random
+from types import SimpleNamespace
+
+import llm_gateway
+
+class StubConfig:
+    latency_ms = 800.0
+    jitter_ms = 200.0
+    stream_chunks = 20
+
+    @classmethod
+    def delay(cls) -> float:
+        return max(0.0, random.gauss(cls.latency_ms, cls.jitter_ms)) / 1000
+
+def respond(prompt: str) -> str:
+    """Canned completion matching the prompt's expected response format"""
+    if "Analyze this resume" in prompt:
+        return json.dumps({
+            "skills": ["Python", "FastAPI", "MongoDB", "Docker"],
+            "experience_years": "4",
+            "projects": "Built an interview platform",
+            "education": "B.Tech Computer Science"
+        })
+    if "Extract the hiring requirements" in prompt:
+        return json.dumps({
+            "role": "Backend Engineer",
+            "seniority": "mid",
+            "must_haves": ["3+ years Python", "async IO", "SQL or NoSQL databases"],
+            "skills": ["Python", "FastAPI", "MongoDB", "Docker", "Kubernetes"],
+            "nice_to_haves": []
+        })
+    if "TIME_ALLOCATED" in prompt:
+        return f"TIME_ALLOCATED: 180\nHow would you design a rate limiter? ({random.randint(0, 10 ** 6)})"
+    if "interview question" in prompt:
+        return json.dumps({
+            "question": f"Explain how you would index a MongoDB collection for query #{random.randint(0, 10 ** 6)}.",
+            "time_allocated": 180
+        })
+    if "Evaluate this interview answer" in prompt:
+        return json.dumps({
+            "score": random.randint(40, 95),
+            "feedback": "Solid structure, could go deeper on trade-offs.",
+            "strengths": "Clear explanation",
+            "weaknesses": "Limited depth"
+        })
+    if "Top 3 strengths" in prompt:
+        return json.dumps({
+            "strengths": ["Clarity", "Fundamentals", "Pace"],
+            "weaknesses": ["Depth", "Examples", "Edge cases"],
+            "recommendations": ["Practise system design", "Use concrete examples", "Discuss trade-offs"]
+        })
+    return "Think about the constraints first, then walk through a small example."
+
+class StubLlmChat:
+    def __init__(self, api_key=None, session_id=None, system_message=None):
+        pass
+
+    def with_model(self, *args):
+        return self
+
+    async def send_message(self, message) -> str:
+        await asyncio.sleep(StubConfig.delay())
+        return respond(message.text)
+
+async def _stream(text: str):
+    delay = StubConfig.delay() / StubConfig.stream_chunks
+    size = max(1, len(text) // StubConfig.stream_chunks)
+    for start in range(0, len(text), size):
+        await asyncio.sleep(delay)
+        yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=text[start:start + size]))])
+
+async def stub_acompletion(messages=None, **kwargs):
+    return _stream(respond(messages[-1]["content"]))
+
+def install(latency_ms: float, jitter_ms: float):
+    StubConfig.latency_ms = latency_ms
+    StubConfig.jitter_ms = jitter_ms
+    llm_gateway.LlmChat = StubLlmChat
+    llm_gateway.litellm.acompletion = stub_acompletion
@@ -42,7 +42,13 @@ export function AIAssistant({ interviewId, currentQuestion }) {
       setMessages(prev => [...prev, { role: 'assistant', content: response.data.response }]);
     } catch (error) {
       console.error('AI Assistant error:', error);
-      toast.error('Failed to get assistance');
+      const status = error.response?.status;
+      if (status === 429 || status === 503) {
+        const retryAfter = error.response.headers['retry-after'];
+        toast.error(`The assistant is busy, try again in ${retryAfter || 'a few'} seconds`);
+      } else {
+        toast.error('Failed to get assistance');
+      }
       setMessages(prev => [...prev, { 
         role: 'assistant', 
         content: 'Sorry, I encountered an error. Please try again.' 
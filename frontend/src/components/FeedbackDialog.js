@@ -1,9 +1,12 @@
 import { Dialog, DialogContent, DialogHeader, DialogTitle } from '@/components/ui/dialog';
 import { Button } from '@/components/ui/button';
-import { CheckCircle2, TrendingUp, AlertTriangle, XCircle } from 'lucide-react';
+import { CheckCircle2, TrendingUp, AlertTriangle, XCircle, Clock } from 'lucide-react';
 
 export function FeedbackDialog({ open, onOpenChange, score, feedback, onContinue }) {
+  const pending = score === null || score === undefined;
+
   const getMessage = () => {
+    if (pending) return { text: 'Answer Received', icon: <Clock className="w-12 h-12 text-slate-500" />, color: 'text-slate-600' };
     if (score >= 85) return { text: 'Excellent!', icon: <CheckCircle2 className="w-12 h-12 text-emerald-600" />, color: 'text-emerald-600' };
     if (score >= 70) return { text: 'Great Job!', icon: <TrendingUp className="w-12 h-12 text-blue-600" />, color: 'text-blue-600' };
     if (score >= 50) return { text: 'Good Effort!', icon: <AlertTriangle className="w-12 h-12 text-amber-500" />, color: 'text-amber-500' };
@@ -23,7 +26,9 @@ export function FeedbackDialog({ open, onOpenChange, score, feedback, onContinue
           <div className="text-center">
             <div className="flex justify-center mb-4">{msg.icon}</div>
             <h3 className={`text-3xl font-bold mb-2 ${msg.color}`}>{msg.text}</h3>
-            <div className="text-5xl font-bold text-slate-900 mb-2">{score.toFixed(1)}<span className="text-2xl text-slate-600">/100</span></div>
+            {!pending && (
+              <div className="text-5xl font-bold text-slate-900 mb-2">{score.toFixed(1)}<span className="text-2xl text-slate-600">/100</span></div>
+            )}
           </div>
           
           {feedback && (
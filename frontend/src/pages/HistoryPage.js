@@ -1,4 +1,4 @@
-import { useState, useEffect } from 'react';
+import { useState, useEffect, useRef } from 'react';
 import { useNavigate } from 'react-router-dom';
 import { Card } from '@/components/ui/card';
 import { Button } from '@/components/ui/button';
@@ -15,16 +15,32 @@ export default function HistoryPage() {
   const navigate = useNavigate();
   const [loading, setLoading] = useState(true);
   const [interviews, setInterviews] = useState([]);
+  const [nextCursor, setNextCursor] = useState(null);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [filter, setFilter] = useState('all'); // all, completed, terminated
+  // Totals per tab come from the server: the loaded pages are only part of the history
+  const [counts, setCounts] = useState({ all: 0, completed: 0, terminated: 0 });
+  const activeFilter = useRef(filter);
 
   useEffect(() => {
+    activeFilter.current = filter;
+    setNextCursor(null);
     fetchHistory();
-  }, []);
+  }, [filter]);
 
-  const fetchHistory = async () => {
+  const fetchHistory = async (cursor = null) => {
     try {
-      const response = await axios.get(`${API}/interviews/history`);
-      setInterviews(response.data);
+      const params = filter === 'all' ? {} : { status: filter };
+      const response = await axios.get(`${API}/interviews/history`, {
+        params: cursor ? { ...params, cursor } : params
+      });
+      // A page for a tab that is no longer selected would mix statuses into the list
+      if (activeFilter.current !== filter) return;
+      setInterviews(prev => cursor ? [...prev, ...response.data.interviews] : response.data.interviews);
+      setNextCursor(response.data.next_cursor);
+      if (response.data.counts) {
+        setCounts(response.data.counts);
+      }
     } catch (error) {
       console.error('Error fetching history:', error);
       toast.error('Failed to load interview history');
@@ -33,6 +49,12 @@ export default function HistoryPage() {
     }
   };
 
+  const loadMore = async () => {
+    setLoadingMore(true);
+    await fetchHistory(nextCursor);
+    setLoadingMore(false);
+  };
+
   const getStatusIcon = (status, score) => {
     if (status === 'completed') {
       if (score >= 75) return <CheckCircle2 className="w-5 h-5 text-emerald-600" />;
@@ -60,11 +82,6 @@ export default function HistoryPage() {
     });
   };
 
-  const filteredInterviews = interviews.filter(interview => {
-    if (filter === 'all') return true;
-    return interview.status === filter;
-  });
-
   if (loading) {
     return (
       <div className="min-h-screen bg-slate-50 flex items-center justify-center">
@@ -99,25 +116,25 @@ export default function HistoryPage() {
             variant={filter === 'all' ? 'default' : 'outline'}
             className={filter === 'all' ? 'bg-blue-800' : ''}
           >
-            All ({interviews.length})
+            All ({counts.all})
           </Button>
           <Button 
             onClick={() => setFilter('completed')} 
             variant={filter === 'completed' ? 'default' : 'outline'}
             className={filter === 'completed' ? 'bg-blue-800' : ''}
           >
-            Completed ({interviews.filter(i => i.status === 'completed').length})
+            Completed ({counts.completed})
           </Button>
           <Button 
             onClick={() => setFilter('terminated')} 
             variant={filter === 'terminated' ? 'default' : 'outline'}
             className={filter === 'terminated' ? 'bg-blue-800' : ''}
           >
-            Terminated ({interviews.filter(i => i.status === 'terminated').length})
+            Terminated ({counts.terminated})
           </Button>
         </div>
 
-        {filteredInterviews.length === 0 ? (
+        {interviews.length === 0 ? (
           <Card className="p-12 text-center">
             <History className="w-16 h-16 text-slate-300 mx-auto mb-4" />
             <h3 className="text-xl font-bold text-slate-900 mb-2">No Interviews Found</h3>
@@ -128,7 +145,7 @@ export default function HistoryPage() {
           </Card>
         ) : (
           <div className="space-y-4">
-            {filteredInterviews.map((interview, idx) => (
+            {interviews.map((interview, idx) => (
               <motion.div
                 key={interview.id}
                 initial={{ opacity: 0, y: 20 }}
@@ -177,6 +194,14 @@ export default function HistoryPage() {
                 </Card>
               </motion.div>
             ))}
+            {nextCursor && (
+              <div className="flex justify-center pt-4">
+                <Button onClick={loadMore} variant="outline" disabled={loadingMore}>
+                  {loadingMore && <Loader2 className="mr-2 h-4 w-4 animate-spin" />}
+                  Load More
+                </Button>
+              </div>
+            )}
           </div>
         )}
       </div>
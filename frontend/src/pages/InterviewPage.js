@@ -174,7 +174,9 @@ export default function InterviewPage() {
         {
           answer_text: answerText || 'No answer provided',
           time_taken: timeTaken
-        }
+        },
+        // One submission per question: a retried or double-clicked submit replays the first response
+        { headers: { 'Idempotency-Key': `answer-${currentQuestion.id}` } }
       );
 
       // Clear draft
@@ -182,7 +184,8 @@ export default function InterviewPage() {
 
       // Show feedback dialog
       setFeedbackData({
-        score: response.data.previous_score || 0,
+        // A slow evaluation is scored after the response; the score shows up in the report
+        score: response.data.evaluation_status === 'pending' ? null : (response.data.previous_score || 0),
         feedback: response.data.previous_feedback || ''
       });
       setShowFeedback(true);
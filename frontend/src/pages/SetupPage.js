@@ -42,6 +42,15 @@ export default function SetupPage() {
     }
   };
 
+  const waitForResumeParse = async () => {
+    for (let attempt = 0; attempt < 60; attempt++) {
+      await new Promise((resolve) => setTimeout(resolve, 1500));
+      const { data } = await axios.get(`${API}/interviews/${interviewId}/resume-parse`);
+      if (data.status === 'done' || data.status === 'failed') return data.parsed_data;
+    }
+    return null;
+  };
+
   const handleResumeUpload = async (e) => {
     const file = e.target.files?.[0];
     if (!file) return;
@@ -71,8 +80,14 @@ export default function SetupPage() {
         { headers: { 'Content-Type': 'multipart/form-data' } }
       );
 
+      // A resume that isn't cached is parsed in the background; poll until it finishes
+      let parsedData = response.data.parsed_data;
+      if (response.status === 202) {
+        parsedData = await waitForResumeParse();
+      }
+
       // Validate parsed data
-      const parsedSkills = response.data.parsed_data?.skills || [];
+      const parsedSkills = parsedData?.skills || [];
       if (parsedSkills.length === 0) {
         toast.warning('No skills detected. Please ensure your resume includes your technical skills.');
       }
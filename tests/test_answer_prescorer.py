@@ -0,0 +1,93 @@
+from answer_prescorer import prescore_answer
+
+JD = "Backend engineer with Python, FastAPI and MongoDB; designs REST APIs and runs services on Kubernetes."
+FALLBACK_QUESTION = "Please describe your experience with the technologies mentioned in the job description."
+
+
+def test_echoed_question_is_scored_locally():
+    question = "Explain the difference between a process and a thread."
+    verdict = prescore_answer(question, "The difference between a process and a thread.", JD)
+    assert verdict["reason"] == "echo"
+    assert verdict["score"] == 5.0
+
+
+def test_repetitive_filler_is_scored_locally():
+    verdict = prescore_answer(
+        "How would you design a rate limiter for a public REST API?",
+        "rate limiter rate limiter rate limiter api api api rate limiter api rate limiter",
+        JD,
+    )
+    assert verdict["reason"] == "repetitive"
+
+
+def test_off_topic_answer_to_technical_question_is_scored_locally():
+    verdict = prescore_answer(
+        "How would you design a rate limiter for a public REST API?",
+        "My favourite holiday was a trip to the mountains with my family last winter, we went skiing every day.",
+        JD,
+    )
+    assert verdict["reason"] == "off_topic"
+    assert verdict["score"] == 10.0
+
+
+def test_reasonable_technical_answer_goes_to_llm():
+    assert prescore_answer(
+        "How would you design a rate limiter for a public REST API?",
+        "I would use a token bucket per API key, refilled at a fixed rate, with the bucket state kept in Redis "
+        "so every instance shares it. Requests that find the bucket empty get a 429 with Retry-After.",
+        JD,
+    ) is None
+
+
+def test_fallback_question_answers_are_never_off_topic():
+    answer = ("I have spent the last four years building and running backend services for a logistics "
+              "company, and I led the migration of our order system to a new platform.")
+    assert prescore_answer(FALLBACK_QUESTION, answer, JD, off_topic_check=False) is None
+    # The question is not technical either, so the check is skipped without the flag too
+    assert prescore_answer(FALLBACK_QUESTION, answer, JD) is None
+
+
+def test_fallback_question_echo_is_still_scored_locally():
+    verdict = prescore_answer(FALLBACK_QUESTION, FALLBACK_QUESTION, JD, off_topic_check=False)
+    assert verdict["reason"] == "echo"
+
+
+def test_behavioural_questions_are_not_checked_for_off_topic():
+    assert prescore_answer(
+        "Tell me about a time you had a conflict with a teammate and how you handled it.",
+        "A colleague and I disagreed about a release date, so we sat down, listed what each of us was "
+        "worried about and agreed to ship a smaller first version on time.",
+        JD,
+    ) is None
+    assert prescore_answer(
+        "How do you prioritise when several urgent requests arrive at once?",
+        "I check what is blocking customers first, agree the order with my manager and tell everyone "
+        "waiting when they can expect an answer.",
+        JD,
+    ) is None
+
+
+def test_short_answers_in_the_questions_words_go_to_llm():
+    assert prescore_answer(
+        "Explain what a database index is and why it speeds up queries.",
+        "An index speeds up database queries.",
+        JD,
+    ) is None
+    assert prescore_answer(
+        "What are Python decorators and how do they wrap functions?",
+        "Decorators wrap functions to extend Python functions.",
+        JD,
+    ) is None
+
+
+def test_vague_answers_to_technical_questions_go_to_llm():
+    assert prescore_answer(
+        "How do you choose an index for a MongoDB query that filters on status and sorts by created_at?",
+        "I would ask my team lead what they think is best and follow their advice on this one.",
+        JD,
+    ) is None
+    assert prescore_answer(
+        "Explain eventual consistency and when you would accept it.",
+        "It depends on many factors and there are trade offs involved in every decision we make.",
+        JD,
+    ) is None
@@ -0,0 +1,92 @@
+import asyncio
+import os
+
+import pytest
+
+pytest.importorskip("emergentintegrations")
+mongomock_motor = pytest.importorskip("mongomock_motor")
+
+os.environ.setdefault("MONGO_URL", "mongodb://localhost:27017")
+os.environ.setdefault("DB_NAME", "history_test")
+os.environ.setdefault("EMERGENT_LLM_KEY", "test")
+
+import server
+from fastapi import HTTPException
+
+
+def test_cursor_round_trips():
+    cursor = server.encode_history_cursor({"created_at": "2026-01-02T03:04:05+00:00", "id": "abc"})
+    assert "=" not in cursor
+    assert server.decode_history_cursor(cursor) == ("2026-01-02T03:04:05+00:00", "abc")
+
+
+@pytest.mark.parametrize("cursor", ["not base64!", "bm90IGpzb24", "WzFd"])
+def test_invalid_cursor_is_rejected(cursor):
+    with pytest.raises(HTTPException) as raised:
+        server.decode_history_cursor(cursor)
+    assert raised.value.status_code == 400
+
+
+def test_cursor_query_continues_after_the_last_entry():
+    cursor = server.encode_history_cursor({"created_at": "2026-01-02T00:00:00+00:00", "id": "m"})
+    query = server.build_history_query(cursor, "completed", None, None, None, None)
+    assert query == {"$and": [
+        {"status": "completed"},
+        {"$or": [
+            {"created_at": {"$lt": "2026-01-02T00:00:00+00:00"}},
+            {"created_at": "2026-01-02T00:00:00+00:00", "id": {"$lt": "m"}}
+        ]}
+    ]}
+
+
+def test_no_filters_match_everything():
+    assert server.build_history_query(None, None, None, None, None, None) == {}
+
+
+def test_pages_cover_every_interview_once(monkeypatch):
+    db = mongomock_motor.AsyncMongoMockClient()["history_test"]
+    monkeypatch.setattr(server, "db", db)
+    # Several interviews share a created_at, so the id tie-break decides where a page ends
+    interviews = [
+        {"id": f"interview-{index:02d}", "created_at": f"2026-01-0{1 + index // 4}T00:00:00+00:00", "status": "completed"}
+        for index in range(11)
+    ]
+
+    async def walk():
+        await db.interviews.insert_many([dict(interview) for interview in interviews])
+        seen, cursor = [], None
+        while True:
+            page = await server.get_interview_history(limit=3, cursor=cursor, status=None, min_score=None,
+                                                      max_score=None, created_after=None, created_before=None,
+                                                      include_text=False, stream=False)
+            seen.extend(interview["id"] for interview in page["interviews"])
+            cursor = page["next_cursor"]
+            if cursor is None:
+                return seen
+
+    seen = asyncio.run(walk())
+    expected = sorted(interviews, key=lambda interview: (interview["created_at"], interview["id"]), reverse=True)
+    assert seen == [interview["id"] for interview in expected]
+
+
+def test_first_page_counts_every_tab_not_just_the_page(monkeypatch):
+    db = mongomock_motor.AsyncMongoMockClient()["history_test"]
+    monkeypatch.setattr(server, "db", db)
+    statuses = ["completed"] * 25 + ["terminated"] * 4 + ["in_progress"] * 2
+
+    async def pages():
+        await db.interviews.insert_many([
+            {"id": f"interview-{index:02d}", "created_at": f"2026-01-01T00:00:{index:02d}+00:00", "status": status}
+            for index, status in enumerate(statuses)
+        ])
+        filters = dict(min_score=None, max_score=None, created_after=None, created_before=None,
+                       include_text=False, stream=False)
+        first = await server.get_interview_history(limit=20, cursor=None, status="completed", **filters)
+        second = await server.get_interview_history(limit=20, cursor=first["next_cursor"], status="completed", **filters)
+        return first, second
+
+    first, second = asyncio.run(pages())
+    assert first["counts"] == {"all": 31, "completed": 25, "terminated": 4}
+    assert "counts" not in second
+    assert {interview["status"] for interview in first["interviews"] + second["interviews"]} == {"completed"}
+    assert len(first["interviews"]) + len(second["interviews"]) == 25
@@ -0,0 +1,106 @@
+import asyncio
+import os
+
+import pytest
+
+pytest.importorskip("emergentintegrations")
+mongomock_motor = pytest.importorskip("mongomock_motor")
+
+os.environ.setdefault("MONGO_URL", "mongodb://localhost:27017")
+os.environ.setdefault("DB_NAME", "idempotency_test")
+os.environ.setdefault("EMERGENT_LLM_KEY", "test")
+
+import server
+from fastapi import HTTPException
+
+
+@pytest.fixture
+def requests(monkeypatch):
+    db = mongomock_motor.AsyncMongoMockClient()["idempotency_test"]
+    asyncio.run(db.idempotency_keys.create_index("key", unique=True))
+    monkeypatch.setattr(server, "db", db)
+    return server.IdempotentRequests("test_route")
+
+
+def counting_handler(calls, delay=0.0):
+    async def handler():
+        calls.append(1)
+        await asyncio.sleep(delay)
+        return {"question": {"id": f"q{len(calls)}"}}
+    return handler
+
+
+def test_completed_request_is_replayed(requests):
+    calls = []
+
+    async def scenario():
+        first = await requests.run("k", "hash", counting_handler(calls))
+        second = await requests.run("k", "hash", counting_handler(calls))
+        return first, second
+
+    first, second = asyncio.run(scenario())
+    assert len(calls) == 1
+    assert second == first
+
+
+def test_reused_key_with_different_payload_is_rejected(requests):
+    calls = []
+
+    async def scenario():
+        await requests.run("k", "hash", counting_handler(calls))
+        await requests.run("k", "other-hash", counting_handler(calls))
+
+    with pytest.raises(HTTPException) as raised:
+        asyncio.run(scenario())
+    assert raised.value.status_code == 422
+    assert len(calls) == 1
+
+
+def test_concurrent_duplicates_share_one_execution(requests):
+    calls = []
+
+    async def scenario():
+        return await asyncio.gather(*[requests.run("k", "hash", counting_handler(calls, 0.05)) for _ in range(5)])
+
+    results = asyncio.run(scenario())
+    assert len(calls) == 1
+    assert all(result == results[0] for result in results)
+
+
+def test_concurrent_duplicate_with_different_payload_is_rejected(requests):
+    calls = []
+
+    async def scenario():
+        first = asyncio.ensure_future(requests.run("k", "hash", counting_handler(calls, 0.05)))
+        await asyncio.sleep(0)
+        with pytest.raises(HTTPException) as raised:
+            await requests.run("k", "other-hash", counting_handler(calls))
+        await first
+        return raised.value.status_code
+
+    assert asyncio.run(scenario()) == 422
+    assert len(calls) == 1
+
+
+def test_failed_request_can_be_retried(requests):
+    calls = []
+
+    async def failing():
+        calls.append(1)
+        raise HTTPException(status_code=500, detail="boom")
+
+    async def scenario():
+        with pytest.raises(HTTPException):
+            await requests.run("k", "hash", failing)
+        return await requests.run("k", "hash", counting_handler(calls))
+
+    result = asyncio.run(scenario())
+    assert len(calls) == 2
+    assert result == {"question": {"id": "q2"}}
+
+
+def test_answer_retry_with_recomputed_time_taken_keeps_its_hash():
+    first = server.AnswerSubmission(answer_text="Use a compound index.", time_taken=40)
+    retry = server.AnswerSubmission(answer_text="Use a compound index.", time_taken=47)
+    assert server.answer_idempotency("i", "q", first, "answer-q") == server.answer_idempotency("i", "q", retry, "answer-q")
+    assert server.answer_idempotency("i", "q", first, None) == server.answer_idempotency("i", "q", retry, None)
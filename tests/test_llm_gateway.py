@@ -0,0 +1,79 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("emergentintegrations")
+
+import llm_gateway
+
+MODEL = ("openai", "test-model")
+
+
+def chunk(text):
+    return SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=text))])
+
+
+@pytest.fixture
+def gateway(monkeypatch):
+    monkeypatch.setenv("EMERGENT_LLM_KEY", "test")
+    monkeypatch.setitem(llm_gateway.CALL_SITE_TIMEOUTS, "question", 0.2)
+    return llm_gateway.LlmGateway(max_concurrency=2)
+
+
+async def drain(gateway):
+    return [text async for text in gateway.stream("question", "s", "system", "prompt", model=MODEL)]
+
+
+def test_cancelled_stream_open_gives_its_slot_back(gateway, monkeypatch):
+    async def never_opens(**kwargs):
+        await asyncio.sleep(10)
+
+    monkeypatch.setattr(llm_gateway.litellm, "acompletion", never_opens)
+
+    async def scenario():
+        task = asyncio.ensure_future(drain(gateway))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(scenario())
+    assert gateway._in_flight[MODEL] == 0
+    assert gateway._semaphore(MODEL)._value == 2
+
+
+def test_stalled_stream_times_out_and_gives_its_slot_back(gateway, monkeypatch):
+    async def stalls():
+        yield chunk("How would ")
+        await asyncio.sleep(10)
+        yield chunk("you shard it?")
+
+    async def opens(**kwargs):
+        return stalls()
+
+    monkeypatch.setattr(llm_gateway.litellm, "acompletion", opens)
+    received = []
+
+    async def scenario():
+        async for text in gateway.stream("question", "s", "system", "prompt", model=MODEL):
+            received.append(text)
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(asyncio.wait_for(scenario(), 5))
+    assert received == ["How would "]
+    assert gateway._in_flight[MODEL] == 0
+    assert gateway.stats()["call_sites"]["question"]["timeouts"] == 1
+
+
+def test_completed_stream_yields_every_chunk(gateway, monkeypatch):
+    async def chunks():
+        for text in ("Explain ", "sharding."):
+            yield chunk(text)
+
+    async def opens(**kwargs):
+        return chunks()
+
+    monkeypatch.setattr(llm_gateway.litellm, "acompletion", opens)
+    assert asyncio.run(drain(gateway)) == ["Explain ", "sharding."]
+    assert gateway._in_flight[MODEL] == 0
@@ -0,0 +1,59 @@
+import asyncio
+import os
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("emergentintegrations")
+mongomock_motor = pytest.importorskip("mongomock_motor")
+
+os.environ.setdefault("MONGO_URL", "mongodb://localhost:27017")
+os.environ.setdefault("DB_NAME", "question_bank_test")
+os.environ.setdefault("EMERGENT_LLM_KEY", "test")
+
+import llm_gateway
+import server
+
+RESUME = {"skills": ["Python", "MongoDB"]}
+JD = "Backend engineer with Python and MongoDB"
+
+
+@pytest.fixture
+def db(monkeypatch):
+    db = mongomock_motor.AsyncMongoMockClient()["question_bank_test"]
+    monkeypatch.setattr(server, "db", db)
+    monkeypatch.setattr(server, "llm_gateway", llm_gateway.LlmGateway())
+    return db
+
+
+def provider_stream(monkeypatch, texts, error=None):
+    async def chunks():
+        for text in texts:
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=text))])
+        if error:
+            raise error
+
+    async def opens(**kwargs):
+        return chunks()
+
+    monkeypatch.setattr(llm_gateway.litellm, "acompletion", opens)
+
+
+async def stream(interview_id="interview"):
+    return [event async for event in server.stream_question(interview_id, 1, "easy", RESUME, JD)]
+
+
+def test_completed_stream_is_banked(db, monkeypatch):
+    provider_stream(monkeypatch, ["TIME_ALLOCATED: 120\n", "How would you index ", "a MongoDB collection?"])
+    events = asyncio.run(stream())
+    assert events[-1][1]["question"] == "How would you index a MongoDB collection?"
+    assert asyncio.run(db.question_bank.count_documents({})) == 1
+
+
+def test_stream_cut_off_partway_is_not_served_or_banked(db, monkeypatch):
+    provider_stream(monkeypatch, ["TIME_ALLOCATED: 120\n", "How would you ind"], RuntimeError("connection reset"))
+    events = asyncio.run(stream())
+    assert ("reset", None) in events
+    assert events[-1][1]["question"] == server.FALLBACK_QUESTION["question"]
+    assert asyncio.run(db.question_bank.count_documents({})) == 0
+
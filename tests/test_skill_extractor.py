@@ -0,0 +1,44 @@
+from skill_extractor import SkillExtractor, skill_extractor
+
+
+def test_aliases_resolve_to_canonical_names():
+    assert skill_extractor.extract("Deployed on k8s with a Dockerfile, data in postgres") == [
+        "Kubernetes", "Docker", "PostgreSQL"
+    ]
+
+
+def test_matches_sit_on_word_boundaries():
+    assert skill_extractor.extract("javascript") == ["JavaScript"]
+    assert skill_extractor.extract("Wrote C++ and C# services") == ["C++", "C#"]
+    assert skill_extractor.extract("spythonic mongoose") == []
+
+
+def test_overlapping_matches_resolve_leftmost_longest():
+    assert skill_extractor.extract("Shipped apps in React Native and React") == ["React Native", "React"]
+
+
+def test_skills_are_listed_once_in_order_of_first_mention():
+    assert skill_extractor.extract("Python, Redis, python3 and Redis again") == ["Python", "Redis"]
+
+
+def test_ambiguous_names_only_match_through_their_other_aliases():
+    text = "An agile team lead who wore a ruby ring and worked at Spark Capital; Rust belt native"
+    assert skill_extractor.extract(text) == []
+    assert skill_extractor.extract("ETL jobs in PySpark, dashboards in AngularJS") == ["Spark", "Angular"]
+    assert skill_extractor.canonical("ruby") == "Ruby"
+
+
+def test_failure_links_find_aliases_inside_partial_matches():
+    extractor = SkillExtractor({"Ab": [], "Bcd": []})
+    assert extractor.extract("abcd bcd") == ["Bcd"]
+    assert extractor.extract("x abc ab") == ["Ab"]
+
+
+def test_cross_check_confirms_adds_and_keeps_unmentioned_skills():
+    check = skill_extractor.cross_check(
+        ["python", "Kubernetes", "Leadership", "Python", ""], "Built FastAPI services in Python"
+    )
+    assert check["confirmed"] == ["Python"]
+    assert check["unverified"] == ["Kubernetes", "Leadership"]
+    assert check["added"] == ["FastAPI"]
+    assert check["skills"] == ["Python", "Kubernetes", "Leadership", "FastAPI"]
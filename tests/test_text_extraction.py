@@ -0,0 +1,57 @@
+import asyncio
+import time
+
+import pytest
+
+pytest.importorskip("PyPDF2")
+pytest.importorskip("docx")
+
+from text_extraction import ExtractionService
+
+
+async def run(service, seconds):
+    # time.sleep stands in for a CPU-bound extractor; like extract(), take a slot first
+    await service._slots.acquire()
+    return await service._run(time.sleep, seconds)
+
+
+def test_cancelled_extraction_leaves_other_jobs_running():
+    service = ExtractionService(workers=2, timeout=5)
+
+    async def scenario():
+        cancelled = asyncio.ensure_future(run(service, 1.0))
+        other = asyncio.ensure_future(run(service, 1.0))
+        await asyncio.sleep(0.5)
+        cancelled.cancel()
+        await asyncio.sleep(0)
+        # The cancelled job is still running and keeps its slot
+        assert service._slots._value == 0
+        await other
+        await asyncio.sleep(0.2)
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        service.shutdown()
+    assert service.stats["completed"] == 1
+    assert service.stats["cancelled"] == 1
+    assert service.stats["pool_restarts"] == 0
+    assert service._slots._value == 2
+
+
+def test_cancelled_runaway_extraction_is_stopped_at_its_timeout():
+    service = ExtractionService(workers=1, timeout=1.0)
+
+    async def scenario():
+        job = asyncio.ensure_future(run(service, 30))
+        await asyncio.sleep(0.5)
+        job.cancel()
+        await asyncio.sleep(1.0)
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        service.shutdown()
+    assert service.stats["timeouts"] == 1
+    assert service.stats["pool_restarts"] == 1
+    assert service._slots._value == 1